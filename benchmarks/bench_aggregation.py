@@ -0,0 +1,95 @@
+"""
+Count 1M raw postcodes by area, district and sector with a `PostcodeAggregator` in one pass, against a pass
+per level reading the `UKPostcode` properties, and against a pandas groupby of the validated postcodes
+when pandas is installed.
+
+Run from the repository root: python -m benchmarks.bench_aggregation
+"""
+import itertools
+import random
+import timeit
+from collections import Counter
+
+from postcode_validator_uk.aggregation import PostcodeAggregator
+from postcode_validator_uk.constants import UK_POSTCODE_RULES_LIST
+from postcode_validator_uk.engine import compile_rules
+from postcode_validator_uk.tables import all_inwards, all_outwards
+from postcode_validator_uk.validators import UKPostcode
+
+from .corpora import CORPORA
+
+SEED = 2023
+COUNT = 1_000_000
+INVALID_RATIO = 0.1
+LEVELS = {
+    "area": lambda postcode: postcode.area,
+    "district": lambda postcode: postcode.outward,
+    "sector": lambda postcode: f"{postcode.outward} {postcode.sector}",
+}
+
+
+def raw_postcodes():
+    engine = compile_rules(UK_POSTCODE_RULES_LIST)
+    outwards = [outward for outward in all_outwards() if engine.match(outward, "1AA")]
+    inwards = [inward for inward in all_inwards() if engine.match("EC1A", inward)]
+    invalid = itertools.cycle(CORPORA["near-miss"] + CORPORA["garbage"])
+    randomizer = random.Random(SEED)
+    return [
+        next(invalid)
+        if randomizer.random() < INVALID_RATIO
+        else f"{randomizer.choice(outwards)} {randomizer.choice(inwards)}"
+        for _ in range(COUNT)
+    ]
+
+
+def aggregate(postcodes):
+    aggregator = PostcodeAggregator()
+    aggregator.update(postcodes)
+    return aggregator.areas(), aggregator.districts(), aggregator.sectors()
+
+
+def pass_per_level(postcodes):
+    counts = []
+    for key in LEVELS.values():
+        level_counts = Counter()
+        for raw_postcode in postcodes:
+            postcode = UKPostcode(raw_postcode)
+            if postcode.is_valid():
+                level_counts[key(postcode)] += 1
+        counts.append(dict(level_counts))
+
+    return tuple(counts)
+
+
+def pandas_groupby(pd, postcodes):
+    validated = pd.Series([validated for validated, _ in UKPostcode.validate_many(postcodes)]).dropna()
+    parts = validated.str.extract(r"^(?P<area>[A-Z]+)(?P<district_rest>\S+) (?P<sector_digit>\d)")
+    frame = pd.DataFrame(
+        {
+            "area": parts["area"],
+            "district": parts["area"] + parts["district_rest"],
+            "sector": parts["area"] + parts["district_rest"] + " " + parts["sector_digit"],
+        }
+    )
+    return tuple(frame.groupby(level).size().to_dict() for level in LEVELS)
+
+
+def main():
+    postcodes = raw_postcodes()
+    funcs = [("PostcodeAggregator", aggregate), ("pass per level", pass_per_level)]
+    try:
+        import pandas as pd
+    except ImportError:
+        print("pandas isn't installed, skipping the groupby")
+    else:
+        funcs.append(("pandas groupby", lambda postcodes: pandas_groupby(pd, postcodes)))
+
+    expected = aggregate(postcodes)
+    for name, func in funcs:
+        assert func(postcodes) == expected, name
+        seconds = min(timeit.repeat(lambda: func(postcodes), number=1, repeat=3))
+        print(f"{name:<20} {COUNT / seconds:>12,.0f} postcodes/s")
+
+
+if __name__ == "__main__":
+    main()
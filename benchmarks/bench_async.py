@@ -0,0 +1,84 @@
+"""
+Measure p50/p99 latency of concurrent `validate_async` calls against inline `UKPostcode.validate()` calls,
+with many request handlers running on one event loop, alone and next to a handler validating a bulk payload
+inline or through `validate_many_async`.
+
+Run from the repository root: python -m benchmarks.bench_async
+"""
+import asyncio
+import itertools
+import statistics
+import time
+
+from postcode_validator_uk.aio import validate_async, validate_many_async
+from postcode_validator_uk.exceptions import InvalidPostcode
+from postcode_validator_uk.validators import UKPostcode
+
+BULK_PAYLOAD = 200_000
+SAMPLE = ("EC1A 1BB", "w1a 0ax", "M1 1AE", "B33 8TH", "CR2 6XH", "DN551PT", "QA1 1AA", "AB1 1AA", "B338-TH5")
+CONCURRENCY = 1000
+REQUESTS_PER_HANDLER = 50
+
+
+async def validate_inline(postcode):
+    postcode = UKPostcode(postcode)
+    try:
+        postcode.validate()
+    except InvalidPostcode:
+        return None
+
+    return postcode.validated_postcode
+
+
+async def handler(validate, postcodes, latencies):
+    # each request yields to the loop once, as a handler awaiting its I/O would
+    for postcode in postcodes:
+        started_at = time.perf_counter()
+        await asyncio.sleep(0)
+        await validate(postcode)
+        latencies.append(time.perf_counter() - started_at)
+
+
+async def validate_many_inline(postcodes):
+    return list(UKPostcode.validate_many(postcodes))
+
+
+async def bulk_handler(validate_many):
+    await asyncio.sleep(0.01)
+    await validate_many(list(itertools.islice(itertools.cycle(SAMPLE), BULK_PAYLOAD)))
+
+
+async def run(validate, validate_many=None):
+    latencies = []
+    samples = itertools.cycle(SAMPLE)
+    handlers = [
+        handler(validate, list(itertools.islice(samples, REQUESTS_PER_HANDLER)), latencies)
+        for _ in range(CONCURRENCY)
+    ]
+    if validate_many is not None:
+        handlers.append(bulk_handler(validate_many))
+    started_at = time.perf_counter()
+    await asyncio.gather(*handlers)
+    elapsed = time.perf_counter() - started_at
+
+    return latencies, elapsed
+
+
+def main():
+    scenarios = (
+        ("inline", validate_inline, None),
+        ("async", validate_async, None),
+        ("inline + bulk", validate_inline, validate_many_inline),
+        ("async + bulk", validate_async, validate_many_async),
+    )
+    for name, validate, validate_many in scenarios:
+        latencies, elapsed = asyncio.run(run(validate, validate_many))
+        quantiles = statistics.quantiles(latencies, n=100)
+        print(
+            f"{name:<14} p50 {quantiles[49] * 1e3:>7.2f}ms  p99 {quantiles[98] * 1e3:>7.2f}ms  "
+            f"{len(latencies) / elapsed:>10,.0f} calls/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Measure `buffers.validate_file` over a memory-mapped fixed-width file against reading it as text, slicing
+and stripping the postcode column of each line and validating it with `UKPostcode.validate_many`.
+
+Run from the repository root: python -m benchmarks.bench_buffers
+"""
+import itertools
+import os
+import tempfile
+import timeit
+
+from postcode_validator_uk.buffers import validate_file
+from postcode_validator_uk.validators import UKPostcode
+
+from .corpora import CORPORA
+
+ROWS = 1_000_000
+OFFSET, WIDTH = 8, 10
+RECORD_SIZE = 31
+
+
+def write_records(path):
+    postcodes = itertools.islice(itertools.cycle(CORPORA["mixed"]), ROWS)
+    with open(path, "w", encoding="ascii", errors="replace", newline="\n") as records_file:
+        for index, postcode in enumerate(postcodes):
+            records_file.write(f"{index:07d} {postcode.strip()[:WIDTH]:<{WIDTH}} {'record':<11}\n")
+
+
+def read_and_validate(path):
+    with open(path, encoding="ascii", errors="replace") as records_file:
+        column = (line[OFFSET : OFFSET + WIDTH].strip(" ") for line in records_file)
+        return list(UKPostcode.validate_many(column))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "records.txt")
+        write_records(path)
+        assert os.path.getsize(path) == ROWS * RECORD_SIZE
+        assert list(validate_file(path, OFFSET, WIDTH, RECORD_SIZE)) == read_and_validate(path)
+
+        funcs = (
+            ("read_and_validate", lambda: read_and_validate(path)),
+            ("validate_file", lambda: list(validate_file(path, OFFSET, WIDTH, RECORD_SIZE))),
+        )
+        for name, func in funcs:
+            seconds = min(timeit.repeat(func, number=1, repeat=3))
+            print(f"{name:<20} {ROWS / seconds:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
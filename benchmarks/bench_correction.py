@@ -0,0 +1,53 @@
+"""
+Measure the throughput of `correction.correct` over postcodes with typos (character confusions and
+transpositions) made to the valid corpus, and over the near-miss and garbage corpora, reporting how many
+typos get their original postcode as best correction.
+
+Run from the repository root: python -m benchmarks.bench_correction
+"""
+import itertools
+import random
+import timeit
+
+from postcode_validator_uk.correction import AS_DIGIT, AS_LETTER, correct
+
+from .corpora import CORPORA
+
+SEED = 2023
+CONFUSIONS = {**AS_DIGIT, **{digit: letters[0] for digit, letters in AS_LETTER.items()}}
+
+
+def typo(postcode, randomizer):
+    """The postcode with a character confused or 2 adjacent characters transposed, when possible."""
+    positions = [index for index, char in enumerate(postcode) if char in CONFUSIONS]
+    if positions and randomizer.random() < 0.7:
+        index = randomizer.choice(positions)
+        return f"{postcode[:index]}{CONFUSIONS[postcode[index]]}{postcode[index + 1 :]}"
+
+    compact = postcode.replace(" ", "")
+    index = randomizer.randrange(len(compact) - 1)
+    transposed = f"{compact[:index]}{compact[index + 1]}{compact[index]}{compact[index + 2 :]}"
+    return f"{transposed[:-3]} {transposed[-3:]}"
+
+
+def main():
+    randomizer = random.Random(SEED)
+    valid = list(itertools.islice(itertools.cycle(CORPORA["valid"]), 1000))
+    typos = [typo(postcode, randomizer) for postcode in valid]
+    corpora = {"typos": typos, "near-miss": CORPORA["near-miss"], "garbage": CORPORA["garbage"]}
+
+    for name, postcodes in corpora.items():
+        seconds = min(
+            timeit.repeat(lambda: [correct(postcode) for postcode in postcodes], number=1, repeat=5)
+        )
+        print(f"{name:<16} {len(postcodes) / seconds:>12,.0f} postcodes/s")
+
+    corrections = [[postcode for postcode, _ in corrections] for corrections in map(correct, typos)]
+    best = sum(postcodes[:1] == [original] for postcodes, original in zip(corrections, valid))
+    suggested = sum(original in postcodes for postcodes, original in zip(corrections, valid))
+    print(f"typos with their original postcode as best correction: {best / len(typos):.1%}")
+    print(f"typos with their original postcode among the corrections: {suggested / len(typos):.1%}")
+
+
+if __name__ == "__main__":
+    main()
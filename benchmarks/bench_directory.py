@@ -0,0 +1,99 @@
+"""
+Compare opening a `PostcodeDirectory` of 1.8M postcodes against loading them in a Python set of strings,
+as each worker process of a pool would: load time and private (anonymous) and file-backed resident memory,
+measured in fresh interpreters, then lookups per second.
+
+Run from the repository root: python -m benchmarks.bench_directory (Linux, reads /proc/self/status)
+"""
+import itertools
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from postcode_validator_uk.constants import UK_POSTCODE_RULES_LIST
+from postcode_validator_uk.directory import PostcodeDirectory
+from postcode_validator_uk.engine import compile_rules
+from postcode_validator_uk.tables import all_inwards, all_outwards
+
+SEED = 2023
+OUTWARDS = 450
+LOOKUPS = 200_000
+LOADERS = {
+    "set of strings": "postcodes = set(line.rstrip('\\n') for line in open(TEXT_PATH))",
+    "PostcodeDirectory": "postcodes = PostcodeDirectory(DIRECTORY_PATH)",
+}
+SCRIPT = """
+import random, sys, time
+from postcode_validator_uk.directory import PostcodeDirectory
+
+def memory():
+    with open("/proc/self/status") as status:
+        fields = dict(line.split(":", 1) for line in status)
+    return int(fields["RssAnon"].split()[0]), int(fields["RssFile"].split()[0])
+
+TEXT_PATH, DIRECTORY_PATH, QUERIES_PATH = sys.argv[1:4]
+queries = open(QUERIES_PATH).read().split("\\n")
+anon_before, file_before = memory()
+start = time.perf_counter()
+{loader}
+load_seconds = time.perf_counter() - start
+anon_after, file_after = memory()
+start = time.perf_counter()
+found = sum(query in postcodes for query in queries)
+lookup_seconds = time.perf_counter() - start
+_, file_touched = memory()
+print(load_seconds, anon_after - anon_before, file_touched - file_before, len(queries) / lookup_seconds, found)
+"""
+
+
+def postcodes():
+    engine = compile_rules(UK_POSTCODE_RULES_LIST)
+    outwards = [outward for outward in all_outwards() if engine.match(outward, "1AA")]
+    outwards = random.Random(SEED).sample(outwards, OUTWARDS)
+    inwards = [inward for inward in all_inwards() if engine.match("EC1A", inward)]
+    return [f"{outward} {inward}" for outward, inward in itertools.product(outwards, inwards)]
+
+
+def main():
+    raw_postcodes = postcodes()
+    randomizer = random.Random(SEED)
+    # half of the queries are missing, with a unit the rules reject
+    queries = [
+        postcode if randomizer.random() < 0.5 else f"{postcode[:-2]}CC"
+        for postcode in randomizer.sample(raw_postcodes, LOOKUPS)
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        text_path, directory_path, queries_path = (
+            os.path.join(directory, name) for name in ("postcodes.txt", "postcodes.dir", "queries.txt")
+        )
+        with open(text_path, "w") as text_file:
+            text_file.write("\n".join(raw_postcodes))
+        with open(queries_path, "w") as queries_file:
+            queries_file.write("\n".join(queries))
+
+        start = time.perf_counter()
+        count = PostcodeDirectory.build(raw_postcodes, directory_path)
+        print(f"{count:,} postcodes, directory built in {time.perf_counter() - start:.2f}s")
+        print(f"text file {os.path.getsize(text_path) / 2 ** 20:.1f} MiB, ", end="")
+        print(f"directory file {os.path.getsize(directory_path) / 2 ** 20:.1f} MiB")
+
+        for name, loader in LOADERS.items():
+            process = subprocess.run(
+                [sys.executable, "-c", SCRIPT.format(loader=loader), text_path, directory_path, queries_path],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            load_seconds, anon_kib, file_kib, lookups, found = process.stdout.split()
+            print(
+                f"{name:<18} loaded in {float(load_seconds) * 1000:>8,.1f} ms, "
+                f"private {int(anon_kib) / 1024:>6,.1f} MiB, file-backed {int(file_kib) / 1024:>5,.1f} MiB, "
+                f"{float(lookups):>10,.0f} lookups/s ({found} found)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Compare 1M postcodes stored as strings against their `encoding` keys: memory held, sorting them, and
+sorting a NumPy ``uint32`` view of the keys against a NumPy array of the strings when numpy is installed.
+
+Run from the repository root: python -m benchmarks.bench_encoding
+"""
+import random
+import sys
+import timeit
+
+from postcode_validator_uk.constants import UK_POSTCODE_RULES_LIST
+from postcode_validator_uk.encoding import encode_many
+from postcode_validator_uk.engine import compile_rules
+from postcode_validator_uk.tables import all_inwards, all_outwards
+
+SEED = 2023
+COUNT = 1_000_000
+
+
+def postcodes():
+    engine = compile_rules(UK_POSTCODE_RULES_LIST)
+    outwards = [outward for outward in all_outwards() if engine.match(outward, "1AA")]
+    inwards = [inward for inward in all_inwards() if engine.match("EC1A", inward)]
+    randomizer = random.Random(SEED)
+    return [f"{randomizer.choice(outwards)} {randomizer.choice(inwards)}" for _ in range(COUNT)]
+
+
+def report(name, func):
+    seconds = min(timeit.repeat(func, number=1, repeat=3))
+    print(f"{name:<24} {seconds * 1000:>10,.1f} ms")
+
+
+def main():
+    strings = postcodes()
+    report("encode_many", lambda: encode_many(strings))
+    keys = encode_many(strings)
+
+    strings_size = sys.getsizeof(strings) + sum(map(sys.getsizeof, strings))
+    print(f"{'list of strings':<24} {strings_size / 2 ** 20:>10,.1f} MiB")
+    print(f"{'array of keys':<24} {sys.getsizeof(keys) / 2 ** 20:>10,.1f} MiB")
+
+    key_list = keys.tolist()
+    report("sorted strings", lambda: sorted(strings))
+    report("sorted keys", lambda: sorted(key_list))
+
+    try:
+        import numpy as np
+    except ImportError:
+        print("numpy isn't installed, skipping the NumPy sorts")
+        return
+
+    string_array, key_array = np.array(strings), np.frombuffer(keys, dtype=np.uint32)
+    report("numpy sort strings", lambda: np.sort(string_array))
+    report("numpy sort keys", lambda: np.sort(key_array))
+
+
+if __name__ == "__main__":
+    main()
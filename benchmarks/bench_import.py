@@ -0,0 +1,73 @@
+"""
+Measure the cold start of the validator in fresh interpreters: the import time of
+`postcode_validator_uk.validators` reported by ``python -X importtime`` and the time of the first
+validation, reporting the medians. It fails when the import exceeds the budget or eagerly imports one of
+the modules deferred to the first validation.
+
+Run from the repository root: python -m benchmarks.bench_import [--runs N] [--budget-ms MS]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULE = "postcode_validator_uk.validators"
+PACKAGE = "postcode_validator_uk"
+DEFERRED_MODULES = ("re", "string", "hashlib")
+BUDGET_MS = 20.0
+SCRIPT = f"""
+import sys, time
+import {MODULE}
+print(",".join(name for name in {DEFERRED_MODULES!r} if name in sys.modules))
+start = time.perf_counter()
+{MODULE}.UKPostcode("EC1A 1BB").validate()
+print(time.perf_counter() - start)
+"""
+
+
+def run_once():
+    # -S keeps the site-packages .pth hooks out of the measure
+    process = subprocess.run(
+        [sys.executable, "-S", "-X", "importtime", "-c", SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "cumulative" in line:
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        import_times[name.strip()] = int(self_us), int(cumulative_us)
+
+    eager_modules, first_validation = process.stdout.splitlines()
+    package_us = sum(self_us for name, (self_us, _) in import_times.items() if name.startswith(PACKAGE))
+    return import_times[MODULE][1] / 1000, package_us / 1000, float(first_validation) * 1000, eager_modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=21, help="fresh interpreters, the median is reported")
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS, help="import time budget")
+    args = parser.parse_args(argv)
+
+    runs = [run_once() for _ in range(args.runs)]
+    import_ms = statistics.median(run[0] for run in runs)
+    package_ms = statistics.median(run[1] for run in runs)
+    first_validation_ms = statistics.median(run[2] for run in runs)
+    eager_modules = {name for run in runs for name in run[3].split(",") if name}
+
+    print(f"import {MODULE:<36} {import_ms:>8.2f} ms (budget {args.budget_ms:.2f} ms)")
+    print(f"  of which {PACKAGE} modules {package_ms:>18.2f} ms")
+    print(f"first validation {first_validation_ms:>36.2f} ms")
+    if eager_modules:
+        sys.exit(f"{MODULE} eagerly imports {', '.join(sorted(eager_modules))}")
+    if import_ms > args.budget_ms:
+        sys.exit(f"{MODULE} import takes {import_ms:.2f} ms, over the {args.budget_ms:.2f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
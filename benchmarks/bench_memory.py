@@ -0,0 +1,53 @@
+"""
+Compare the memory held by 1M validated `UKPostcode` instances against 1M `ValidatedPostcode` values.
+
+Run from the repository root: python -m benchmarks.bench_memory
+"""
+import itertools
+import string
+import tracemalloc
+
+from postcode_validator_uk.validators import UKPostcode
+
+COUNT = 1_000_000
+
+
+def raw_postcodes():
+    outwards = itertools.cycle(("EC1A", "W1A", "M1", "B33", "CR2", "DN55", "SW1W", "PO16", "GU16", "L1"))
+    units = itertools.product(string.digits, "ABDEFGHJLNPQRSTUWXYZ", "ABDEFGHJLNPQRSTUWXYZ")
+    for outward, unit in zip(outwards, itertools.islice(itertools.cycle(units), COUNT)):
+        yield f"{outward} {''.join(unit)}"
+
+
+def build_instances():
+    postcodes = []
+    for raw_postcode in raw_postcodes():
+        postcode = UKPostcode(raw_postcode)
+        postcode.validate()
+        postcodes.append(postcode)
+
+    return postcodes
+
+
+def build_values():
+    return [UKPostcode.parse(raw_postcode) for raw_postcode in raw_postcodes()]
+
+
+def measure(func):
+    tracemalloc.start()
+    postcodes = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del postcodes
+
+    return size
+
+
+def main():
+    for func in (build_instances, build_values):
+        size = measure(func)
+        print(f"{func.__name__:<16} {size / 2 ** 20:>8,.1f} MiB {size / COUNT:>8,.1f} bytes/postcode")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Compare `validate_many_parallel` with 1 to N workers against the sequential `UKPostcode.validate_many`.
+
+Run from the repository root: python -m benchmarks.bench_parallel [max_workers]
+"""
+import itertools
+import os
+import sys
+import time
+
+from postcode_validator_uk.parallel import validate_many_parallel
+from postcode_validator_uk.validators import UKPostcode
+
+SAMPLE = ("EC1A 1BB", "w1a 0ax", "M1 1AE", "B33 8TH", "CR2 6XH", "DN551PT", "QA1 1AA", "AB1 1AA", "B338-TH5")
+ROWS = 2_000_000
+CHUNK_SIZE = 20_000
+
+
+def measure(func, postcodes):
+    started_at = time.perf_counter()
+    for _ in func(postcodes):
+        pass
+
+    return ROWS / (time.perf_counter() - started_at)
+
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    postcodes = list(itertools.islice(itertools.cycle(SAMPLE), ROWS))
+
+    sequential = measure(UKPostcode.validate_many, postcodes)
+    print(f"{'sequential':<12} {sequential:>12,.0f} rows/s")
+
+    workers = 1
+    while workers <= max_workers:
+        rows_per_second = measure(
+            lambda postcodes: validate_many_parallel(postcodes, workers=workers, chunk_size=CHUNK_SIZE),
+            postcodes,
+        )
+        print(f"{workers:>2} workers   {rows_per_second:>12,.0f} rows/s  x{rows_per_second / sequential:.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
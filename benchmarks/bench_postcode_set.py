@@ -0,0 +1,101 @@
+"""
+Compare a `PostcodeSet` of 1M valid postcodes against a Python set of their strings, plus a set of their
+sector strings for membership at the sector level: memory held, build time and lookups per second.
+
+Run from the repository root: python -m benchmarks.bench_postcode_set
+"""
+import itertools
+import random
+import time
+import tracemalloc
+
+from postcode_validator_uk.constants import UK_POSTCODE_RULES_LIST
+from postcode_validator_uk.engine import compile_rules
+from postcode_validator_uk.sets import PostcodeSet
+from postcode_validator_uk.tables import all_inwards, all_outwards
+from postcode_validator_uk.validators import ValidatedPostcode
+
+SEED = 2023
+OUTWARDS = 250
+LOOKUPS = 200_000
+
+
+def outwards_and_inwards():
+    engine = compile_rules(UK_POSTCODE_RULES_LIST)
+    outwards = [outward for outward in all_outwards() if engine.match(outward, "1AA")]
+    outwards = random.Random(SEED).sample(outwards, OUTWARDS)
+    inwards = [inward for inward in all_inwards() if engine.match("EC1A", inward)]
+    return list(itertools.product(outwards, inwards))
+
+
+def build_postcode_set(pairs):
+    # adding values skips parsing, like loading from a trusted source would
+    postcode_set = PostcodeSet()
+    for outward, inward in pairs:
+        area = outward[:2] if outward[1].isalpha() else outward[:1]
+        postcode_set.add(ValidatedPostcode(area, outward[len(area) :], inward[:1], inward[1:]))
+
+    return postcode_set
+
+
+def build_string_sets(pairs):
+    return {f"{outward} {inward}" for outward, inward in pairs}, {
+        f"{outward} {inward[:1]}" for outward, inward in pairs
+    }
+
+
+def measure(func, pairs):
+    start = time.perf_counter()
+    func(pairs)
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    built = func(pairs)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return built, size, seconds
+
+
+def lookups_per_second(contains, queries):
+    start = time.perf_counter()
+    for query in queries:
+        contains(query)
+
+    return len(queries) / (time.perf_counter() - start)
+
+
+def main():
+    pairs = outwards_and_inwards()
+    count = len(pairs)
+    randomizer = random.Random(SEED)
+    # half of the queried units are present, the other half differ by their unit
+    unit_queries = [
+        f"{outward} {inward[:1]}{randomizer.choice((inward[1:], 'ZZ'))}"
+        for outward, inward in randomizer.sample(pairs, LOOKUPS)
+    ]
+    sector_queries = [unit_query[:-2] for unit_query in unit_queries]
+
+    postcode_set, set_size, set_seconds = measure(build_postcode_set, pairs)
+    (units_set, sectors_set), strings_size, strings_seconds = measure(build_string_sets, pairs)
+    print(f"{count:,} postcodes")
+    for name, size, seconds in (
+        ("PostcodeSet", set_size, set_seconds),
+        ("set of strings", strings_size, strings_seconds),
+    ):
+        print(
+            f"{name:<16} {size / 2 ** 20:>8,.1f} MiB {size / count:>8,.1f} bytes/postcode built in {seconds:.2f}s"
+        )
+
+    for level, queries, string_set in (
+        ("unit", unit_queries, units_set),
+        ("sector", sector_queries, sectors_set),
+    ):
+        for name, contains in (
+            ("PostcodeSet", postcode_set.__contains__),
+            ("set of strings", string_set.__contains__),
+        ):
+            print(f"{level:<8} {name:<16} {lookups_per_second(contains, queries):>12,.0f} lookups/s")
+
+
+if __name__ == "__main__":
+    main()
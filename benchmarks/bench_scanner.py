@@ -0,0 +1,50 @@
+"""
+Measure `scanner.scan` over a multi-MB document of address lines and emails against splitting the text and
+validating every token and pair of adjacent tokens with `UKPostcode.validate_many`.
+
+Run from the repository root: python -m benchmarks.bench_scanner
+"""
+import itertools
+import random
+import timeit
+
+from postcode_validator_uk.scanner import scan
+from postcode_validator_uk.validators import UKPostcode
+
+from .corpora import CORPORA
+
+SEED = 2023
+LINES = 100_000
+WORDS = ("Flat", "Street", "Road", "London", "please", "deliver", "to", "the", "office", "at", "12", "3B")
+
+
+def document():
+    randomizer = random.Random(SEED)
+    postcodes = itertools.cycle(CORPORA["mixed"])
+    lines = []
+    for _ in range(LINES):
+        words = randomizer.choices(WORDS, k=randomizer.randint(4, 12))
+        words.insert(randomizer.randrange(len(words)), f"{next(postcodes)},")
+        lines.append(" ".join(words))
+
+    return "\n".join(lines)
+
+
+def split_and_validate(text):
+    tokens = [token.strip(",.") for token in text.split()]
+    candidates = itertools.chain(tokens, map(" ".join, zip(tokens, tokens[1:])))
+    return [postcode for postcode, error in UKPostcode.validate_many(candidates) if error is None]
+
+
+def main():
+    text = document()
+    megabytes = len(text.encode()) / 1_000_000
+
+    funcs = (("scan", lambda: list(scan(text))), ("split_and_validate", lambda: split_and_validate(text)))
+    for name, func in funcs:
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:<20} {megabytes / seconds:>8,.2f} MB/s ({len(func())} postcodes in {megabytes:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Compare `UKPostcode.validate_many` against a loop of `UKPostcode(x).validate()`.
+
+Run from the repository root: python -m benchmarks.bench_validate_many
+"""
+import itertools
+import timeit
+
+from postcode_validator_uk.exceptions import InvalidPostcode
+from postcode_validator_uk.validators import UKPostcode
+
+SAMPLE = ("EC1A 1BB", "w1a 0ax", "M1 1AE", "B33 8TH", "CR2 6XH", "DN551PT", "QA1 1AA", "AB1 1AA", "B338-TH5")
+ROWS = 100_000
+
+
+def validate_loop(postcodes):
+    results = []
+    for raw_postcode in postcodes:
+        postcode = UKPostcode(raw_postcode)
+        try:
+            postcode.validate()
+        except InvalidPostcode:
+            results.append(None)
+        else:
+            results.append(postcode.validated_postcode)
+
+    return results
+
+
+def validate_many(postcodes):
+    return list(UKPostcode.validate_many(postcodes))
+
+
+def main():
+    postcodes = list(itertools.islice(itertools.cycle(SAMPLE), ROWS))
+    for func in (validate_loop, validate_many):
+        seconds = min(timeit.repeat(lambda: func(postcodes), number=1, repeat=5))
+        print(f"{func.__name__:<16} {ROWS / seconds:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
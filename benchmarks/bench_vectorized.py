@@ -0,0 +1,33 @@
+"""
+Compare `vectorized.validate_array` against `UKPostcode.validate_many` over a NumPy array of postcodes.
+
+Run from the repository root: python -m benchmarks.bench_vectorized (requires numpy)
+"""
+import itertools
+import timeit
+
+import numpy as np
+
+from postcode_validator_uk.validators import UKPostcode
+from postcode_validator_uk.vectorized import validate_array
+
+from .corpora import CORPORA
+
+ROWS = 1_000_000
+
+
+def main():
+    postcodes = np.array(list(itertools.islice(itertools.cycle(CORPORA["mixed"]), ROWS)))
+    validate_array(postcodes[:1])
+
+    funcs = (
+        ("validate_many", lambda: list(UKPostcode.validate_many(postcodes.tolist()))),
+        ("validate_array", lambda: validate_array(postcodes)),
+    )
+    for name, func in funcs:
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:<16} {ROWS / seconds:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
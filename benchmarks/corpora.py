@@ -0,0 +1,87 @@
+"""Realistic postcode corpora for the benchmarks."""
+import itertools
+import random
+
+from postcode_validator_uk import generator
+from postcode_validator_uk.constants import UK_POSTCODE_FORMAT_ERROR, UK_POSTCODE_RULES_LIST
+
+GENERATED_SEED = 2023
+GENERATED_VALID = 450
+GENERATED_INVALID_PER_ERROR = 5
+
+VALID_POSTCODES_BY_FORMAT = {
+    "A9": ("M1 1AE", "L1 8JQ", "B1 1BB", "G2 3WT", "S1 2HE", "N1 9GU"),
+    "A99": ("B33 8TH", "M60 2LA", "L36 4HR", "G58 1SB", "N22 7BH", "E17 4EE"),
+    "A9A": ("W1A 0AX", "E1W 1YY", "N1C 4AB", "W1T 1JY", "W1D 3QF", "N1P 2NG"),
+    "AA9": ("CR2 6XH", "DN1 1PT", "BR1 1AA", "HA0 1BB", "BS1 4DJ", "SW3 4RY"),
+    "AA99": ("DN55 1PT", "PO16 7GZ", "GU16 7HF", "AB11 5QN", "BS10 5NB", "LL57 2DG"),
+    "AA9A": ("EC1A 1BB", "SW1W 0NY", "WC2N 5DU", "SE1P 4DF", "NW1W 7LN", "EC4M 7RF"),
+}
+INVALID_POSTCODES_BY_RULE = {
+    "CentralLondonDistrict": ("EC5A 1BB", "E1A 1AA", "N1Q 1AA", "NW1A 1AA"),
+    "DoubleDigitDistrict": ("AB1 1AA", "LL2 3BB", "SO9 9ZZ"),
+    "FirstLetter": ("QA1 1AA", "V1 1AA", "XY10 1BB"),
+    "FourthLetter": ("BB1C 1AA", "TW1Q 2BB", "DE1D 3DD"),
+    "LastTwoLetter": ("EC1A 1BC", "M1 1IA", "B33 8OV"),
+    "SecondLetter": ("AI1 1AA", "BJ2 2BB", "CZ3 3DD"),
+    "SingleDigitDistrict": ("BR10 1AA", "HA12 2BB", "WC1 1AA"),
+    "ThirdLetter": ("M1L 1AA", "B2I 2BB", "G3O 3DD"),
+    "ZeroOrTenDistrict": ("AA0 1AA", "SS10 1AA", "DN0 2BB"),
+}
+GARBAGE = (
+    "",
+    "B338-TH5",
+    "0000000",
+    "EC1A A4BB",
+    "1W1A 0AX",
+    "hello world",
+    "CR2 6XH#",
+    "ＥＣ１Ａ １ＢＢ",
+    "X" * 64,
+)
+
+
+def variants(postcode):
+    """Case and spacing variants of a postcode, as found in user input."""
+    outward, _, inward = postcode.partition(" ")
+    return (postcode, postcode.lower(), f"{outward}{inward}", f"{outward}  {inward}", postcode.title())
+
+
+def valid_postcodes():
+    return tuple(itertools.chain.from_iterable(VALID_POSTCODES_BY_FORMAT.values()))
+
+
+def invalid_postcodes():
+    return tuple(itertools.chain.from_iterable(INVALID_POSTCODES_BY_RULE.values()))
+
+
+def mixed_postcodes():
+    postcodes = itertools.chain(valid_postcodes(), invalid_postcodes())
+    return tuple(itertools.chain.from_iterable(variants(postcode) for postcode in postcodes))
+
+
+def invalid_heavy_postcodes():
+    """About half near-misses and garbage, the rest valid postcodes."""
+    postcodes = itertools.chain(invalid_postcodes(), GARBAGE, valid_postcodes())
+    return tuple(itertools.chain.from_iterable(variants(postcode) for postcode in postcodes))
+
+
+def generated_postcodes():
+    """Seeded random valid postcodes, and about a tenth of postcodes failing each rule or the format."""
+    errors = UK_POSTCODE_RULES_LIST + (UK_POSTCODE_FORMAT_ERROR,)
+    postcodes = list(generator.valid_postcodes(GENERATED_VALID, seed=GENERATED_SEED))
+    for error in errors:
+        postcodes.extend(generator.invalid_postcodes(error, GENERATED_INVALID_PER_ERROR, seed=GENERATED_SEED))
+    random.Random(GENERATED_SEED).shuffle(postcodes)
+
+    return tuple(postcodes)
+
+
+CORPORA = {
+    "valid": valid_postcodes(),
+    "near-miss": invalid_postcodes(),
+    "garbage": GARBAGE,
+    "mixed": mixed_postcodes(),
+    "invalid-heavy": invalid_heavy_postcodes(),
+    "generated": generated_postcodes(),
+}
@@ -0,0 +1,152 @@
+"""
+Benchmark suite of the validation hot paths, reporting for each path over each corpus the ops/sec and the
+peak memory allocated during a pass over the corpus, per op.
+
+Run from the repository root: python -m benchmarks.run [--number N] [--repeat N] [-k PATTERN]
+"""
+import argparse
+import timeit
+import tracemalloc
+
+from postcode_validator_uk.constants import UK_POSTCODE_FORMAT_ERROR, UK_POSTCODE_RULES_LIST
+from postcode_validator_uk.engine import compile_rules
+from postcode_validator_uk.exceptions import InvalidPostcode
+from postcode_validator_uk.instrumentation import Instrumentation
+from postcode_validator_uk.validators import UKPostcode
+
+from .corpora import CORPORA, INVALID_POSTCODES_BY_RULE, VALID_POSTCODES_BY_FORMAT
+
+
+def validate(postcodes):
+    for raw_postcode in postcodes:
+        try:
+            UKPostcode(raw_postcode).validate()
+        except InvalidPostcode:
+            pass
+
+
+def try_validate(postcodes):
+    for raw_postcode in postcodes:
+        UKPostcode(raw_postcode).try_validate()
+
+
+def is_valid(postcodes):
+    for raw_postcode in postcodes:
+        UKPostcode(raw_postcode).is_valid()
+
+
+def validate_many(postcodes):
+    for _ in UKPostcode.validate_many(postcodes):
+        pass
+
+
+def parse(postcodes):
+    for raw_postcode in postcodes:
+        try:
+            UKPostcode.parse(raw_postcode)
+        except InvalidPostcode:
+            pass
+
+
+def components(postcodes):
+    for raw_postcode in postcodes:
+        postcode = UKPostcode(raw_postcode)
+        try:
+            postcode.validate()
+        except InvalidPostcode:
+            continue
+        postcode.area, postcode.district, postcode.sector, postcode.unit
+
+
+def engine_match(postcodes):
+    engine = compile_rules(UK_POSTCODE_RULES_LIST)
+    for outward, inward in postcodes:
+        engine.match(outward, inward)
+
+
+def instrumented(func):
+    def run(postcodes):
+        UKPostcode.instrumentation = Instrumentation()
+        try:
+            func(postcodes)
+        finally:
+            UKPostcode.instrumentation = None
+
+    run.__name__ = f"{func.__name__}+instrumentation"
+    return run
+
+
+def rule_check(rule_class):
+    def check(postcodes):
+        for outward, inward in postcodes:
+            rule_class.check(outward, inward)
+
+    check.__name__ = f"rule:{rule_class.__name__}"
+    return check
+
+
+def split(postcodes):
+    """Outward and inward codes of the postcodes matching the format, the input of the rules."""
+    parts = (postcode.partition(" ") for postcode in postcodes)
+    return tuple((outward, inward) for outward, _, inward in parts)
+
+
+def benchmarks():
+    for corpus_name, postcodes in CORPORA.items():
+        for func in (validate, try_validate, is_valid, validate_many, parse, components):
+            yield func.__name__, corpus_name, func, postcodes
+
+    yield "validate_many+instrumentation", "mixed", instrumented(validate_many), CORPORA["mixed"]
+
+    rule_corpus = split(CORPORA["valid"] + CORPORA["near-miss"])
+    yield "engine_match", "valid+near-miss", engine_match, rule_corpus
+    for rule_class in UK_POSTCODE_RULES_LIST:
+        func = rule_check(rule_class)
+        yield func.__name__, "valid+near-miss", func, rule_corpus
+
+
+def check_corpora():
+    """Make sure the corpora still exercise the paths they're meant to, failing loudly otherwise."""
+    valid = [postcode for postcodes in VALID_POSTCODES_BY_FORMAT.values() for postcode in postcodes]
+    assert all(error is None for _, error in UKPostcode.validate_many(valid))
+    for rule_name, postcodes in INVALID_POSTCODES_BY_RULE.items():
+        errors = {error for _, error in UKPostcode.validate_many(postcodes)}
+        assert errors == {rule_name}, f"{rule_name} near-misses fail with {errors}"
+    errors = {error for _, error in UKPostcode.validate_many(CORPORA["generated"])}
+    expected_errors = {None, UK_POSTCODE_FORMAT_ERROR, *(rule.__name__ for rule in UK_POSTCODE_RULES_LIST)}
+    assert errors == expected_errors, f"the generated corpus fails with {errors}"
+
+
+def allocated_per_op(func, postcodes):
+    tracemalloc.start()
+    func(postcodes)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak / len(postcodes)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--number", type=int, default=200, help="runs over the corpus per measure")
+    parser.add_argument("--repeat", type=int, default=5, help="measures, the best one is reported")
+    parser.add_argument("-k", dest="pattern", default="", help="only run benchmarks containing this")
+    args = parser.parse_args(argv)
+
+    check_corpora()
+    print(f"{'benchmark':<30} {'corpus':<16} {'ops/sec':>12} {'peak B/op':>10}")
+    for name, corpus_name, func, postcodes in benchmarks():
+        if args.pattern not in f"{name} {corpus_name}":
+            continue
+
+        timer = timeit.Timer(lambda: func(postcodes))
+        seconds = min(timer.repeat(number=args.number, repeat=args.repeat)) / args.number
+        ops_per_second = len(postcodes) / seconds
+        allocated = allocated_per_op(func, postcodes)
+        print(f"{name:<30} {corpus_name:<16} {ops_per_second:>12,.0f} {allocated:>10,.1f}")
+
+
+if __name__ == "__main__":
+    main()
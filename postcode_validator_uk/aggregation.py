@@ -0,0 +1,81 @@
+"""Streaming aggregation of raw postcodes by area, district and sector, validating them in the same pass."""
+import itertools
+import operator
+
+from .engine import compile_rules
+from .validators import UKPostcode
+
+
+def _district(sector):
+    return sector.partition(" ")[0]
+
+
+def _area(sector):
+    return sector[:2] if sector[1].isalpha() else sector[:1]
+
+
+class PostcodeAggregator:
+    """
+    Aggregate of values of valid postcodes by sector, rolled up to districts and areas on demand, and count
+    of invalid postcodes by error, as returned by `UKPostcode.validate_many`.
+
+    Values are accumulated with ``reduce(accumulator, value)`` from ``initial``, counting postcodes by
+    default, and accumulators of the same sector, district or area are merged with ``combine``, defaulting
+    to ``reduce``, which fits sums, minimums and maximums. Aggregators are picklable when their functions
+    are, so workers can aggregate parts of the input and the parent `merge` them.
+    """
+
+    def __init__(self, reduce=operator.add, initial=0, combine=None, validator_class=UKPostcode):
+        self.reduce = reduce
+        self.initial = initial
+        self.combine = combine or reduce
+        self.validator_class = validator_class
+        self.errors = {}
+        self._sectors = {}
+
+    def add(self, raw_postcode, value=1):
+        self.update((raw_postcode,), (value,))
+
+    def update(self, postcodes, values=None):
+        """Aggregate the value of each raw postcode of an iterable, zipped with ``values`` when given."""
+        engine = compile_rules(self.validator_class._rules_list)
+        get_outcome = self.validator_class._get_outcome
+        reduce, initial, sectors, errors = self.reduce, self.initial, self._sectors, self.errors
+        for raw_postcode, value in zip(postcodes, itertools.repeat(1) if values is None else values):
+            groups, error = get_outcome(f"{raw_postcode}", engine)
+            if error is None:
+                # sectors are keyed by their "outward sector" string, cheaper to hash than a tuple
+                sector = f"{groups[0]} {groups[4]}"
+                sectors[sector] = reduce(sectors.get(sector, initial), value)
+            else:
+                errors[error] = errors.get(error, 0) + 1
+
+    def merge(self, other):
+        """Merge the aggregates of another aggregator into this one, returning it."""
+        combine, sectors = self.combine, self._sectors
+        for sector, accumulator in other._sectors.items():
+            sectors[sector] = combine(sectors[sector], accumulator) if sector in sectors else accumulator
+        for error, count in other.errors.items():
+            self.errors[error] = self.errors.get(error, 0) + count
+
+        return self
+
+    def sectors(self):
+        """Dict of the accumulators by sector, like ``"EC1A 1"``."""
+        return dict(self._sectors)
+
+    def districts(self):
+        """Dict of the accumulators by district, that is outward code, like ``"EC1A"``."""
+        return self._roll_up(_district)
+
+    def areas(self):
+        """Dict of the accumulators by area, like ``"EC"``."""
+        return self._roll_up(_area)
+
+    def _roll_up(self, key):
+        combine, rolled_up = self.combine, {}
+        for sector, accumulator in self._sectors.items():
+            group = key(sector)
+            rolled_up[group] = combine(rolled_up[group], accumulator) if group in rolled_up else accumulator
+
+        return rolled_up
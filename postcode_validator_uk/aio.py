@@ -0,0 +1,89 @@
+"""asyncio facade coalescing concurrent validations into micro-batches."""
+import asyncio
+import weakref
+
+from .validators import UKPostcode
+
+
+def _validate_list(validator_class, postcodes):
+    return list(validator_class.validate_many(postcodes))
+
+
+class AsyncValidator:
+    """
+    Validate postcodes from coroutines, returning the ``(validated_postcode, error)`` tuples of
+    `UKPostcode.validate_many`.
+
+    Calls made while the event loop is busy are queued and validated together in a single batch on the next
+    loop iteration. Batches of at least ``offload_threshold`` postcodes run in ``executor`` (the loop's
+    default one when None) so a big payload never blocks the event loop.
+    """
+
+    def __init__(
+        self, validator_class=UKPostcode, max_batch_size=1000, offload_threshold=10000, executor=None
+    ):
+        self.validator_class = validator_class
+        self.max_batch_size = max_batch_size
+        self.offload_threshold = offload_threshold
+        self.executor = executor
+        self._pending = []
+        self._flush_handle = None
+
+    async def validate(self, postcode):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((postcode, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_soon(self._flush)
+
+        return await future
+
+    async def validate_many(self, postcodes):
+        postcodes = list(postcodes)
+        if len(postcodes) < self.offload_threshold:
+            return _validate_list(self.validator_class, postcodes)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, _validate_list, self.validator_class, postcodes)
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        try:
+            results = _validate_list(self.validator_class, [postcode for postcode, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+_default_validators = weakref.WeakKeyDictionary()
+
+
+def _get_default_validator():
+    loop = asyncio.get_running_loop()
+    validator = _default_validators.get(loop)
+    if validator is None:
+        validator = _default_validators[loop] = AsyncValidator()
+
+    return validator
+
+
+async def validate_async(postcode):
+    """Validate a postcode with the default `AsyncValidator` of the running loop."""
+    return await _get_default_validator().validate(postcode)
+
+
+async def validate_many_async(postcodes):
+    """Validate postcodes in one batch with the default `AsyncValidator` of the running loop."""
+    return await _get_default_validator().validate_many(postcodes)
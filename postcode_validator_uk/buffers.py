@@ -0,0 +1,80 @@
+"""
+Validation of ASCII postcodes held in bytes-like objects, like bytes, memoryview or mmap slices, matched in
+place by bytes regexes instead of being decoded into strings first.
+"""
+import mmap
+import os
+
+from . import constants
+from .constants import UK_POSTCODE_FORMAT_ERROR
+from .engine import compile_rules
+from .validators import UKPostcode
+
+
+def _decoded(spans, padded):
+    for buffer, pos, endpos in spans:
+        raw_postcode = str(buffer[pos:endpos], "ascii", "replace")
+        yield raw_postcode.strip(" ") if padded else raw_postcode
+
+
+def _validate_spans(validator_class, spans, padded=False):
+    """
+    Validate the ``buffer[pos:endpos]`` raw postcode of each ``(buffer, pos, endpos)`` span like
+    `UKPostcode.validate_many`, without copying it: only the outward and inward codes of the postcodes
+    matching the expected format are decoded. Padded values may have leading and trailing spaces.
+
+    Instrumented, cached or directory checking validator classes, and legacy rules, go through
+    `UKPostcode.validate_many` with the decoded raw postcode.
+    """
+    engine = compile_rules(validator_class._rules_list)
+    if (
+        validator_class.instrumentation is not None
+        or validator_class.cache is not None
+        or validator_class.directory is not None
+        or engine.legacy_rules
+    ):
+        yield from validator_class.validate_many(_decoded(spans, padded))
+        return
+
+    regex = constants.UK_POSTCODE_PADDED_BYTES_REGEX if padded else constants.UK_POSTCODE_BYTES_REGEX
+    fullmatch, rejections = regex.fullmatch, validator_class.rejections
+    for buffer, pos, endpos in spans:
+        postcode_matchs = fullmatch(buffer, pos, endpos)
+        if postcode_matchs:
+            outward, inward = postcode_matchs.groups()
+            outward, inward = outward.decode().upper(), inward.decode().upper()
+            if engine.match(outward, inward):
+                yield f"{outward} {inward}", None
+                continue
+
+            error = engine.failed_rule(outward, inward)
+        else:
+            error = UK_POSTCODE_FORMAT_ERROR
+
+        if rejections is not None:
+            rejections[error] += 1
+        yield None, error
+
+
+def validate_bytes_many(buffers, validator_class=UKPostcode):
+    """Bytes equivalent of `UKPostcode.validate_many`, yielding a ``(validated_postcode, error)`` per item."""
+    return _validate_spans(validator_class, ((buffer, 0, len(buffer)) for buffer in buffers))
+
+
+def validate_column(buffer, offset, width, record_size, validator_class=UKPostcode):
+    """
+    Validate the space padded column of ``width`` bytes at ``offset`` of each ``record_size`` bytes record of
+    a buffer, yielding a ``(validated_postcode, error)`` per record like `UKPostcode.validate_many`.
+    """
+    starts = range(offset, len(buffer) - width + 1, record_size)
+    return _validate_spans(validator_class, ((buffer, start, start + width) for start in starts), padded=True)
+
+
+def validate_file(path, offset, width, record_size, validator_class=UKPostcode):
+    """`validate_column` over a fixed-width file, memory-mapped rather than read."""
+    with open(path, "rb") as fixed_width_file:
+        if not os.fstat(fixed_width_file.fileno()).st_size:
+            return
+
+        with mmap.mmap(fixed_width_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from validate_column(buffer, offset, width, record_size, validator_class)
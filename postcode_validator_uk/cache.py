@@ -0,0 +1,72 @@
+import threading
+from collections import OrderedDict
+
+
+class ValidationCache:
+    """
+    Thread safe, size bounded LRU cache of validation outcomes keyed by normalised postcode.
+
+    The cache remembers the rules of the `RuleEngine` its outcomes were computed with and clears itself
+    when it's asked about different ones, compared by equality, so changing `UKPostcode._rules_list`,
+    in place or not, never serves stale outcomes.
+    """
+
+    def __init__(self, maxsize=10000):
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive number")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._outcomes = OrderedDict()
+        self._rules_list = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._outcomes)
+
+    def get(self, postcode, rules_list):
+        """Return the outcome cached for the postcode, or None when there is none."""
+        with self._lock:
+            if rules_list is not self._rules_list and rules_list != self._rules_list:
+                self._reset(rules_list)
+
+            outcome = self._outcomes.get(postcode)
+            if outcome is None:
+                self.misses += 1
+                return None
+
+            self._outcomes.move_to_end(postcode)
+            self.hits += 1
+            return outcome
+
+    def set(self, postcode, rules_list, outcome):
+        with self._lock:
+            if rules_list is not self._rules_list and rules_list != self._rules_list:
+                self._reset(rules_list)
+
+            self._outcomes[postcode] = outcome
+            self._outcomes.move_to_end(postcode)
+            if len(self._outcomes) > self.maxsize:
+                self._outcomes.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._reset(None)
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._outcomes),
+                "maxsize": self.maxsize,
+            }
+
+    def _reset(self, rules_list):
+        self._outcomes.clear()
+        self._rules_list = rules_list
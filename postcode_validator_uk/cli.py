@@ -0,0 +1,150 @@
+"""Command line entry point validating postcodes streamed from a file or stdin."""
+import argparse
+import csv
+import itertools
+import sys
+import time
+from collections import Counter
+
+from .parallel import validate_many_parallel
+from .validators import UKPostcode
+
+VALID_STATUS = "valid"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="postcode-validator-uk",
+        description="Validate UK postcodes, one per line or from a CSV column, writing a CSV with the "
+        "validated postcode and a status column.",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="input file, stdin when omitted or '-'")
+    parser.add_argument("-o", "--output", default="-", help="output file, stdout when omitted or '-'")
+    parser.add_argument("-c", "--column", help="read postcodes from this column of a CSV with header")
+    parser.add_argument("-d", "--delimiter", default=",", help="CSV delimiter (default: ',')")
+    parser.add_argument(
+        "--chunk-size", type=int, default=10000, help="rows validated at a time (default: 10000)"
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1, help="validate in a pool of this many processes (default: 1)"
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="don't report stats to stderr")
+    return parser.parse_args(argv)
+
+
+def iter_chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def read_rows(input_file, column=None, delimiter=","):
+    """
+    Return the header and a lazy iterator of ``(row, raw_postcode)`` pairs read from the input, either
+    one postcode per line or a column of a CSV with header.
+    """
+    if column is None:
+        lines = (line.rstrip("\r\n") for line in input_file)
+        return ["postcode"], (([raw_postcode], raw_postcode) for raw_postcode in lines)
+
+    reader = csv.reader(input_file, delimiter=delimiter)
+    header = next(reader, [])
+    if column not in header:
+        raise SystemExit(f"Column {column!r} not found in the input header")
+
+    column_index = header.index(column)
+    return header, _padded_rows(reader, len(header), column_index)
+
+
+def _padded_rows(reader, width, column_index):
+    # short rows are padded to the header width, keeping the added columns under their header
+    for row in reader:
+        if len(row) < width:
+            row += [""] * (width - len(row))
+
+        yield row, row[column_index]
+
+
+def validate_rows(rows, chunk_size, stats):
+    """Validate rows chunk by chunk, yielding them with the validated postcode and status columns added."""
+    for chunk in iter_chunks(rows, chunk_size):
+        results = UKPostcode.validate_many(raw_postcode for _, raw_postcode in chunk)
+        yield from add_status(chunk, results, stats)
+
+
+def validate_rows_parallel(rows, chunk_size, stats, workers):
+    """Same as `validate_rows`, validating in a process pool. Only rows of in flight chunks are buffered."""
+    rows, raw_postcode_rows = itertools.tee(rows)
+    raw_postcodes = (raw_postcode for _, raw_postcode in raw_postcode_rows)
+    results = validate_many_parallel(raw_postcodes, workers=workers, chunk_size=chunk_size)
+    yield from add_status(rows, results, stats)
+
+
+def add_status(rows, results, stats):
+    for (row, _), (validated_postcode, error) in zip(rows, results):
+        status = error or VALID_STATUS
+        stats[status] += 1
+        yield row + [validated_postcode or "", status]
+
+
+def open_file(path, mode):
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+
+    try:
+        return open(path, mode, newline="")
+    except OSError as error:
+        raise SystemExit(f"Can't open {path}: {error.strerror}")
+
+
+def close_file(file):
+    if file not in (sys.stdin, sys.stdout):
+        file.close()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.chunk_size < 1:
+        raise SystemExit("--chunk-size must be a positive number")
+    if args.workers < 1:
+        raise SystemExit("--workers must be a positive number")
+
+    stats = Counter()
+    started_at = time.perf_counter()
+    input_file = open_file(args.input, "r")
+    try:
+        output_file = open_file(args.output, "w")
+        try:
+            header, rows = read_rows(input_file, args.column, args.delimiter)
+            writer = csv.writer(output_file, delimiter=args.delimiter, lineterminator="\n")
+            writer.writerow(header + ["validated_postcode", "status"])
+            if args.workers > 1:
+                writer.writerows(validate_rows_parallel(rows, args.chunk_size, stats, args.workers))
+            else:
+                writer.writerows(validate_rows(rows, args.chunk_size, stats))
+        finally:
+            close_file(output_file)
+    finally:
+        close_file(input_file)
+
+    elapsed = time.perf_counter() - started_at
+    if not args.quiet:
+        report_stats(stats, elapsed)
+
+    return 0
+
+
+def report_stats(stats, elapsed):
+    rows = sum(stats.values())
+    invalid = rows - stats[VALID_STATUS]
+    print(
+        f"{rows} rows, {invalid} invalid in {elapsed:.2f}s ({rows / elapsed if elapsed else 0:,.0f} rows/s)",
+        file=sys.stderr,
+    )
+    for status, count in sorted(stats.items()):
+        if status != VALID_STATUS:
+            print(f"  {status}: {count}", file=sys.stderr)
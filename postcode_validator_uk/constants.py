@@ -1,5 +1,3 @@
-import re
-
 from .rules import (
     CentralLondonDistrict,
     DoubleDigitDistrict,
@@ -12,11 +10,6 @@ from .rules import (
     ZeroOrTenDistrict,
 )
 
-UK_POSTCODE_VALIDATION_REGEX = re.compile(r"^([A-Z]{1,2}[0-9][A-Z0-9]?) *([0-9][A-Z]{2})$")
-UK_POSTCODE_AREA_REGEX = re.compile(r"^[A-Z]{1,2}")
-UK_POSTCODE_DISTRICT_REGEX = re.compile(r"[0-9]{1,2}[A-Z]?$")
-UK_POSTCODE_SECTOR_REGEX = re.compile(r"^[0-9]")
-UK_POSTCODE_UNIT_REGEX = re.compile(r"[A-Z0-9]{2}$")
 UK_POSTCODE_RULES_LIST = (
     CentralLondonDistrict,
     DoubleDigitDistrict,
@@ -28,3 +21,43 @@ UK_POSTCODE_RULES_LIST = (
     ThirdLetter,
     ZeroOrTenDistrict,
 )
+UK_POSTCODE_FORMAT_ERROR = "InvalidFormat"
+UK_POSTCODE_DIRECTORY_ERROR = "NotInDirectory"
+
+# the regexes are compiled on their first access, through the module __getattr__
+_LAZY_REGEXES = {
+    "UK_POSTCODE_VALIDATION_REGEX": (
+        r"^(?P<outward>(?P<area>[A-Z]{1,2})(?P<district>[0-9][A-Z0-9]?))"
+        r" *(?P<inward>(?P<sector>[0-9])(?P<unit>[A-Z]{2}))$"
+    ),
+    # unanchored and case insensitive version of the above, for postcodes in free text
+    "UK_POSTCODE_SCAN_REGEX": (
+        r"(?<![A-Za-z0-9])(?P<outward>[A-Za-z]{1,2}[0-9][A-Za-z0-9]?)"
+        r" *(?P<inward>[0-9][A-Za-z]{2})(?![A-Za-z0-9])"
+    ),
+    # case insensitive bytes versions of the validation regex, for `fullmatch` over slices of bytes-like
+    # objects, the padded one allowing the leading and trailing spaces of fixed-width columns. Like its `$`,
+    # they accept a trailing newline
+    "UK_POSTCODE_BYTES_REGEX": rb"(?i)(?P<outward>[A-Z]{1,2}[0-9][A-Z0-9]?) *(?P<inward>[0-9][A-Z]{2})\n?",
+    "UK_POSTCODE_PADDED_BYTES_REGEX": (
+        rb"(?i) *(?P<outward>[A-Z]{1,2}[0-9][A-Z0-9]?) *(?P<inward>[0-9][A-Z]{2})\n? *"
+    ),
+    # any leading part of a postcode, down to its area
+    "UK_POSTCODE_PREFIX_REGEX": (
+        r"^(?P<area>[A-Z]{1,2})(?:(?P<district>[0-9][A-Z0-9]?)(?: *(?P<sector>[0-9])(?P<unit>[A-Z]{2})?)?)?$"
+    ),
+    "UK_POSTCODE_AREA_REGEX": r"^[A-Z]{1,2}",
+    "UK_POSTCODE_DISTRICT_REGEX": r"[0-9]{1,2}[A-Z]?$",
+    "UK_POSTCODE_SECTOR_REGEX": r"^[0-9]",
+    "UK_POSTCODE_UNIT_REGEX": r"[A-Z0-9]{2}$",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_REGEXES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import re
+
+    regex = globals()[name] = re.compile(_LAZY_REGEXES[name])
+    return regex
@@ -0,0 +1,82 @@
+"""Corrections of near-miss postcodes: character confusions, missing spaces and transposed characters."""
+import itertools
+from collections import namedtuple
+
+from .engine import compile_rules
+from .tables import DIGITS, LETTERS
+from .validators import UKPostcode
+
+# formats of `UK_POSTCODE_VALIDATION_REGEX` without the space, "A" standing for a letter and "9" for a digit
+SHAPES = ("A99AA", "A999AA", "A9A9AA", "AA99AA", "AA999AA", "AA9A9AA")
+# characters commonly mistaken for each other, read as a digit or as a letter
+AS_DIGIT = {"O": "0", "I": "1", "L": "1", "Z": "2", "S": "5", "G": "6", "B": "8"}
+AS_LETTER = {"0": "O", "1": "IL", "2": "Z", "5": "S", "6": "G", "8": "B"}
+INWARD_LENGTH = 3
+MAX_COST = 2
+
+
+class Correction(namedtuple("Correction", ("postcode", "cost"))):
+    """A valid postcode suggested for a raw one, ``cost`` being the number of edits made to the raw one."""
+
+    __slots__ = ()
+
+
+def _readings(value, shape):
+    """Ways of reading a compact value with a shape, yielded as ``(text, confusions)`` pairs."""
+    options = []
+    for char, slot in zip(value, shape):
+        if char in (DIGITS if slot == "9" else LETTERS):
+            options.append(((char, 0),))
+        else:
+            confusions = AS_DIGIT.get(char, "") if slot == "9" else AS_LETTER.get(char, "")
+            if not confusions:
+                return
+
+            options.append(tuple((confusion, 1) for confusion in confusions))
+
+    for reading in itertools.product(*options):
+        yield "".join(char for char, _ in reading), sum(cost for _, cost in reading)
+
+
+def _transpositions(value):
+    yield value, 0
+    for index in range(len(value) - 1):
+        if value[index] != value[index + 1]:
+            yield f"{value[:index]}{value[index + 1]}{value[index]}{value[index + 2 :]}", 1
+
+
+def correct(raw_postcode, validator_class=UKPostcode, max_cost=MAX_COST):
+    """
+    Valid postcodes a raw one may have been meant as, ranked by their `Correction` cost and limited to
+    ``max_cost`` edits. Spaces are ignored, each character confusion and transposition costs one edit.
+
+    Candidates are only generated in the shapes of valid postcodes, and checked through the validator
+    class, that is with the packaged tables of valid outward and inward codes for the default rules, and
+    against its `UKPostcode.directory` when it's set.
+    """
+    engine = compile_rules(validator_class._rules_list)
+    value = "".join(f"{raw_postcode}".upper().split())
+    shapes = [shape for shape in SHAPES if len(shape) == len(value)]
+    ranks, rejected = {}, set()
+    for transposed, transpositions in _transpositions(value):
+        for shape in shapes:
+            for candidate, confusions in _readings(transposed, shape):
+                rank = (transpositions + confusions, transpositions)
+                postcode = f"{candidate[:-INWARD_LENGTH]} {candidate[-INWARD_LENGTH:]}"
+                if rank[0] > max_cost or postcode in rejected or ranks.get(postcode, (max_cost + 1,)) <= rank:
+                    continue
+
+                if validator_class._get_outcome(postcode, engine)[1] is None:
+                    ranks[postcode] = rank
+                else:
+                    rejected.add(postcode)
+
+    # equally costly corrections are ranked confusions first, they're more common than transpositions
+    ranked = sorted(ranks.items(), key=lambda item: (item[1], item[0]))
+    return [Correction(postcode, cost) for postcode, (cost, _) in ranked]
+
+
+def correct_many(postcodes, validator_class=UKPostcode, max_cost=MAX_COST):
+    """Yield the `correct` list of corrections of each raw postcode of an iterable."""
+    for raw_postcode in postcodes:
+        yield correct(raw_postcode, validator_class, max_cost)
@@ -0,0 +1,110 @@
+"""
+Position of the character making a postcode invalid, computed only for rejected postcodes when
+`UKPostcode.diagnostics` is enabled.
+"""
+from .constants import UK_POSTCODE_FORMAT_ERROR
+from .engine import is_fusible
+from .tables import DIGITS, LETTERS
+
+# `UK_POSTCODE_VALIDATION_REGEX` as (characters, min repeat, max repeat) tokens, None meaning unbounded
+FORMAT_TOKENS = (
+    (LETTERS, 1, 2),
+    (DIGITS, 1, 1),
+    (LETTERS + DIGITS, 0, 1),
+    (" ", 0, None),
+    (DIGITS, 1, 1),
+    (LETTERS, 2, 2),
+)
+
+
+def _skip_tokens(states):
+    """Add to ``(token, repeats)`` states the ones reached by leaving tokens repeated enough times."""
+    states, pending = set(states), list(states)
+    while pending:
+        token, repeats = pending.pop()
+        if token < len(FORMAT_TOKENS) and repeats >= FORMAT_TOKENS[token][1] and (token + 1, 0) not in states:
+            states.add((token + 1, 0))
+            pending.append((token + 1, 0))
+
+    return states
+
+
+def _read_char(states, char):
+    next_states = set()
+    for token, repeats in states:
+        if token == len(FORMAT_TOKENS):
+            continue
+
+        chars, _, max_repeats = FORMAT_TOKENS[token]
+        if char in chars and (max_repeats is None or repeats < max_repeats):
+            next_states.add((token, repeats + 1))
+
+    return _skip_tokens(next_states)
+
+
+def format_error_position(postcode):
+    """Index of the first character of a normalised postcode that no valid format can continue with."""
+    states = _skip_tokens({(0, 0)})
+    for position, char in enumerate(postcode):
+        states = _read_char(states, char)
+        if not states:
+            return position
+
+    return len(postcode)
+
+
+def _single_edits(value, position, insertions=True):
+    """Values with the character at ``position`` substituted by one of the same kind, deleted or preceded."""
+    if position < len(value):
+        chars = DIGITS if value[position] in DIGITS else LETTERS
+        for char in chars:
+            yield f"{value[:position]}{char}{value[position + 1 :]}"
+        yield f"{value[:position]}{value[position + 1 :]}"
+
+    if insertions:
+        for char in DIGITS + LETTERS:
+            yield f"{value[:position]}{char}{value[position:]}"
+
+
+def rule_error_position(rule_class, value):
+    """
+    Index of the character of a value rejected by a rule that a single edit fixes, searched from the end of
+    the value so that area specific rules point at the district rather than at the area. Edits after which
+    the rule still applies are preferred, then substitutions or deletions making it not apply.
+
+    Rules that don't follow the regex protocol of `PostcodeRule`, see `is_fusible`, return None.
+    """
+    if not is_fusible(rule_class):
+        return None
+
+    applied_areas_match, rule_match = rule_class.applied_areas_regex.match, rule_class.rule_regex.match
+    positions = range(len(value), -1, -1)
+    for position in positions:
+        for edited in _single_edits(value, position):
+            if applied_areas_match(edited) and rule_match(edited):
+                return position
+
+    for position in positions:
+        for edited in _single_edits(value, position, insertions=False):
+            if rule_class.check_value(edited):
+                return position
+
+    return None
+
+
+def error_position(raw_postcode, error, engine):
+    """
+    Index in the raw postcode of the character making it invalid, or None when it can't be told, as for
+    rules that don't follow the regex protocol of `PostcodeRule`.
+    """
+    postcode = raw_postcode.upper()
+    if error == UK_POSTCODE_FORMAT_ERROR:
+        return format_error_position(postcode)
+
+    rule_class = next((rule for rule in engine.rules_list if rule.__name__ == error), None)
+    postcode_matchs = engine.format_regex.match(postcode)
+    if not is_fusible(rule_class) or not postcode_matchs:
+        return None
+
+    position = rule_error_position(rule_class, postcode_matchs.group(rule_class.attr_applied))
+    return None if position is None else postcode_matchs.start(rule_class.attr_applied) + position
@@ -0,0 +1,154 @@
+"""
+Directory of existing postcodes, checked after the rules when `UKPostcode.directory` is set.
+
+It's built once from a CSV of live postcodes, like an ONS Postcode Directory or Code-Point Open extract,
+into a file of the sorted `encoding` keys of the postcodes, as little-endian unsigned 32 bits integers. The
+file is memory-mapped and bisected in place, so opening it costs nothing and its pages are shared by the
+processes reading it, 1.8M postcodes taking 7MB.
+
+    python -m postcode_validator_uk.directory ONSPD.csv postcodes.dir [--column pcds]
+"""
+import argparse
+import bisect
+import csv
+import mmap
+import os
+import sys
+from array import array
+
+from . import constants
+from .encoding import decode, encode_codes
+from .engine import compile_rules
+from .validators import UKPostcode, ValidatedPostcode
+
+DIRECTORY_MAGIC = b"PCVUKDR2"
+
+
+class PostcodeDirectory:
+    """
+    Memory-mapped directory file of existing postcodes, in which raw postcodes, `ValidatedPostcode` values
+    or ``(outward, inward)`` codes are looked up in O(log n), bisecting the keys in place.
+
+    Pickling it only pickles its path, it's opened again when unpickled.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as directory_file:
+            content = directory_file.read(len(DIRECTORY_MAGIC))
+            if content != DIRECTORY_MAGIC:
+                raise ValueError(f"{path} isn't a postcode directory file")
+
+            self._buffer = mmap.mmap(directory_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if sys.byteorder == "little":
+            self._keys = memoryview(self._buffer)[len(DIRECTORY_MAGIC) :].cast("I")
+        else:
+            # big-endian machines can't bisect the mapped keys, they read them in memory
+            self._keys = array("I", self._buffer[len(DIRECTORY_MAGIC) :])
+            self._keys.byteswap()
+
+    def __reduce__(self):
+        return type(self), (self.path,)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        """Yield the validated postcodes of the directory, in lexical order."""
+        for key in self._keys:
+            yield decode(key).postcode
+
+    def __contains__(self, postcode):
+        if isinstance(postcode, ValidatedPostcode):
+            return self.contains(postcode.outward, postcode.inward)
+
+        postcode_matchs = constants.UK_POSTCODE_VALIDATION_REGEX.match(f"{postcode}".upper())
+        return bool(postcode_matchs) and self.contains(postcode_matchs["outward"], postcode_matchs["inward"])
+
+    def contains(self, outward, inward):
+        """Whether the normalised outward and inward codes of a postcode are in the directory."""
+        key = encode_codes(outward, inward)
+        index = bisect.bisect_left(self._keys, key)
+        return index < len(self._keys) and self._keys[index] == key
+
+    def close(self):
+        if isinstance(self._keys, memoryview):
+            self._keys.release()
+        self._buffer.close()
+
+    @classmethod
+    def build(cls, postcodes, path, validator_class=UKPostcode):
+        """
+        Write a directory file of the valid postcodes of an iterable, skipping invalid ones, and return the
+        number of postcodes written. The file is replaced at once, processes that mapped the previous one
+        keep reading it until they open the new one.
+
+        Postcodes are only checked by the rules, not by the `UKPostcode.directory` being replaced.
+        """
+        engine = compile_rules(validator_class._rules_list)
+        outcomes = (validator_class._check(f"{raw_postcode}", engine) for raw_postcode in postcodes)
+        keys = array(
+            "I",
+            sorted({encode_codes(groups[0], groups[3]) for groups, error in outcomes if error is None}),
+        )
+        if sys.byteorder != "little":
+            keys.byteswap()
+
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as directory_file:
+            directory_file.write(DIRECTORY_MAGIC)
+            keys.tofile(directory_file)
+
+        os.replace(temporary_path, path)
+        return len(keys)
+
+
+def read_live_postcodes(csv_file, column="pcds", terminated_column="doterm"):
+    """
+    Yield the postcodes of a column of a CSV with header, skipping the rows with a termination date when
+    the CSV has a ``terminated_column``, as the ONS Postcode Directory does.
+    """
+    reader = csv.reader(csv_file)
+    header = next(reader, [])
+    if column not in header:
+        raise ValueError(f"Column {column!r} not found in the CSV header")
+
+    column_index = header.index(column)
+    terminated_index = header.index(terminated_column) if terminated_column in header else None
+    for row in reader:
+        if terminated_index is None or not row[terminated_index].strip():
+            yield row[column_index]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a postcode directory file from a CSV of postcodes.")
+    parser.add_argument("input", help="CSV file with header, like an ONS Postcode Directory extract")
+    parser.add_argument("output", help="directory file to write")
+    parser.add_argument("-c", "--column", default="pcds", help="postcodes column (default: pcds)")
+    parser.add_argument(
+        "--terminated-column",
+        default="doterm",
+        help="rows with a value in this column are skipped, when the CSV has it (default: doterm)",
+    )
+    args = parser.parse_args(argv)
+
+    with open(args.input, newline="", encoding="utf-8", errors="replace") as csv_file:
+        try:
+            count = PostcodeDirectory.build(
+                read_live_postcodes(csv_file, args.column, args.terminated_column), args.output
+            )
+        except ValueError as error:
+            raise SystemExit(f"{error}")
+
+    print(f"{count} postcodes written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Bijective packing of validated postcodes into unsigned 32 bits integer keys, ordered as the postcode strings
+are, to store, sort and join postcodes as integers, like `array` or NumPy ``uint32`` columns.
+
+The outward code is ranked among the ones `UK_POSTCODE_VALIDATION_REGEX` accepts, a letter followed either
+by a digit and an optional character, or by a letter, a digit and an optional character, and the inward
+code among its digit and two letters. Keys don't depend on the rules, so they stay the same when rules
+change, and every key below `KEYS` is the key of a postcode matching the expected format.
+"""
+import itertools
+from array import array
+from functools import lru_cache
+
+from .tables import DIGITS, LETTERS, OUTWARD_CHARS
+from .validators import UKPostcode, ValidatedPostcode
+
+# the blank ends outward codes and is ranked first, as spaces sort before any other character
+CHAR_VALUES = {char: value for value, char in enumerate(OUTWARD_CHARS)}
+DIGIT_OUTWARDS = len(DIGITS) * len(OUTWARD_CHARS)
+OUTWARDS_PER_LETTER = DIGIT_OUTWARDS + len(LETTERS) * len(DIGITS) * len(OUTWARD_CHARS)
+OUTWARDS = len(LETTERS) * OUTWARDS_PER_LETTER
+UNITS = len(LETTERS) * len(LETTERS)
+INWARDS = len(DIGITS) * UNITS
+KEYS = OUTWARDS * INWARDS
+# stands for invalid postcodes in `encode_many` arrays, sorting after every postcode
+INVALID_KEY = 0xFFFFFFFF
+
+
+@lru_cache(maxsize=None)
+def _ranks():
+    """
+    Maps of the outward codes first two characters to their base rank and the ranks of the characters left,
+    and of the inward codes to their rank. Built on first use, they make encoding a few lookups.
+    """
+    digit_suffixes = {char.strip(): value for char, value in CHAR_VALUES.items()}
+    letter_suffixes = {
+        f"{digit}{char}".strip(): int(digit) * len(OUTWARD_CHARS) + value
+        for digit in DIGITS
+        for char, value in CHAR_VALUES.items()
+    }
+    prefixes = {}
+    for first_index, first in enumerate(LETTERS):
+        base = first_index * OUTWARDS_PER_LETTER
+        for digit in DIGITS:
+            prefixes[f"{first}{digit}"] = (base + int(digit) * len(OUTWARD_CHARS), digit_suffixes)
+        for second_index, second in enumerate(LETTERS):
+            second_base = base + DIGIT_OUTWARDS + second_index * len(DIGITS) * len(OUTWARD_CHARS)
+            prefixes[f"{first}{second}"] = (second_base, letter_suffixes)
+
+    units = map("".join, itertools.product(LETTERS, repeat=2))
+    inward_ranks = {
+        f"{sector}{unit}": rank for rank, (sector, unit) in enumerate(itertools.product(DIGITS, units))
+    }
+    return prefixes, inward_ranks
+
+
+def encode_codes(outward, inward):
+    """Key of the normalised outward and inward codes of a postcode matching the expected format."""
+    prefixes, inward_ranks = _ranks()
+    base, suffix_ranks = prefixes[outward[:2]]
+    return (base + suffix_ranks[outward[2:]]) * INWARDS + inward_ranks[inward]
+
+
+def encode(postcode, validator_class=UKPostcode):
+    """
+    Key of a `ValidatedPostcode`, or of a raw postcode parsed by the validator class, raising
+    `InvalidPostcode` when it's invalid.
+    """
+    if not isinstance(postcode, ValidatedPostcode):
+        postcode = validator_class.parse(postcode)
+
+    return encode_codes(postcode.outward, postcode.inward)
+
+
+def decode(key):
+    """`ValidatedPostcode` of a key, raising `ValueError` when it's not one."""
+    if not 0 <= key < KEYS:
+        raise ValueError(f"{key} isn't a postcode key")
+
+    rank, inward_rank = divmod(key, INWARDS)
+    first, rank = divmod(rank, OUTWARDS_PER_LETTER)
+    if rank < DIGIT_OUTWARDS:
+        digit, last = divmod(rank, len(OUTWARD_CHARS))
+        area, district = LETTERS[first], f"{digit}{OUTWARD_CHARS[last]}"
+    else:
+        letter_digit, last = divmod(rank - DIGIT_OUTWARDS, len(OUTWARD_CHARS))
+        second, digit = divmod(letter_digit, len(DIGITS))
+        area, district = f"{LETTERS[first]}{LETTERS[second]}", f"{digit}{OUTWARD_CHARS[last]}"
+
+    sector, unit = divmod(inward_rank, UNITS)
+    unit_first, unit_last = divmod(unit, len(LETTERS))
+    return ValidatedPostcode(
+        area, district.rstrip(), f"{sector}", f"{LETTERS[unit_first]}{LETTERS[unit_last]}"
+    )
+
+
+def encode_many(postcodes, validator_class=UKPostcode):
+    """
+    ``array("I")`` of the keys of an iterable of raw postcodes validated by `UKPostcode.validate_many`,
+    with `INVALID_KEY` for invalid ones. ``numpy.frombuffer(keys, dtype=numpy.uint32)`` views it in NumPy.
+    """
+    keys = array("I")
+    for validated_postcode, _ in validator_class.validate_many(postcodes):
+        if validated_postcode is None:
+            keys.append(INVALID_KEY)
+        else:
+            outward, inward = validated_postcode.split(" ")
+            keys.append(encode_codes(outward, inward))
+
+    return keys
+
+
+def decode_many(keys):
+    """Yield the `ValidatedPostcode` of each key of an iterable, or None for `INVALID_KEY`."""
+    for key in keys:
+        yield None if key == INVALID_KEY else decode(key)
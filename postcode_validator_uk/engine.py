@@ -0,0 +1,161 @@
+from functools import lru_cache
+
+from . import constants
+from .rules import LazyRegex, PostcodeRule, raw_regex
+
+# `re` and the tables are imported on first use to keep the package import time low, see
+# benchmarks/bench_import.py
+FUSIBLE_ATTRS = ("outward", "inward")
+
+
+def _overrides(rule_class, attr_name):
+    return getattr(rule_class, attr_name).__func__ is not getattr(PostcodeRule, attr_name).__func__
+
+
+def is_stateless(rule_class):
+    """
+    Whether a rule can be checked through `PostcodeRule.check` instead of being instantiated, which only
+    knows the outward and inward codes.
+    """
+    if not isinstance(rule_class, type) or not issubclass(rule_class, PostcodeRule):
+        return False
+
+    return rule_class.validate is PostcodeRule.validate and rule_class.attr_applied in FUSIBLE_ATTRS
+
+
+def is_fusible(rule_class):
+    """Whether a rule follows the regex protocol of `PostcodeRule` closely enough to be fused."""
+    if not is_stateless(rule_class):
+        return False
+
+    if _overrides(rule_class, "check") or _overrides(rule_class, "check_value"):
+        return False
+
+    import re
+
+    regexes = (raw_regex(rule_class, "applied_areas_regex"), raw_regex(rule_class, "rule_regex"))
+    return all(
+        (isinstance(regex, LazyRegex) or (isinstance(regex, re.Pattern) and regex.flags == re.UNICODE))
+        and not _refers_to_groups(regex.pattern)
+        for regex in regexes
+    )
+
+
+def _refers_to_groups(pattern):
+    """
+    Whether a pattern has named groups or backreferences, which would clash with or be renumbered by the
+    groups of the other patterns once fused.
+    """
+    import re
+
+    try:
+        from re import _parser as sre_parse  # Python 3.11+
+    except ImportError:
+        import sre_parse
+
+    if re.compile(pattern).groupindex:
+        return True
+
+    group_references = (sre_parse.GROUPREF, sre_parse.GROUPREF_EXISTS)
+    items = list(sre_parse.parse(pattern))
+    while items:
+        item = items.pop()
+        if isinstance(item, (tuple, list, sre_parse.SubPattern)):
+            if item and item[0] in group_references:
+                return True
+
+            items.extend(item)
+
+    return False
+
+
+def fuse_rules(rules):
+    """
+    Build a single regex that matches a value only when every rule accepts it.
+
+    A rule rejects a value when its ``applied_areas_regex`` matches and its ``rule_regex`` doesn't, so each
+    rule becomes a ``(?!(?=applied)(?!rule))`` lookahead evaluated at the start of the value, which keeps the
+    anchors of the original patterns meaning the same thing.
+    """
+    import re
+
+    regexes = ((raw_regex(rule, "applied_areas_regex"), raw_regex(rule, "rule_regex")) for rule in rules)
+    lookaheads = (f"(?!(?={applied.pattern})(?!{regex.pattern}))" for applied, regex in regexes)
+    return re.compile("".join(lookaheads))
+
+
+class RuleEngine:
+    """
+    Rules list compiled into one fused regex for the outward code and one for the inward code.
+
+    The rule classes remain the source of truth: the fused regexes are generated from their patterns, and
+    when the packaged validity tables were generated from the same rules they replace the regexes with two
+    lookups, and the fused regexes are only compiled when needed. Outward and inward rules that can't be
+    fused but keep `PostcodeRule.validate` are checked through their stateless `check`, and any other rule
+    is kept in `legacy_rules` to be instantiated and validated the old way.
+    """
+
+    def __init__(self, rules_list):
+        from .tables import load_packaged_tables
+
+        self.rules_list = tuple(rules_list)
+        self.fused_rules = tuple(rule for rule in self.rules_list if is_fusible(rule))
+        self.stateless_rules = tuple(
+            rule for rule in self.rules_list if is_stateless(rule) and rule not in self.fused_rules
+        )
+        self.legacy_rules = tuple(rule for rule in self.rules_list if not is_stateless(rule))
+        self._checked_rules = tuple(rule for rule in self.rules_list if is_stateless(rule))
+        self.format_regex = constants.UK_POSTCODE_VALIDATION_REGEX
+        self.tables = load_packaged_tables(self)
+        self._outward_regex = self._inward_regex = None
+        if self.tables is None:
+            self._compile_fused_rules()
+
+    @property
+    def outward_regex(self):
+        if self._outward_regex is None:
+            self._compile_fused_rules()
+
+        return self._outward_regex
+
+    @property
+    def inward_regex(self):
+        if self._inward_regex is None:
+            self._compile_fused_rules()
+
+        return self._inward_regex
+
+    def _compile_fused_rules(self):
+        self._outward_regex = fuse_rules(rule for rule in self.fused_rules if rule.attr_applied == "outward")
+        self._inward_regex = fuse_rules(rule for rule in self.fused_rules if rule.attr_applied == "inward")
+
+    def match(self, outward, inward):
+        if self.tables is not None:
+            if not self.tables.match(outward, inward):
+                return False
+        elif not (self._outward_regex.match(outward) and self._inward_regex.match(inward)):
+            return False
+
+        for rule in self.stateless_rules:
+            if not rule.check(outward, inward):
+                return False
+
+        return True
+
+    def failed_rule(self, outward, inward):
+        """Name of the first non legacy rule rejecting the postcode, or None when all of them accept it."""
+        for rule in self._checked_rules:
+            if not rule.check(outward, inward):
+                return rule.__name__
+
+        return None
+
+
+@lru_cache(maxsize=32)
+def _compile_rules(rules_list):
+    return RuleEngine(rules_list)
+
+
+def compile_rules(rules_list):
+    """Return the (cached) `RuleEngine` for a rules list."""
+    return _compile_rules(tuple(rules_list))
@@ -4,5 +4,7 @@ class PostcodeNotValidated(Exception):
 
 
 class InvalidPostcode(Exception):
-    def __init__(self, message=None):
+    def __init__(self, message=None, rule=None, position=None):
         super().__init__("Invalid postcode!")
+        self.rule = rule
+        self.position = position
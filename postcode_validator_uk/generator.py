@@ -0,0 +1,105 @@
+"""
+Seeded streams of postcodes for test corpora and load testing: valid postcodes, accepted by every rule of a
+validator class, and invalid ones failing validation with a given rule, or with `UK_POSTCODE_FORMAT_ERROR`.
+
+Postcodes are drawn from pools of every outward and inward code, sorted by the rules rejecting them, so
+streams never hold more than the pools in memory. Rules have to be stateless outward or inward rules,
+as the `PostcodeRule` ones are.
+"""
+import itertools
+import random
+from functools import lru_cache
+
+from . import constants
+from .constants import UK_POSTCODE_FORMAT_ERROR
+from .engine import is_stateless
+from .tables import DIGITS, LETTERS, all_inwards, all_outwards
+from .validators import UKPostcode
+
+# characters of the edits making valid postcodes into ones that don't match the expected format
+FORMAT_EDIT_CHARS = DIGITS + LETTERS + " -"
+
+
+@lru_cache(maxsize=32)
+def _pools(rules_list):
+    """Outward and inward codes by the tuple of the names of the rules rejecting them, empty for accepted ones."""
+    pools = []
+    for attr_applied, codes in (("outward", all_outwards()), ("inward", all_inwards())):
+        rules = [rule for rule in rules_list if rule.attr_applied == attr_applied]
+        pool = {}
+        for code in codes:
+            # stateless rules only check the code they're applied to
+            errors = tuple(rule.__name__ for rule in rules if not rule.check(code, code))
+            pool.setdefault(errors, []).append(code)
+        pools.append(pool)
+
+    return tuple(pools)
+
+
+def _rule_pools(validator_class):
+    rules_list = tuple(validator_class._rules_list)
+    for rule in rules_list:
+        if not is_stateless(rule):
+            raise ValueError(f"{getattr(rule, '__name__', rule)} isn't a stateless outward or inward rule")
+
+    return _pools(rules_list)
+
+
+def _limited(postcodes, count):
+    return postcodes if count is None else itertools.islice(postcodes, count)
+
+
+def all_valid_postcodes(validator_class=UKPostcode):
+    """Yield every postcode the validator class accepts, in lexical order."""
+    outwards, inwards = _rule_pools(validator_class)
+    for outward in sorted(outwards.get((), ()), key=lambda outward: f"{outward} "):
+        for inward in inwards.get((), ()):
+            yield f"{outward} {inward}"
+
+
+def valid_postcodes(count=None, seed=None, validator_class=UKPostcode):
+    """Yield ``count`` random valid postcodes, endlessly when it's None, drawn uniformly with ``seed``."""
+    outwards, inwards = _rule_pools(validator_class)
+    valid_outwards, valid_inwards = outwards.get(()), inwards.get(())
+    if not valid_outwards or not valid_inwards:
+        raise ValueError("No postcode is valid according to the rules")
+
+    choice = random.Random(seed).choice
+    return _limited((f"{choice(valid_outwards)} {choice(valid_inwards)}" for _ in itertools.count()), count)
+
+
+def _format_errors(randomizer, postcodes):
+    format_regex = constants.UK_POSTCODE_VALIDATION_REGEX
+    for postcode in postcodes:
+        while format_regex.match(postcode):
+            position = randomizer.randrange(len(postcode) + 1)
+            edit = randomizer.choice((0, 1, 2)) if position < len(postcode) else 2
+            replacement = "" if edit == 0 else randomizer.choice(FORMAT_EDIT_CHARS)
+            # 0 deletes the character at the position, 1 substitutes it and 2 inserts before it
+            postcode = f"{postcode[:position]}{replacement}{postcode[position + (edit != 2):]}"
+
+        yield postcode
+
+
+def invalid_postcodes(rule, count=None, seed=None, validator_class=UKPostcode):
+    """
+    Yield ``count`` random postcodes, endlessly when it's None, failing validation with ``rule``, a rule
+    class of the validator class or its name, or with `UK_POSTCODE_FORMAT_ERROR` when it's that, drawn with
+    ``seed``. Postcodes rejected by a rule fail no other rule, format errors are edited valid postcodes.
+    """
+    name = getattr(rule, "__name__", rule)
+    outwards, inwards = _rule_pools(validator_class)
+    randomizer = random.Random(seed)
+    if name == UK_POSTCODE_FORMAT_ERROR:
+        valid = valid_postcodes(seed=randomizer.random(), validator_class=validator_class)
+        return _limited(_format_errors(randomizer, valid), count)
+
+    if not any(name in errors for pool in (outwards, inwards) for errors in pool):
+        raise ValueError(f"No postcode fails validation with {name}")
+
+    outward_pool, inward_pool = outwards.get((name,), outwards.get(())), inwards.get((name,), inwards.get(()))
+    if ((name,) not in outwards and (name,) not in inwards) or not outward_pool or not inward_pool:
+        raise ValueError(f"No otherwise valid postcode fails validation with {name}")
+
+    choice = randomizer.choice
+    return _limited((f"{choice(outward_pool)} {choice(inward_pool)}" for _ in itertools.count()), count)
@@ -0,0 +1,75 @@
+import threading
+import time
+
+from .constants import UK_POSTCODE_FORMAT_ERROR
+
+
+class Instrumentation:
+    """
+    Opt-in counters and cumulative nanosecond timings of the validation stages: normalisation, format regex
+    and each rule, enabled with ``UKPostcode.instrumentation = Instrumentation()``.
+
+    To attribute time to each rule, instrumented validations check the rules one by one instead of through
+    the fused regexes or tables, with the same outcome.
+    """
+
+    def __init__(self):
+        self._stages = {}
+        self._lock = threading.Lock()
+
+    def snapshot(self):
+        """Plain dict of ``{stage: {"calls": int, "ns": int}}``, ready to be exported."""
+        with self._lock:
+            return {stage: {"calls": calls, "ns": ns} for stage, (calls, ns) in self._stages.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+
+    def _record(self, timings):
+        with self._lock:
+            for stage, elapsed in timings:
+                calls, ns = self._stages.get(stage, (0, 0))
+                self._stages[stage] = (calls + 1, ns + elapsed)
+
+    def check(self, validator_class, raw_postcode, engine, instance=None):
+        """Instrumented equivalent of `UKPostcode._check`, returning the same ``(groups, error)`` outcome."""
+        clock = time.perf_counter_ns
+        timings = []
+        try:
+            start = clock()
+            postcode = raw_postcode.upper()
+            normalised = clock()
+            timings.append(("normalisation", normalised - start))
+            postcode_matchs = engine.format_regex.match(postcode)
+            timings.append(("format", clock() - normalised))
+            if not postcode_matchs:
+                return None, UK_POSTCODE_FORMAT_ERROR
+
+            groups = postcode_matchs.groups()
+            return groups, self._failed_rule(validator_class, raw_postcode, groups, engine, timings, instance)
+        finally:
+            timings.append(("total", clock() - start))
+            self._record(timings)
+
+    def _failed_rule(self, validator_class, raw_postcode, groups, engine, timings, instance):
+        clock = time.perf_counter_ns
+        outward, inward = groups[0], groups[3]
+        for rule_class in engine.rules_list:
+            if rule_class in engine.legacy_rules:
+                continue
+
+            start = clock()
+            accepted = rule_class.check(outward, inward)
+            timings.append((f"rule:{rule_class.__name__}", clock() - start))
+            if not accepted:
+                return rule_class.__name__
+
+        for rule_class in engine.legacy_rules:
+            start = clock()
+            error = validator_class._failed_legacy_rule((rule_class,), raw_postcode, groups, instance)
+            timings.append((f"rule:{rule_class.__name__}", clock() - start))
+            if error is not None:
+                return error
+
+        return None
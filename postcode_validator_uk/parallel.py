@@ -0,0 +1,67 @@
+"""Bulk validation sharded across a process pool."""
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from .directory import PostcodeDirectory
+from .validators import UKPostcode
+
+
+@lru_cache(maxsize=None)
+def _worker_validator(validator_class, rules_list, directory_path):
+    # the parent's rules list and directory are sent along, workers may not share its class state. Forked
+    # workers inherit its instrumentation, rejections and cache, which would be filled in throwaway copies
+    directory = None if directory_path is None else PostcodeDirectory(directory_path)
+    class_state = {
+        "_rules_list": rules_list,
+        "directory": directory,
+        "instrumentation": None,
+        "rejections": None,
+        "cache": None,
+    }
+    return type(validator_class.__name__, (validator_class,), class_state)
+
+
+def _validate_chunk(validator_class, rules_list, directory_path, chunk):
+    return list(_worker_validator(validator_class, rules_list, directory_path).validate_many(chunk))
+
+
+def validate_many_parallel(postcodes, workers=None, chunk_size=10000, validator_class=UKPostcode):
+    """
+    Validate an iterable of raw postcodes in a pool of ``workers`` processes, yielding the same
+    ``(validated_postcode, error)`` tuples as `UKPostcode.validate_many`, in input order.
+
+    Postcodes are sent to workers in chunks of ``chunk_size`` to amortise inter process communication, and
+    only a couple of chunks per worker are in flight at a time, so the input is consumed lazily.
+    Rejections are counted in ``validator_class.rejections`` when it's set, as by `UKPostcode.validate_many`.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive number")
+
+    workers = workers or os.cpu_count() or 1
+    rules_list = tuple(validator_class._rules_list)
+    directory_path = None if validator_class.directory is None else validator_class.directory.path
+    # workers count rejections in their own copy of the class state, they're counted here instead
+    rejections = validator_class.rejections
+    postcodes = iter(postcodes)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        while True:
+            while len(pending) < workers * 2:
+                chunk = [f"{postcode}" for postcode in itertools.islice(postcodes, chunk_size)]
+                if not chunk:
+                    break
+
+                pending.append(
+                    executor.submit(_validate_chunk, validator_class, rules_list, directory_path, chunk)
+                )
+
+            if not pending:
+                return
+
+            results = pending.popleft().result()
+            if rejections is not None:
+                rejections.update(error for _, error in results if error is not None)
+            yield from results
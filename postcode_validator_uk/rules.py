@@ -1,8 +1,35 @@
-import re
-
 from .exceptions import InvalidPostcode
 
 
+class LazyRegex:
+    """
+    Regex class attribute compiled on its first access, when it replaces itself on its class by the
+    compiled regex. Importing the rules compiles nothing.
+    """
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+
+    def __set_name__(self, owner, name):
+        self.owner, self.name = owner, name
+
+    def __get__(self, instance, owner):
+        import re
+
+        regex = re.compile(self.pattern)
+        setattr(self.owner, self.name, regex)
+        return regex
+
+
+def raw_regex(rule_class, attr_name):
+    """A rule regex attribute as defined, without compiling it when it's still a `LazyRegex`."""
+    for klass in rule_class.__mro__:
+        if attr_name in vars(klass):
+            return vars(klass)[attr_name]
+
+    return None
+
+
 class PostcodeRule:
     attr_applied = None
     applied_areas_regex = None
@@ -11,15 +38,31 @@ class PostcodeRule:
     def __init__(self, postcode):
         self.postcode = postcode
 
+    @classmethod
+    def check(cls, outward, inward):
+        """Stateless version of `validate`: whether the rule accepts the given outward and inward codes."""
+        attr_applied = cls.attr_applied
+        postcode_attr_value = (
+            outward if attr_applied == "outward" else inward if attr_applied == "inward" else None
+        )
+        if not postcode_attr_value:
+            raise AttributeError(f"This entity has not attr {cls.attr_applied}")
+
+        return cls.check_value(postcode_attr_value)
+
+    @classmethod
+    def check_value(cls, value):
+        if not cls.applied_areas_regex.match(value):
+            return True
+
+        return bool(cls.rule_regex.match(value))
+
     def validate(self):
         postcode_attr_value = getattr(self.postcode, self.attr_applied, None)
         if not postcode_attr_value:
             raise AttributeError(f"This entity has not attr {self.attr_applied}")
 
-        if not self.applied_areas_regex.match(postcode_attr_value):
-            return
-
-        if not self.rule_regex.match(postcode_attr_value):
+        if not self.check_value(postcode_attr_value):
             raise InvalidPostcode
 
 
@@ -30,16 +73,16 @@ class SingleDigitDistrict(PostcodeRule):
     """
 
     attr_applied = "outward"
-    applied_areas_regex = re.compile(r"^(BR|FY|HA|HD|HG|HR|HS|HX|JE|LD|SM|SR|WC|WN|ZE)")
-    rule_regex = re.compile(r"^(?!WC)[A-Z]{2}[0-9]$|^WC[0-9][A-Z]$")
+    applied_areas_regex = LazyRegex(r"^(BR|FY|HA|HD|HG|HR|HS|HX|JE|LD|SM|SR|WC|WN|ZE)")
+    rule_regex = LazyRegex(r"^(?!WC)[A-Z]{2}[0-9]$|^WC[0-9][A-Z]$")
 
 
 class DoubleDigitDistrict(PostcodeRule):
     """Areas with only double-digit districts: AB, LL, SO"""
 
     attr_applied = "outward"
-    applied_areas_regex = re.compile(r"^(AB|LL|SO)")
-    rule_regex = re.compile(r"^[A-Z]{2}[0-9]{2}$")
+    applied_areas_regex = LazyRegex(r"^(AB|LL|SO)")
+    rule_regex = LazyRegex(r"^[A-Z]{2}[0-9]{2}$")
 
 
 class ZeroOrTenDistrict(PostcodeRule):
@@ -49,8 +92,8 @@ class ZeroOrTenDistrict(PostcodeRule):
     """
 
     attr_applied = "outward"
-    applied_areas_regex = re.compile(r"^[A-Z]{2}(0|10)$")
-    rule_regex = re.compile(r"^(BL|BS|CM|CR|FY|HA|PR|SL|SS)0$|^BS10$")
+    applied_areas_regex = LazyRegex(r"^[A-Z]{2}(0|10)$")
+    rule_regex = LazyRegex(r"^(BL|BS|CM|CR|FY|HA|PR|SL|SS)0$|^BS10$")
 
 
 class CentralLondonDistrict(PostcodeRule):
@@ -61,8 +104,8 @@ class CentralLondonDistrict(PostcodeRule):
     """
 
     attr_applied = "outward"
-    applied_areas_regex = re.compile(r"^(EC[0-9]|E1|N1|NW1|SE1|SW1|W1|WC1|WC2)[A-Z]")
-    rule_regex = re.compile(
+    applied_areas_regex = LazyRegex(r"^(EC[0-9]|E1|N1|NW1|SE1|SW1|W1|WC1|WC2)[A-Z]")
+    rule_regex = LazyRegex(
         r"^EC[1-4][A-Z]?$|^E1[W]?$|^N1[C|P]?$|^NW1[W]?$|^SE1[P]?$|^SW1[A-Z]?$|^W1[A-Z]?$|^WC[1-2][A-Z]?$"
     )
 
@@ -71,16 +114,16 @@ class FirstLetter(PostcodeRule):
     """The letters Q, V and X are not used in the first position."""
 
     attr_applied = "outward"
-    applied_areas_regex = re.compile(r"^(Q|V|X)")
-    rule_regex = re.compile(r"^(?!Q|V|X).*")
+    applied_areas_regex = LazyRegex(r"^(Q|V|X)")
+    rule_regex = LazyRegex(r"^(?!Q|V|X).*")
 
 
 class SecondLetter(PostcodeRule):
     """The letters I, J and Z are not used in the second position."""
 
     attr_applied = "outward"
-    applied_areas_regex = re.compile(r"^[A-Z](I|J|Z)")
-    rule_regex = re.compile(r"^[A-Z](?!I|J|Z).*")
+    applied_areas_regex = LazyRegex(r"^[A-Z](I|J|Z)")
+    rule_regex = LazyRegex(r"^[A-Z](?!I|J|Z).*")
 
 
 class ThirdLetter(PostcodeRule):
@@ -90,8 +133,8 @@ class ThirdLetter(PostcodeRule):
     """
 
     attr_applied = "outward"
-    applied_areas_regex = re.compile(r"^[A-Z][0-9][A-Z]$")
-    rule_regex = re.compile(r"^[A-Z][0-9](A|B|C|D|E|F|G|H|J|K|P|S|T|U|W)$")
+    applied_areas_regex = LazyRegex(r"^[A-Z][0-9][A-Z]$")
+    rule_regex = LazyRegex(r"^[A-Z][0-9](A|B|C|D|E|F|G|H|J|K|P|S|T|U|W)$")
 
 
 class FourthLetter(PostcodeRule):
@@ -101,8 +144,8 @@ class FourthLetter(PostcodeRule):
     """
 
     attr_applied = "outward"
-    applied_areas_regex = re.compile(r"^[A-Z]{2}[0-9][A-Z]$")
-    rule_regex = re.compile(r"^[A-Z]{2}[0-9](A|B|E|H|M|N|P|R|V|W|X|Y)$")
+    applied_areas_regex = LazyRegex(r"^[A-Z]{2}[0-9][A-Z]$")
+    rule_regex = LazyRegex(r"^[A-Z]{2}[0-9](A|B|E|H|M|N|P|R|V|W|X|Y)$")
 
 
 class LastTwoLetter(PostcodeRule):
@@ -112,5 +155,5 @@ class LastTwoLetter(PostcodeRule):
     """
 
     attr_applied = "inward"
-    applied_areas_regex = re.compile(r"^[0-9][A-Z]{2}$")
-    rule_regex = re.compile(r"^[0-9][A|B|D|E|F|G|H|J|L|N|P|Q|R|S|T|U|W|X|Y|Z]{2}$")
+    applied_areas_regex = LazyRegex(r"^[0-9][A-Z]{2}$")
+    rule_regex = LazyRegex(r"^[0-9][A|B|D|E|F|G|H|J|L|N|P|Q|R|S|T|U|W|X|Y|Z]{2}$")
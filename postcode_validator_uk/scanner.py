@@ -0,0 +1,37 @@
+"""Extraction of the valid postcodes found in free text."""
+from collections import namedtuple
+
+from . import constants
+from .engine import compile_rules
+from .validators import UKPostcode
+
+
+class PostcodeMatch(namedtuple("PostcodeMatch", ("postcode", "start", "end"))):
+    """A valid postcode found in text: its normalised value and the ``[start, end)`` span of the text."""
+
+    __slots__ = ()
+
+
+def scan(text, validator_class=UKPostcode, offset=0):
+    """
+    Lazily yield a `PostcodeMatch` per valid postcode of a text, in a single pass of
+    `UK_POSTCODE_SCAN_REGEX`. Matches failing the rules are skipped, and spans are shifted by ``offset``.
+    """
+    engine = compile_rules(validator_class._rules_list)
+    get_outcome = validator_class._get_outcome
+    for postcode_matchs in constants.UK_POSTCODE_SCAN_REGEX.finditer(text):
+        outward, inward = postcode_matchs.group("outward", "inward")
+        postcode = f"{outward} {inward}".upper()
+        if get_outcome(postcode, engine)[1] is None:
+            yield PostcodeMatch(postcode, offset + postcode_matchs.start(), offset + postcode_matchs.end())
+
+
+def scan_file(text_file, validator_class=UKPostcode):
+    """
+    Lazily yield a `PostcodeMatch` per valid postcode of a text file, read line by line as postcodes
+    don't span lines, with spans counted from the start of the file.
+    """
+    offset = 0
+    for line in text_file:
+        yield from scan(line, validator_class, offset)
+        offset += len(line)
@@ -0,0 +1,110 @@
+import itertools
+import sys
+
+from . import constants
+from .tables import LETTERS
+from .validators import UKPostcode, ValidatedPostcode
+
+UNITS = tuple(map("".join, itertools.product(LETTERS, repeat=2)))
+_UNIT_INDEXES = {unit: index for index, unit in enumerate(UNITS)}
+
+
+def _unit_indexes(bitmap):
+    while bitmap:
+        lowest_bit = bitmap & -bitmap
+        yield lowest_bit.bit_length() - 1
+        bitmap ^= lowest_bit
+
+
+class PostcodeSet:
+    """
+    Set of validated postcodes indexed by their components: a trie of areas, districts and sectors, the
+    units of a sector being the bits of an integer. Membership is tested and iteration done at any level,
+    from area to unit, with prefixes like ``"EC"``, ``"EC1A"``, ``"EC1A 1"`` or ``"EC1A 1BB"``.
+
+    Raw postcodes are added through the validator class `parse`, raising `InvalidPostcode` for invalid
+    ones, and `ValidatedPostcode` values as they are.
+    """
+
+    def __init__(self, postcodes=(), validator_class=UKPostcode):
+        self.validator_class = validator_class
+        self._areas = {}
+        self._length = 0
+        self.update(postcodes)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return self.iter_prefix("")
+
+    def __contains__(self, prefix):
+        components = self._components(prefix)
+        if not components:
+            return components is not None and self._length > 0
+
+        node = self._areas
+        for component in components[:3]:
+            node = node.get(component)
+            if node is None:
+                return False
+
+        if len(components) < 4:
+            return True
+
+        return bool(node >> _UNIT_INDEXES[components[3]] & 1)
+
+    def add(self, postcode):
+        if not isinstance(postcode, ValidatedPostcode):
+            postcode = self.validator_class.parse(postcode)
+
+        area, district, sector, unit = postcode
+        districts = self._areas.get(area)
+        if districts is None:
+            districts = self._areas[sys.intern(area)] = {}
+        sectors = districts.get(district)
+        if sectors is None:
+            sectors = districts[sys.intern(district)] = {}
+
+        units = sectors.get(sector, 0)
+        unit_bit = 1 << _UNIT_INDEXES[unit]
+        if not units & unit_bit:
+            sectors[sys.intern(sector)] = units | unit_bit
+            self._length += 1
+
+    def update(self, postcodes):
+        for postcode in postcodes:
+            self.add(postcode)
+
+    def iter_prefix(self, prefix):
+        """Yield the `ValidatedPostcode` values of the set starting with a prefix, in sorted order."""
+        components = self._components(prefix)
+        if components is None:
+            return
+
+        areas = self._areas
+        for area in sorted(areas) if not components else [components[0]]:
+            districts = areas.get(area, {})
+            for district in sorted(districts) if len(components) < 2 else [components[1]]:
+                sectors = districts.get(district, {})
+                for sector in sorted(sectors) if len(components) < 3 else [components[2]]:
+                    units = sectors.get(sector, 0)
+                    if len(components) == 4:
+                        units &= 1 << _UNIT_INDEXES[components[3]]
+                    for unit_index in _unit_indexes(units):
+                        yield ValidatedPostcode(area, district, sector, UNITS[unit_index])
+
+    @staticmethod
+    def _components(prefix):
+        """Components of a postcode or of a prefix of one, None when it's not one."""
+        if isinstance(prefix, ValidatedPostcode):
+            return tuple(prefix)
+
+        if prefix == "":
+            return ()
+
+        prefix_matchs = constants.UK_POSTCODE_PREFIX_REGEX.match(f"{prefix}".upper())
+        if not prefix_matchs:
+            return None
+
+        return tuple(component for component in prefix_matchs.groups() if component is not None)
@@ -0,0 +1,167 @@
+"""
+Precomputed tables of every outward and inward code accepted by the rules.
+
+The tables are bitmaps indexed by the outward code characters, blank padded to 4 and each valued from 0
+(blank) to 36, and by the inward code sector and unit letters. They're generated from the rule classes and
+the ones of `UK_POSTCODE_RULES_LIST` are packaged, rebuild them after changing the rules with:
+
+    python -m postcode_validator_uk.tables
+"""
+import itertools
+import os
+import zlib
+from functools import lru_cache
+
+from .constants import UK_POSTCODE_RULES_LIST
+from .rules import raw_regex
+
+TABLES_PATH = os.path.join(os.path.dirname(__file__), "data", "tables.bin")
+TABLES_MAGIC = b"PCVUKTB1"
+FINGERPRINT_SIZE = 4
+# not taken from `string`, which imports `re`, see benchmarks/bench_import.py
+DIGITS = "0123456789"
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+OUTWARD_CHARS = " " + DIGITS + LETTERS
+OUTWARD_BASE = len(OUTWARD_CHARS)
+OUTWARDS_SIZE = pow(OUTWARD_BASE, 4)
+UNIT_BASE = len(LETTERS)
+INWARDS_SIZE = 10 * UNIT_BASE * UNIT_BASE
+
+
+@lru_cache(maxsize=None)
+def _index_maps():
+    """
+    Maps of the outward code first 2 characters, of its (up to 2) last ones, of the sector and of the unit
+    to their part of the index. They're built on first use to keep the import time low.
+    """
+    outward_prefixes = {
+        f"{first}{second}": (OUTWARD_CHARS.index(first) * OUTWARD_BASE + OUTWARD_CHARS.index(second))
+        * OUTWARD_BASE
+        * OUTWARD_BASE
+        for first, second in itertools.product(LETTERS, OUTWARD_CHARS[1:])
+    }
+    outward_suffixes = {
+        suffix.rstrip(): OUTWARD_CHARS.index(suffix[0]) * OUTWARD_BASE + OUTWARD_CHARS.index(suffix[1])
+        for suffix in map("".join, itertools.product(OUTWARD_CHARS, repeat=2))
+        if suffix[0] != " " or suffix[1] == " "
+    }
+    sectors = {sector: index * UNIT_BASE * UNIT_BASE for index, sector in enumerate(DIGITS)}
+    units = {
+        f"{first}{last}": first_index * UNIT_BASE + last_index
+        for (first_index, first), (last_index, last) in itertools.product(enumerate(LETTERS), repeat=2)
+    }
+    return outward_prefixes, outward_suffixes, sectors, units
+
+
+def all_outwards():
+    """Every outward code matching `UK_POSTCODE_VALIDATION_REGEX`, valid according to the rules or not."""
+    areas = itertools.chain(LETTERS, map("".join, itertools.product(LETTERS, repeat=2)))
+    for area, digit in itertools.product(areas, DIGITS):
+        yield f"{area}{digit}"
+        for last in DIGITS + LETTERS:
+            yield f"{area}{digit}{last}"
+
+
+def all_inwards():
+    """Every inward code matching `UK_POSTCODE_VALIDATION_REGEX`, valid according to the rules or not."""
+    for sector, first, last in itertools.product(DIGITS, LETTERS, LETTERS):
+        yield f"{sector}{first}{last}"
+
+
+def outward_index(outward):
+    outward_prefixes, outward_suffixes, _, _ = _index_maps()
+    return outward_prefixes[outward[:2]] + outward_suffixes[outward[2:]]
+
+
+def inward_index(inward):
+    _, _, sectors, units = _index_maps()
+    return sectors[inward[:1]] + units[inward[1:]]
+
+
+def rules_fingerprint(rules):
+    """Fingerprint of the fusible rules patterns, telling whether tables were generated from them."""
+    patterns = []
+    for rule in rules:
+        applied, regex = raw_regex(rule, "applied_areas_regex"), raw_regex(rule, "rule_regex")
+        patterns.append(f"{rule.attr_applied}:{applied.pattern}:{regex.pattern}")
+
+    return zlib.crc32("\n".join(sorted(patterns)).encode()).to_bytes(FINGERPRINT_SIZE, "little")
+
+
+class ValidityTables:
+    """Bitmaps of the valid outward and inward codes, checking a postcode with two O(1) lookups."""
+
+    def __init__(self, fingerprint, outwards, inwards):
+        self.fingerprint = fingerprint
+        self.outwards = outwards
+        self.inwards = inwards
+        self._outward_prefixes, self._outward_suffixes, self._sectors, self._units = _index_maps()
+
+    @classmethod
+    def build(cls, engine):
+        """Generate the tables by running every outward and inward code through the engine fused regexes."""
+        outwards = bytearray(OUTWARDS_SIZE // 8 + 1)
+        for outward in filter(engine.outward_regex.match, all_outwards()):
+            index = outward_index(outward)
+            outwards[index >> 3] |= 1 << (index & 7)
+
+        inwards = bytearray(INWARDS_SIZE // 8 + 1)
+        for inward in filter(engine.inward_regex.match, all_inwards()):
+            index = inward_index(inward)
+            inwards[index >> 3] |= 1 << (index & 7)
+
+        return cls(rules_fingerprint(engine.fused_rules), bytes(outwards), bytes(inwards))
+
+    @classmethod
+    def load(cls, path=TABLES_PATH):
+        with open(path, "rb") as tables_file:
+            content = tables_file.read()
+
+        if not content.startswith(TABLES_MAGIC):
+            raise ValueError(f"{path} isn't a validity tables file")
+
+        fingerprint = content[len(TABLES_MAGIC) : len(TABLES_MAGIC) + FINGERPRINT_SIZE]
+        bitmaps = zlib.decompress(content[len(TABLES_MAGIC) + FINGERPRINT_SIZE :])
+        outwards_length = OUTWARDS_SIZE // 8 + 1
+        return cls(fingerprint, bitmaps[:outwards_length], bitmaps[outwards_length:])
+
+    def save(self, path=TABLES_PATH):
+        with open(path, "wb") as tables_file:
+            tables_file.write(
+                TABLES_MAGIC + self.fingerprint + zlib.compress(self.outwards + self.inwards, 9)
+            )
+
+    def match(self, outward, inward):
+        # indexes are computed inline, this is the validation hot path
+        try:
+            outward_bit = self._outward_prefixes[outward[:2]] + self._outward_suffixes[outward[2:]]
+            inward_bit = self._sectors[inward[:1]] + self._units[inward[1:]]
+        except KeyError:
+            return False
+
+        return (self.outwards[outward_bit >> 3] >> (outward_bit & 7)) & (
+            self.inwards[inward_bit >> 3] >> (inward_bit & 7)
+        ) & 1 == 1
+
+
+def load_packaged_tables(engine):
+    """Return the packaged tables when they were generated from the engine rules, None otherwise."""
+    if not engine.fused_rules or not os.path.exists(TABLES_PATH):
+        return None
+
+    tables = ValidityTables.load()
+    if tables.fingerprint != rules_fingerprint(engine.fused_rules):
+        return None
+
+    return tables
+
+
+def main():
+    from .engine import RuleEngine
+
+    ValidityTables.build(RuleEngine(UK_POSTCODE_RULES_LIST)).save()
+    print(f"Tables written to {TABLES_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,53 @@
-import re
-
-from .constants import (
-    UK_POSTCODE_AREA_REGEX,
-    UK_POSTCODE_DISTRICT_REGEX,
-    UK_POSTCODE_RULES_LIST,
-    UK_POSTCODE_SECTOR_REGEX,
-    UK_POSTCODE_UNIT_REGEX,
-    UK_POSTCODE_VALIDATION_REGEX,
-)
+import sys
+from collections import namedtuple
+
+from .constants import UK_POSTCODE_DIRECTORY_ERROR, UK_POSTCODE_FORMAT_ERROR, UK_POSTCODE_RULES_LIST
+from .engine import compile_rules
 from .exceptions import InvalidPostcode, PostcodeNotValidated
 
 
+class ValidatedPostcode(namedtuple("ValidatedPostcode", ("area", "district", "sector", "unit"))):
+    """Immutable, hashable and compact validated postcode, with its components split once at validation."""
+
+    __slots__ = ()
+
+    def __str__(self):
+        return self.postcode
+
+    @property
+    def outward(self):
+        return f"{self.area}{self.district}"
+
+    @property
+    def inward(self):
+        return f"{self.sector}{self.unit}"
+
+    @property
+    def postcode(self):
+        return f"{self.area}{self.district} {self.sector}{self.unit}"
+
+
+class ValidationResult(namedtuple("ValidationResult", ("valid", "postcode", "rule", "position"))):
+    """
+    Outcome of `UKPostcode.try_validate`: whether the postcode is valid, the normalised postcode when it
+    matches the expected format, the name of the failed rule class or `UK_POSTCODE_FORMAT_ERROR`, and with
+    `UKPostcode.diagnostics` enabled the index of the raw postcode character making it invalid.
+    """
+
+    __slots__ = ()
+
+
 class UKPostcode:
     raw_postcode = None
     validated_postcode = None
+    cache = None
+    diagnostics = False
+    rejections = None
+    instrumentation = None
+    directory = None
     _outward = None
     _inward = None
+    _components = None
     _rules_list = UK_POSTCODE_RULES_LIST
 
     def __init__(self, postcode):
@@ -40,29 +72,158 @@ class UKPostcode:
 
     @property
     def area(self):
-        return re.search(UK_POSTCODE_AREA_REGEX, self.outward).group()
+        return self.components().area
 
     @property
     def district(self):
-        return re.search(UK_POSTCODE_DISTRICT_REGEX, self.outward).group()
+        return self.components().district
 
     @property
     def sector(self):
-        return re.search(UK_POSTCODE_SECTOR_REGEX, self.inward).group()
+        return self.components().sector
 
     @property
     def unit(self):
-        return re.search(UK_POSTCODE_UNIT_REGEX, self.inward).group()
+        return self.components().unit
 
-    def validate(self):
-        postcode = self.raw_postcode.upper()
-        postcode_matchs = UK_POSTCODE_VALIDATION_REGEX.match(postcode)
-        if not postcode_matchs:
-            raise InvalidPostcode
+    def components(self):
+        """Return the area, district, sector and unit captured at validation as a `ValidatedPostcode`."""
+        if self._components is None:
+            raise PostcodeNotValidated
 
-        self._outward, self._inward = postcode_matchs.groups()
-        self.validated_postcode = f"{self._outward} {self._inward}"
+        return self._components
 
-        for rule_class in self._rules_list:
-            rule = rule_class(self)
-            rule.validate()
+    def validate(self):
+        result = self.try_validate()
+        if not result.valid:
+            raise InvalidPostcode(rule=result.rule, position=result.position)
+
+    def try_validate(self):
+        """Validate the postcode like `validate`, returning a `ValidationResult` instead of raising."""
+        engine = compile_rules(self._rules_list)
+        # legacy rules are validated against this instance, which may hold state they rely on
+        groups, error = self._get_outcome(self.raw_postcode, engine, self)
+        if groups is None:
+            return ValidationResult(False, None, error, self._reject(self.raw_postcode, error, engine))
+
+        outward, area, district, inward, sector, unit = groups
+        self._outward, self._inward = outward, inward
+        self._components = ValidatedPostcode(area, district, sector, unit)
+        self.validated_postcode = f"{outward} {inward}"
+        if error is not None:
+            position = self._reject(self.raw_postcode, error, engine)
+            return ValidationResult(False, self.validated_postcode, error, position)
+
+        return ValidationResult(True, self.validated_postcode, None, None)
+
+    def is_valid(self):
+        return self.try_validate().valid
+
+    @classmethod
+    def parse(cls, postcode):
+        """Validate a raw postcode into a `ValidatedPostcode`, raising `InvalidPostcode` when it's invalid."""
+        engine = compile_rules(cls._rules_list)
+        groups, error = cls._get_outcome(f"{postcode}", engine)
+        if error is not None:
+            raise InvalidPostcode(rule=error, position=cls._reject(f"{postcode}", error, engine))
+
+        # components have few distinct values, interning them lets millions of postcodes share the strings
+        _, area, district, _, sector, unit = groups
+        return ValidatedPostcode(sys.intern(area), sys.intern(district), sys.intern(sector), sys.intern(unit))
+
+    @classmethod
+    def validate_many(cls, postcodes):
+        """
+        Validate an iterable of raw postcodes, yielding a ``(validated_postcode, error)`` tuple per item.
+
+        Invalid items don't raise: they yield ``(None, error)``, where ``error`` is the name of the failed
+        rule class or `UK_POSTCODE_FORMAT_ERROR` when the postcode doesn't match the expected format.
+        """
+        engine = compile_rules(cls._rules_list)
+        get_outcome = cls._get_outcome if cls.cache is not None or cls.directory is not None else cls._check
+        rejections = cls.rejections
+
+        for raw_postcode in postcodes:
+            groups, error = get_outcome(f"{raw_postcode}", engine)
+            if error is None:
+                yield f"{groups[0]} {groups[3]}", None
+            else:
+                if rejections is not None:
+                    rejections[error] += 1
+                yield None, error
+
+    @classmethod
+    def _reject(cls, raw_postcode, error, engine):
+        """
+        Count a rejected postcode in `rejections` when it's set, and return the position of the character
+        making it invalid when `diagnostics` is enabled. Valid postcodes never get here.
+        """
+        if cls.rejections is not None:
+            cls.rejections[error] += 1
+        if not cls.diagnostics:
+            return None
+
+        from .diagnostics import error_position  # only imported when enabled, keeping the import time low
+
+        return error_position(raw_postcode, error, engine)
+
+    @classmethod
+    def _get_outcome(cls, raw_postcode, engine, postcode=None):
+        cache = cls.cache
+        # legacy rules may depend on the state of an instance, so their outcome isn't cached by the string
+        if cache is None or engine.legacy_rules:
+            outcome = cls._check(raw_postcode, engine, postcode)
+        else:
+            postcode = raw_postcode.upper()
+            outcome = cache.get(postcode, engine.rules_list)
+            if outcome is None:
+                outcome = cls._check(raw_postcode, engine)
+                cache.set(postcode, engine.rules_list, outcome)
+
+        # the directory is checked out of the cache, which only holds the outcome of the rules
+        groups, error = outcome
+        if error is None and cls.directory is not None and not cls.directory.contains(groups[0], groups[3]):
+            return groups, UK_POSTCODE_DIRECTORY_ERROR
+
+        return outcome
+
+    @classmethod
+    def _check(cls, raw_postcode, engine, postcode=None):
+        """
+        Return the ``(groups, error)`` outcome of validating a raw postcode, without raising. ``groups`` are
+        the outward, area, district, inward, sector and unit captured by `UK_POSTCODE_VALIDATION_REGEX`.
+
+        Legacy rules are validated against ``postcode`` when given, else against a new instance of the class.
+        """
+        if cls.instrumentation is not None:
+            return cls.instrumentation.check(cls, raw_postcode, engine, postcode)
+
+        postcode_matchs = engine.format_regex.match(raw_postcode.upper())
+        if not postcode_matchs:
+            return None, UK_POSTCODE_FORMAT_ERROR
+
+        groups = postcode_matchs.groups()
+        outward, inward = groups[0], groups[3]
+        if not engine.match(outward, inward):
+            return groups, engine.failed_rule(outward, inward)
+
+        if engine.legacy_rules:
+            return groups, cls._failed_legacy_rule(engine.legacy_rules, raw_postcode, groups, postcode)
+
+        return groups, None
+
+    @classmethod
+    def _failed_legacy_rule(cls, rules_list, raw_postcode, groups, postcode=None):
+        outward, area, district, inward, sector, unit = groups
+        if postcode is None:
+            postcode = cls(raw_postcode)
+        postcode._outward, postcode._inward = outward, inward
+        postcode._components = ValidatedPostcode(area, district, sector, unit)
+        postcode.validated_postcode = f"{outward} {inward}"
+        for rule_class in rules_list:
+            try:
+                rule_class(postcode).validate()
+            except InvalidPostcode:
+                return rule_class.__name__
+
+        return None
@@ -0,0 +1,139 @@
+"""
+Vectorised validation of NumPy and Arrow string arrays.
+
+Requires numpy, and pyarrow for Arrow arrays: ``pip install postcode-validator-uk[numpy]`` or
+``pip install postcode-validator-uk[arrow]``.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from .engine import compile_rules
+from .tables import INWARDS_SIZE, OUTWARD_BASE, OUTWARDS_SIZE, UNIT_BASE, ValidityTables
+from .validators import UKPostcode
+
+POSTCODE_MIN_WIDTH = 7
+
+
+@lru_cache(maxsize=8)
+def _validity_tables(engine):
+    """Boolean arrays of the outward and inward codes accepted by the engine, indexed as `ValidityTables`."""
+    tables = engine.tables or ValidityTables.build(engine)
+    outwards = np.unpackbits(np.frombuffer(tables.outwards, dtype=np.uint8), bitorder="little")
+    inwards = np.unpackbits(np.frombuffer(tables.inwards, dtype=np.uint8), bitorder="little")
+
+    return outwards[:OUTWARDS_SIZE].astype(bool), inwards[:INWARDS_SIZE].astype(bool)
+
+
+def _validate_scalar(validator_class, values):
+    results = validator_class.validate_many(values.tolist())
+    validated_postcodes = [validated_postcode or " " for validated_postcode, _ in results]
+    outward, _, inward = np.char.partition(np.array(validated_postcodes, dtype="<U8"), " ").T
+
+    return outward != "", outward.astype("<U4"), inward.astype("<U3")
+
+
+def _as_code_points(values):
+    """Return the values as a ``(rows, width)`` matrix of code points, zero padded to `POSTCODE_MIN_WIDTH`."""
+    width = values.dtype.itemsize // 4
+    codes = np.ascontiguousarray(values).view(np.uint32).reshape(len(values), width)
+    if width < POSTCODE_MIN_WIDTH:
+        codes = np.pad(codes, ((0, 0), (0, POSTCODE_MIN_WIDTH - width)))
+
+    return codes
+
+
+def validate_array(postcodes, validator_class=UKPostcode):
+    """
+    Validate a one dimensional array of raw postcodes, returning a boolean validity mask and the outward and
+    inward codes arrays, with empty strings for invalid postcodes.
+
+    It implements `UK_POSTCODE_VALIDATION_REGEX` with operations over the array of code points and checks
+    the rules through `ValidityTables` of every outward and inward code they accept. Values with non ASCII
+    characters or a trailing newline, rules lists that can't be tabulated, and validator classes with
+    instrumentation, a cache or a directory fall back to `UKPostcode.validate_many`.
+    """
+    values = np.asarray(postcodes).reshape(-1)
+    if values.dtype.kind != "U" or values.dtype.itemsize == 0:
+        values = np.array([f"{value}" for value in values.tolist()], dtype=str)
+
+    engine = compile_rules(validator_class._rules_list)
+    if (
+        validator_class.instrumentation is not None
+        or validator_class.cache is not None
+        or validator_class.directory is not None
+        or engine.stateless_rules
+        or engine.legacy_rules
+    ):
+        return _validate_scalar(validator_class, values)
+
+    codes = _as_code_points(values)
+    columns = np.arange(codes.shape[1])
+    lengths = ((codes != 0) * (columns + 1)).max(axis=1, initial=0)
+    # like the `$` of the format regex, a trailing newline is accepted, which is left to the scalar path
+    last_codes = np.take_along_axis(codes, np.maximum(lengths - 1, 0)[:, None], axis=1)[:, 0]
+    scalar_rows = (codes > 127).any(axis=1) | (last_codes == ord("\n"))
+    codes = np.where((codes >= ord("a")) & (codes <= ord("z")), codes - (ord("a") - ord("A")), codes)
+    is_letter = (codes >= ord("A")) & (codes <= ord("Z"))
+    is_digit = (codes >= ord("0")) & (codes <= ord("9"))
+
+    # the inward code is the last 3 characters, the outward code what is left before the spaces
+    inward_columns = np.clip(lengths[:, None] - 3 + np.arange(3), 0, codes.shape[1] - 1)
+    inward_codes = np.take_along_axis(codes, inward_columns, axis=1)
+    in_prefix = columns < (lengths[:, None] - 3)
+    outward_lengths = ((codes != ord(" ")) & in_prefix) * (columns + 1)
+    outward_lengths = outward_lengths.max(axis=1, initial=0)
+    in_outward = np.arange(4) < outward_lengths[:, None]
+    letter, digit = is_letter[:, :4], is_digit[:, :4]
+    alphanumeric = letter | digit
+
+    outward_format = np.select(
+        (outward_lengths == 2, outward_lengths == 3, outward_lengths == 4),
+        (
+            letter[:, 0] & digit[:, 1],
+            letter[:, 0] & ((digit[:, 1] & alphanumeric[:, 2]) | (letter[:, 1] & digit[:, 2])),
+            letter[:, 0] & letter[:, 1] & digit[:, 2] & alphanumeric[:, 3],
+        ),
+        default=False,
+    )
+    inward_format = (
+        (inward_codes[:, 0] >= ord("0"))
+        & (inward_codes[:, 0] <= ord("9"))
+        & ((inward_codes[:, 1:] >= ord("A")) & (inward_codes[:, 1:] <= ord("Z"))).all(axis=1)
+    )
+    matches_format = outward_format & inward_format
+
+    outward_codes = codes[:, :4].astype(np.int64)
+    outward_values = np.where(letter, outward_codes - ord("A") + 11, 0)
+    outward_values = np.where(digit, outward_codes - ord("0") + 1, outward_values)
+    outward_values = np.where(in_outward, outward_values, 0)
+    outward_indexes = (outward_values[:, 0] * OUTWARD_BASE + outward_values[:, 1]) * OUTWARD_BASE
+    outward_indexes = (outward_indexes + outward_values[:, 2]) * OUTWARD_BASE + outward_values[:, 3]
+    inward_values = inward_codes.astype(np.int64) - (ord("0"), ord("A"), ord("A"))
+    inward_indexes = (inward_values[:, 0] * UNIT_BASE + inward_values[:, 1]) * UNIT_BASE + inward_values[:, 2]
+    inward_indexes = np.where(matches_format, inward_indexes, 0)
+
+    outwards_table, inwards_table = _validity_tables(engine)
+    mask = matches_format & outwards_table[outward_indexes] & inwards_table[inward_indexes]
+
+    outward_codes = np.where(in_outward & mask[:, None], codes[:, :4], 0).astype(np.uint32)
+    inward_codes = np.where(mask[:, None], inward_codes, 0).astype(np.uint32)
+    outward = np.ascontiguousarray(outward_codes).view("<U4").reshape(-1)
+    inward = np.ascontiguousarray(inward_codes).view("<U3").reshape(-1)
+
+    if scalar_rows.any():
+        scalar_results = _validate_scalar(validator_class, values[scalar_rows])
+        mask[scalar_rows], outward[scalar_rows], inward[scalar_rows] = scalar_results
+
+    return mask, outward, inward
+
+
+def validate_arrow(postcodes, validator_class=UKPostcode):
+    """
+    Same as `validate_array` for an Arrow string array (or chunked array), returning Arrow arrays where
+    invalid postcodes have null outward and inward codes.
+    """
+    import pyarrow as pa
+
+    mask, outward, inward = validate_array(postcodes.to_numpy(zero_copy_only=False), validator_class)
+    return pa.array(mask), pa.array(outward, mask=~mask), pa.array(inward, mask=~mask)
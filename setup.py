@@ -34,14 +34,16 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     packages=setuptools.find_packages(),
+    package_data={"postcode_validator_uk": ["data/*.bin"]},
     install_requires=[],
+    extras_require={"numpy": ["numpy"], "arrow": ["numpy", "pyarrow"]},
+    entry_points={"console_scripts": ["postcode-validator-uk=postcode_validator_uk.cli:main"]},
     classifiers=[
         "Development Status :: 2 - Pre-Alpha",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
     ],
-    python_requires=">=3",
+    python_requires=">=3.7",
 )
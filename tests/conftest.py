@@ -1,5 +1,6 @@
 import pytest
 
+from postcode_validator_uk.constants import UK_POSTCODE_RULES_LIST
 from postcode_validator_uk.validators import UKPostcode
 
 
@@ -15,6 +16,13 @@ def uk_postcode_validator():
     return UKPostcode
 
 
+@pytest.fixture
+def uk_postcode_validator_with_rules():
+    UKPostcode._rules_list = UK_POSTCODE_RULES_LIST
+
+    return UKPostcode
+
+
 @pytest.fixture
 def uk_postcode_validator_instance(raw_uk_postcode, uk_postcode_validator):
     uk_postcode_validator_instance = uk_postcode_validator(raw_uk_postcode)
@@ -0,0 +1,102 @@
+import pickle
+from unittest import mock
+
+import pytest
+
+from postcode_validator_uk.aggregation import PostcodeAggregator
+from postcode_validator_uk.cache import ValidationCache
+from postcode_validator_uk.rules import FirstLetter
+
+RAW_POSTCODES = ["EC1A 1BB", "ec1a1bd", "EC1A 2AA", "EC2A 4NE", "M1 1AE", "M11 1AE", "QA1 1AA", "foo", None]
+
+
+@pytest.fixture
+def aggregator(uk_postcode_validator_with_rules):
+    aggregator = PostcodeAggregator()
+    aggregator.update(RAW_POSTCODES)
+
+    return aggregator
+
+
+def test_counts(aggregator):
+    assert aggregator.sectors() == {"EC1A 1": 2, "EC1A 2": 1, "EC2A 4": 1, "M1 1": 1, "M11 1": 1}
+    assert aggregator.districts() == {"EC1A": 3, "EC2A": 1, "M1": 1, "M11": 1}
+    assert aggregator.areas() == {"EC": 4, "M": 2}
+    assert aggregator.errors == {"FirstLetter": 1, "InvalidFormat": 2}
+
+
+def test_add(aggregator):
+    aggregator.add("EC1A 1BB")
+    aggregator.add("AB1 1AA")
+
+    assert aggregator.sectors()["EC1A 1"] == 3
+    assert aggregator.errors["DoubleDigitDistrict"] == 1
+
+
+def test_values_with_reducer(uk_postcode_validator_with_rules):
+    aggregator = PostcodeAggregator(reduce=max, initial=float("-inf"))
+
+    aggregator.update(["EC1A 1BB", "EC1A 1BD", "EC2A 4NE", "QA1 1AA"], [3, 7, 5, 99])
+
+    assert aggregator.sectors() == {"EC1A 1": 7, "EC2A 4": 5}
+    assert aggregator.areas() == {"EC": 7}
+
+
+def test_values_with_combine(uk_postcode_validator_with_rules):
+    aggregator = PostcodeAggregator(
+        reduce=lambda names, name: names | {name}, initial=frozenset(), combine=frozenset.union
+    )
+
+    aggregator.update(["EC1A 1BB", "EC1A 2AA", "EC1A 1BD"], ["a", "b", "a"])
+
+    assert aggregator.sectors() == {"EC1A 1": {"a"}, "EC1A 2": {"b"}}
+    assert aggregator.districts() == {"EC1A": {"a", "b"}}
+
+
+def test_merge(aggregator, uk_postcode_validator_with_rules):
+    other = PostcodeAggregator()
+    other.update(["EC1A 1BB", "W1A 0AX", "QA1 1AA", "AB1 1AA"])
+
+    assert aggregator.merge(other) is aggregator
+    assert aggregator.areas() == {"EC": 5, "M": 2, "W": 1}
+    assert aggregator.errors == {"FirstLetter": 2, "InvalidFormat": 2, "DoubleDigitDistrict": 1}
+    assert other.areas() == {"EC": 1, "W": 1}
+
+
+def test_merge_equals_single_pass(uk_postcode_validator_with_rules):
+    single_pass = PostcodeAggregator()
+    single_pass.update(RAW_POSTCODES * 3)
+    parts = [PostcodeAggregator() for _ in range(3)]
+    for part in parts:
+        part.update(RAW_POSTCODES)
+
+    merged = parts[0].merge(parts[1]).merge(parts[2])
+
+    assert merged.sectors() == single_pass.sectors()
+    assert merged.errors == single_pass.errors
+
+
+def test_pickle(aggregator):
+    unpickled = pickle.loads(pickle.dumps(aggregator))
+
+    assert unpickled.sectors() == aggregator.sectors()
+    assert unpickled.errors == aggregator.errors
+
+
+def test_uses_validator_rules(uk_postcode_validator):
+    uk_postcode_validator._rules_list = (FirstLetter,)
+    aggregator = PostcodeAggregator(validator_class=uk_postcode_validator)
+
+    aggregator.update(["AB1 1AA", "QA1 1AA"])
+
+    assert aggregator.areas() == {"AB": 1}
+    assert aggregator.errors == {"FirstLetter": 1}
+
+
+def test_uses_validator_cache(uk_postcode_validator_with_rules):
+    cache = ValidationCache()
+
+    with mock.patch.object(uk_postcode_validator_with_rules, "cache", cache):
+        PostcodeAggregator().update(["EC1A 1BB", "ec1a 1bb"])
+
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,69 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from postcode_validator_uk.aio import AsyncValidator, validate_async, validate_many_async
+
+from .factories import RuleFactory
+
+RAW_POSTCODES = ["EC1A 1BB", "QA1 1AA", "w1a0ax", "foo"]
+EXPECTED_RESULTS = [("EC1A 1BB", None), (None, "FirstLetter"), ("W1A 0AX", None), (None, "InvalidFormat")]
+
+
+@pytest.fixture(autouse=True)
+def uk_postcode_rules(uk_postcode_validator_with_rules):
+    return uk_postcode_validator_with_rules
+
+
+def test_validate_async():
+    assert asyncio.run(validate_async("ec1a 1bb")) == ("EC1A 1BB", None)
+
+
+def test_validate_many_async():
+    assert asyncio.run(validate_many_async(RAW_POSTCODES)) == EXPECTED_RESULTS
+
+
+def test_async_validator_coalesces_concurrent_calls(uk_postcode_rules):
+    validator = AsyncValidator()
+
+    async def validate_concurrently():
+        return await asyncio.gather(*(validator.validate(postcode) for postcode in RAW_POSTCODES))
+
+    validate_many = uk_postcode_rules.validate_many
+    with mock.patch.object(uk_postcode_rules, "validate_many", wraps=validate_many) as batch:
+        assert asyncio.run(validate_concurrently()) == EXPECTED_RESULTS
+
+    assert batch.call_count == 1
+
+
+def test_async_validator_flushes_full_batches(uk_postcode_rules):
+    validator = AsyncValidator(max_batch_size=3)
+
+    async def validate_concurrently():
+        return await asyncio.gather(*(validator.validate(postcode) for postcode in RAW_POSTCODES * 2))
+
+    validate_many = uk_postcode_rules.validate_many
+    with mock.patch.object(uk_postcode_rules, "validate_many", wraps=validate_many) as batch:
+        assert asyncio.run(validate_concurrently()) == EXPECTED_RESULTS * 2
+
+    assert batch.call_count == 3
+
+
+def test_async_validator_offloads_big_batches():
+    executor = mock.Mock(wraps=ThreadPoolExecutor(max_workers=1))
+    validator = AsyncValidator(offload_threshold=4, executor=executor)
+
+    assert asyncio.run(validator.validate_many(RAW_POSTCODES)) == EXPECTED_RESULTS
+    assert asyncio.run(validator.validate_many(RAW_POSTCODES[:3])) == EXPECTED_RESULTS[:3]
+    assert executor.submit.call_count == 1
+
+
+def test_async_validator_propagates_rules_errors(uk_postcode_validator):
+    RuleFactory.validate = mock.Mock(side_effect=ValueError)
+    uk_postcode_validator._rules_list = (RuleFactory,)
+    validator = AsyncValidator()
+
+    with pytest.raises(ValueError):
+        asyncio.run(validator.validate("EC1A 1BB"))
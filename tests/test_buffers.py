@@ -0,0 +1,165 @@
+import mmap
+import random
+import string
+from unittest import mock
+
+import pytest
+
+from postcode_validator_uk.buffers import validate_bytes_many, validate_column, validate_file
+from postcode_validator_uk.cache import ValidationCache
+from postcode_validator_uk.rules import FirstLetter
+from postcode_validator_uk.tables import all_outwards
+
+from .factories import RuleFactory
+
+RAW_POSTCODES = [
+    "EC1A 1BB",
+    "ec1a1bb",
+    "W1A  0AX",
+    "M1 1AE",
+    "B33 8TH",
+    "DN55 1PT",
+    "QA1 1AA",
+    "AB1 1AA",
+    "EC1A 1BC",
+    "",
+    "B338-TH5",
+    " EC1A 1BB",
+    "EC1A 1BB ",
+    "EC1A 1BB\n",
+    "EC1A 1BB\n\n",
+    "EC1A 1BB \n",
+    "E C1A 1BB",
+    "X" * 20,
+]
+RECORDS = b"0001 EC1A 1BB  ok\n0002 m11ae     ok\n0003 QA1 1AA   ok\n0004  W1A0AX   ok\n0005 B338-TH5  ok"
+
+
+def fuzzed_postcodes(seed, count=3000):
+    randomizer = random.Random(seed)
+    alphabet = string.ascii_uppercase + string.digits + "  abz\n"
+    for _ in range(count):
+        yield "".join(randomizer.choices(alphabet, k=randomizer.randint(0, 9)))
+
+
+def test_validate_bytes_many(uk_postcode_validator_with_rules):
+    raw_postcodes = [raw_postcode.encode() for raw_postcode in RAW_POSTCODES]
+
+    results = list(validate_bytes_many(raw_postcodes))
+
+    assert results == list(uk_postcode_validator_with_rules.validate_many(RAW_POSTCODES))
+
+
+def test_validate_bytes_many_with_bytes_like_objects(uk_postcode_validator_with_rules):
+    buffer = b"..EC1A 1BB.."
+    raw_postcodes = [memoryview(buffer)[2:10], bytearray(b"W1A 0AX"), mmap.mmap(-1, 6)]
+    raw_postcodes[2].write(b"m11ae ")
+
+    results = list(validate_bytes_many(raw_postcodes))
+
+    assert results == [("EC1A 1BB", None), ("W1A 0AX", None), (None, "InvalidFormat")]
+
+
+@pytest.mark.parametrize("raw_postcode", (b"EC1A 1B\xc3\x9f", b"EC1A 1BB\r\n", b"\xff" * 8))
+def test_validate_bytes_many_with_non_postcode_bytes(raw_postcode, uk_postcode_validator_with_rules):
+    assert list(validate_bytes_many([raw_postcode])) == [(None, "InvalidFormat")]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_validate_bytes_many_fuzzed_equivalence(seed, uk_postcode_validator_with_rules):
+    raw_postcodes = list(fuzzed_postcodes(seed))
+
+    results = list(validate_bytes_many(raw_postcode.encode() for raw_postcode in raw_postcodes))
+
+    assert results == list(uk_postcode_validator_with_rules.validate_many(raw_postcodes))
+
+
+def test_validate_bytes_many_rules_equivalence(uk_postcode_validator_with_rules):
+    raw_postcodes = [f"{outward} 1AB" for outward in all_outwards()]
+
+    results = list(validate_bytes_many(raw_postcode.encode() for raw_postcode in raw_postcodes))
+
+    assert results == list(uk_postcode_validator_with_rules.validate_many(raw_postcodes))
+
+
+def test_validate_bytes_many_with_custom_rules(uk_postcode_validator):
+    uk_postcode_validator._rules_list = (FirstLetter,)
+
+    results = list(validate_bytes_many([b"AB1 1AA", b"QA1 1AC"], uk_postcode_validator))
+
+    assert results == [("AB1 1AA", None), (None, "FirstLetter")]
+
+
+def test_validate_bytes_many_decodes_for_legacy_rules(uk_postcode_validator):
+    RuleFactory.validate = lambda self: None
+    uk_postcode_validator._rules_list = (RuleFactory,)
+
+    results = list(validate_bytes_many([b"ec1a1bb", b"E1A"], uk_postcode_validator))
+
+    assert results == [("EC1A 1BB", None), (None, "InvalidFormat")]
+
+
+def test_validate_bytes_many_uses_cache(uk_postcode_validator_with_rules):
+    cache = ValidationCache()
+
+    with mock.patch.object(uk_postcode_validator_with_rules, "cache", cache):
+        results = list(validate_bytes_many([b"ec1a1bb", b"QA1 1AA"]))
+
+    assert results == [("EC1A 1BB", None), (None, "FirstLetter")]
+    assert len(cache) == 2
+
+
+def test_validate_bytes_many_counts_rejections(uk_postcode_validator_with_rules):
+    rejections = {"FirstLetter": 0, "InvalidFormat": 0}
+
+    with mock.patch.object(uk_postcode_validator_with_rules, "rejections", rejections):
+        list(validate_bytes_many([b"EC1A 1BB", b"QA1 1AA", b"E1A"]))
+
+    assert rejections == {"FirstLetter": 1, "InvalidFormat": 1}
+
+
+def test_validate_column(uk_postcode_validator_with_rules):
+    results = list(validate_column(memoryview(RECORDS), 5, 10, 18))
+
+    assert results == [
+        ("EC1A 1BB", None),
+        ("M1 1AE", None),
+        (None, "FirstLetter"),
+        ("W1A 0AX", None),
+        (None, "InvalidFormat"),
+    ]
+
+
+def test_validate_column_with_trailing_newline(uk_postcode_validator_with_rules):
+    results = list(validate_column(b" EC1A 1BB\n EC1A 1BB \n ", 0, 11, 11))
+
+    assert results == [("EC1A 1BB", None), (None, "InvalidFormat")]
+
+
+def test_validate_column_with_padded_legacy_rules(uk_postcode_validator):
+    RuleFactory.validate = lambda self: None
+    uk_postcode_validator._rules_list = (RuleFactory,)
+
+    results = list(validate_column(RECORDS, 5, 10, 18, uk_postcode_validator))
+
+    assert [validated_postcode for validated_postcode, _ in results] == [
+        "EC1A 1BB",
+        "M1 1AE",
+        "QA1 1AA",
+        "W1A 0AX",
+        None,
+    ]
+
+
+def test_validate_file(tmp_path, uk_postcode_validator_with_rules):
+    path = tmp_path / "postcodes.txt"
+    path.write_bytes(RECORDS)
+
+    assert list(validate_file(path, 5, 10, 18)) == list(validate_column(RECORDS, 5, 10, 18))
+
+
+def test_validate_empty_file(tmp_path, uk_postcode_validator_with_rules):
+    path = tmp_path / "postcodes.txt"
+    path.write_bytes(b"")
+
+    assert list(validate_file(path, 5, 10, 18)) == []
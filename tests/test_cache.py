@@ -0,0 +1,142 @@
+import threading
+
+import pytest
+
+from postcode_validator_uk.cache import ValidationCache
+from postcode_validator_uk.constants import UK_POSTCODE_RULES_LIST
+from postcode_validator_uk.exceptions import InvalidPostcode
+from postcode_validator_uk.rules import FirstLetter
+
+
+@pytest.fixture
+def cache():
+    return ValidationCache(maxsize=2)
+
+
+@pytest.fixture
+def cached_uk_postcode_validator(uk_postcode_validator_with_rules):
+    uk_postcode_validator_with_rules.cache = ValidationCache(maxsize=100)
+    yield uk_postcode_validator_with_rules
+    uk_postcode_validator_with_rules.cache = None
+
+
+def test_validation_cache_requires_positive_maxsize():
+    with pytest.raises(ValueError):
+        ValidationCache(maxsize=0)
+
+
+def test_validation_cache_get_returns_none_when_missing(cache):
+    assert cache.get("EC1A 1BB", UK_POSTCODE_RULES_LIST) is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_validation_cache_get_returns_outcome(cache):
+    cache.set("EC1A 1BB", UK_POSTCODE_RULES_LIST, ("EC1A", "1BB", None))
+
+    assert cache.get("EC1A 1BB", UK_POSTCODE_RULES_LIST) == ("EC1A", "1BB", None)
+    assert cache.stats()["hits"] == 1
+
+
+def test_validation_cache_evicts_least_recently_used(cache):
+    cache.set("EC1A 1BB", UK_POSTCODE_RULES_LIST, ("EC1A", "1BB", None))
+    cache.set("W1A 0AX", UK_POSTCODE_RULES_LIST, ("W1A", "0AX", None))
+    cache.get("EC1A 1BB", UK_POSTCODE_RULES_LIST)
+    cache.set("M1 1AE", UK_POSTCODE_RULES_LIST, ("M1", "1AE", None))
+
+    assert cache.get("W1A 0AX", UK_POSTCODE_RULES_LIST) is None
+    assert cache.get("EC1A 1BB", UK_POSTCODE_RULES_LIST) is not None
+    assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 1, "size": 2, "maxsize": 2}
+
+
+def test_validation_cache_is_invalidated_by_other_rules_list(cache):
+    cache.set("EC1A 1BB", UK_POSTCODE_RULES_LIST, ("EC1A", "1BB", None))
+
+    assert cache.get("EC1A 1BB", (FirstLetter,)) is None
+    assert len(cache) == 0
+
+
+def test_validation_cache_clear(cache):
+    cache.set("EC1A 1BB", UK_POSTCODE_RULES_LIST, ("EC1A", "1BB", None))
+    cache.get("EC1A 1BB", UK_POSTCODE_RULES_LIST)
+    cache.clear()
+
+    assert cache.stats() == {"hits": 0, "misses": 0, "evictions": 0, "size": 0, "maxsize": 2}
+
+
+def test_uk_postcode_validate_uses_cache(cached_uk_postcode_validator):
+    for _ in range(3):
+        postcode = cached_uk_postcode_validator("ec1a 1bb")
+        postcode.validate()
+
+    assert postcode.validated_postcode == "EC1A 1BB"
+    assert cached_uk_postcode_validator.cache.stats()["hits"] == 2
+
+
+def test_uk_postcode_validate_caches_invalid_postcodes(cached_uk_postcode_validator):
+    for _ in range(2):
+        postcode = cached_uk_postcode_validator("QA1 1AA")
+        with pytest.raises(InvalidPostcode):
+            postcode.validate()
+
+    assert postcode.validated_postcode == "QA1 1AA"
+    assert cached_uk_postcode_validator.cache.stats()["hits"] == 1
+
+
+def test_uk_postcode_validate_cache_follows_rules_list(cached_uk_postcode_validator):
+    list(cached_uk_postcode_validator.validate_many(["QA1 1AA"]))
+    cached_uk_postcode_validator._rules_list = ()
+
+    assert list(cached_uk_postcode_validator.validate_many(["QA1 1AA"])) == [("QA1 1AA", None)]
+
+
+def test_uk_postcode_validate_cache_follows_instance_rules_list(cached_uk_postcode_validator):
+    postcode = cached_uk_postcode_validator("QA1 1AA")
+    postcode._rules_list = ()
+
+    assert postcode.try_validate().valid
+    assert cached_uk_postcode_validator("QA1 1AA").try_validate().rule == "FirstLetter"
+
+
+def test_uk_postcode_validate_cache_follows_rules_list_changed_in_place(cached_uk_postcode_validator):
+    cached_uk_postcode_validator._rules_list = []
+    assert cached_uk_postcode_validator("QA1 1AA").try_validate().valid
+
+    cached_uk_postcode_validator._rules_list.append(FirstLetter)
+
+    assert cached_uk_postcode_validator("QA1 1AA").try_validate().rule == "FirstLetter"
+
+
+def test_validation_cache_compares_rules_lists_by_equality(cache):
+    cache.set("EC1A 1BB", list(UK_POSTCODE_RULES_LIST), ("EC1A", "1BB", None))
+
+    assert cache.get("EC1A 1BB", list(UK_POSTCODE_RULES_LIST)) == ("EC1A", "1BB", None)
+
+
+def test_uk_postcode_validate_many_uses_cache(cached_uk_postcode_validator):
+    results = list(cached_uk_postcode_validator.validate_many(["EC1A 1BB", "QA1 1AA"] * 2))
+
+    assert results == [("EC1A 1BB", None), (None, "FirstLetter")] * 2
+    assert cached_uk_postcode_validator.cache.stats()["hits"] == 2
+
+
+def test_uk_postcode_validate_cache_shared_across_threads(cached_uk_postcode_validator):
+    raw_postcodes = [f"EC{district}A 1BB" for district in range(1, 5)] * 50
+    errors = []
+
+    def validate():
+        try:
+            for raw_postcode in raw_postcodes:
+                cached_uk_postcode_validator(raw_postcode).validate()
+        except Exception as exc:  # pragma: no cover
+            errors.append(exc)
+
+    threads = [threading.Thread(target=validate) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cached_uk_postcode_validator.cache.stats()
+    assert errors == []
+    assert stats["hits"] + stats["misses"] == len(raw_postcodes) * 8
+    assert stats["size"] == 4
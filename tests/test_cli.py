@@ -0,0 +1,120 @@
+import io
+import itertools
+from collections import Counter
+from unittest import mock
+
+import pytest
+
+from postcode_validator_uk import cli
+
+
+@pytest.fixture(autouse=True)
+def uk_postcode_rules(uk_postcode_validator_with_rules):
+    return uk_postcode_validator_with_rules
+
+
+def test_main_validates_lines(tmp_path, capsys):
+    input_path = tmp_path / "postcodes.txt"
+    input_path.write_text("ec1a 1bb\nQA1 1AA\r\nfoo\n")
+
+    assert cli.main([str(input_path), "-q"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "postcode,validated_postcode,status",
+        "ec1a 1bb,EC1A 1BB,valid",
+        "QA1 1AA,,FirstLetter",
+        "foo,,InvalidFormat",
+    ]
+
+
+def test_main_validates_csv_column(tmp_path):
+    input_path = tmp_path / "addresses.csv"
+    input_path.write_text("id,postcode,city\n1,w1a0ax,London\n2,AB1 1AA,Aberdeen\n3\n")
+    output_path = tmp_path / "validated.csv"
+
+    assert cli.main([str(input_path), "-c", "postcode", "-o", str(output_path), "-q"]) == 0
+    assert output_path.read_text().splitlines() == [
+        "id,postcode,city,validated_postcode,status",
+        "1,w1a0ax,London,W1A 0AX,valid",
+        "2,AB1 1AA,Aberdeen,,DoubleDigitDistrict",
+        "3,,,,InvalidFormat",
+    ]
+
+
+def test_main_reads_stdin(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO("m1 1ae\n"))
+
+    assert cli.main(["--chunk-size", "1", "-q"]) == 0
+    assert capsys.readouterr().out.splitlines()[1] == "m1 1ae,M1 1AE,valid"
+
+
+def test_main_reports_stats(tmp_path, capsys):
+    input_path = tmp_path / "postcodes.txt"
+    input_path.write_text("ec1a 1bb\nQA1 1AA\nfoo\nbar\n")
+
+    cli.main([str(input_path)])
+
+    report = capsys.readouterr().err.splitlines()
+    assert report[0].startswith("4 rows, 3 invalid in ")
+    assert report[0].endswith(" rows/s)")
+    assert report[1:] == ["  FirstLetter: 1", "  InvalidFormat: 2"]
+
+
+def test_main_raises_with_missing_input(tmp_path):
+    with pytest.raises(SystemExit, match="Can't open .*missing.txt: No such file or directory"):
+        cli.main([str(tmp_path / "missing.txt")])
+
+
+def test_main_closes_input_when_output_cant_be_opened(tmp_path):
+    input_path = tmp_path / "postcodes.txt"
+    input_path.write_text("ec1a 1bb\n")
+    input_file = open(input_path)
+
+    with mock.patch.object(cli, "open", side_effect=[input_file, PermissionError(13, "Permission denied")]):
+        with pytest.raises(SystemExit, match="Can't open .*validated.csv: Permission denied"):
+            cli.main([str(input_path), "-o", str(tmp_path / "validated.csv")])
+
+    assert input_file.closed
+
+
+def test_main_raises_with_unknown_column(tmp_path):
+    input_path = tmp_path / "addresses.csv"
+    input_path.write_text("id,postcode\n")
+
+    with pytest.raises(SystemExit):
+        cli.main([str(input_path), "-c", "zip"])
+
+
+def test_main_raises_with_invalid_chunk_size():
+    with pytest.raises(SystemExit):
+        cli.main(["--chunk-size", "0"])
+
+
+def test_validate_rows_reads_one_chunk_at_a_time():
+    rows = (([f"{index}"], "EC1A 1BB") for index in itertools.count())
+    stats = Counter()
+
+    validated_rows = cli.validate_rows(rows, 3, stats)
+
+    assert next(validated_rows) == ["0", "EC1A 1BB", "valid"]
+    assert next(rows) == (["3"], "EC1A 1BB")
+
+
+def test_main_validates_with_workers(tmp_path, capsys):
+    input_path = tmp_path / "postcodes.txt"
+    input_path.write_text("ec1a 1bb\nQA1 1AA\nfoo\n" * 3)
+
+    assert cli.main([str(input_path), "-q", "--workers", "2", "--chunk-size", "2"]) == 0
+    assert (
+        capsys.readouterr().out.splitlines()[1:]
+        == [
+            "ec1a 1bb,EC1A 1BB,valid",
+            "QA1 1AA,,FirstLetter",
+            "foo,,InvalidFormat",
+        ]
+        * 3
+    )
+
+
+def test_main_raises_with_invalid_workers():
+    with pytest.raises(SystemExit):
+        cli.main(["--workers", "0"])
@@ -0,0 +1,55 @@
+import pytest
+
+from postcode_validator_uk.correction import Correction, correct, correct_many
+from postcode_validator_uk.rules import FirstLetter
+
+
+@pytest.mark.parametrize(
+    "raw_postcode, expected_correction",
+    (
+        ("EC1A 1BB", ("EC1A 1BB", 0)),
+        ("ec1a1bb", ("EC1A 1BB", 0)),
+        ("ECIA 1BB", ("EC1A 1BB", 1)),
+        ("SW1A OAA", ("SW1A 0AA", 1)),
+        ("5W1A 1AA", ("SW1A 1AA", 1)),
+        ("DN55 IPT", ("DN55 1PT", 1)),
+        ("CE1A 1BB", ("CE1A 1BB", 0)),
+        ("M11 AE", ("M1 1AE", 0)),
+        ("W1A OAX", ("W1A 0AX", 1)),
+        ("ECIA IBB", ("EC1A 1BB", 2)),
+    ),
+)
+def test_correct_ranks_best_correction_first(
+    raw_postcode, expected_correction, uk_postcode_validator_with_rules
+):
+    assert correct(raw_postcode)[0] == expected_correction
+
+
+def test_correct_returns_only_valid_postcodes(uk_postcode_validator_with_rules):
+    corrections = correct("B33 BTH")
+
+    assert corrections
+    assert all(uk_postcode_validator_with_rules(postcode).is_valid() for postcode, _ in corrections)
+    assert [cost for _, cost in corrections] == sorted(cost for _, cost in corrections)
+
+
+@pytest.mark.parametrize("raw_postcode", ("", "garbage", None, "X" * 20, "QQ1 1AA"))
+def test_correct_without_corrections(raw_postcode, uk_postcode_validator_with_rules):
+    assert correct(raw_postcode) == []
+
+
+def test_correct_limits_cost(uk_postcode_validator_with_rules):
+    assert correct("ECIA IBB", max_cost=1) == []
+    assert correct("EC1A 1BB", max_cost=0) == [Correction("EC1A 1BB", 0)]
+
+
+def test_correct_uses_validator_rules(uk_postcode_validator):
+    uk_postcode_validator._rules_list = (FirstLetter,)
+
+    assert correct("QA1 1AA", uk_postcode_validator) == [Correction("AQ1 1AA", 1)]
+
+
+def test_correct_many(uk_postcode_validator_with_rules):
+    results = list(correct_many(["ECIA 1BB", "garbage"], max_cost=1))
+
+    assert results == [[Correction("EC1A 1BB", 1)], []]
@@ -0,0 +1,97 @@
+from unittest import mock
+
+import pytest
+
+from postcode_validator_uk.constants import UK_POSTCODE_FORMAT_ERROR, UK_POSTCODE_RULES_LIST
+from postcode_validator_uk.diagnostics import error_position, format_error_position, rule_error_position
+from postcode_validator_uk.engine import compile_rules
+from postcode_validator_uk.rules import (
+    CentralLondonDistrict,
+    DoubleDigitDistrict,
+    FirstLetter,
+    FourthLetter,
+    LastTwoLetter,
+    PostcodeRule,
+    SecondLetter,
+    SingleDigitDistrict,
+    ThirdLetter,
+    ZeroOrTenDistrict,
+)
+
+from .factories import RuleFactory
+
+
+@pytest.mark.parametrize(
+    "postcode, expected_position",
+    (
+        ("", 0),
+        ("0000000", 0),
+        ("HELLO WORLD", 2),
+        ("B338-TH5", 4),
+        ("EC1A A4BB", 5),
+        ("CR2 6XH#", 7),
+        ("EC1A 1B", 7),
+    ),
+)
+def test_format_error_position(postcode, expected_position):
+    assert format_error_position(postcode) == expected_position
+
+
+@pytest.mark.parametrize(
+    "rule_class, value, expected_position",
+    (
+        (CentralLondonDistrict, "EC5A", 2),
+        (CentralLondonDistrict, "NW1A", 3),
+        (DoubleDigitDistrict, "AB1", 3),
+        (FirstLetter, "QA1", 0),
+        (FourthLetter, "BB1C", 3),
+        (LastTwoLetter, "1BC", 2),
+        (LastTwoLetter, "1IA", 1),
+        (SecondLetter, "AI1", 1),
+        (SingleDigitDistrict, "BR10", 3),
+        (SingleDigitDistrict, "WC1", 3),
+        (ThirdLetter, "M1L", 2),
+        (ZeroOrTenDistrict, "SS10", 2),
+        (ZeroOrTenDistrict, "DN0", 2),
+    ),
+)
+def test_rule_error_position(rule_class, value, expected_position):
+    assert rule_error_position(rule_class, value) == expected_position
+
+
+@pytest.mark.parametrize(
+    "raw_postcode, error, expected_position",
+    (
+        ("ec1a a4bb", UK_POSTCODE_FORMAT_ERROR, 5),
+        ("QA1 1AA", "FirstLetter", 0),
+        ("ec1a  1bc", "LastTwoLetter", 8),
+        ("EC1A1BC", "LastTwoLetter", 6),
+    ),
+)
+def test_error_position(raw_postcode, error, expected_position):
+    assert error_position(raw_postcode, error, compile_rules(UK_POSTCODE_RULES_LIST)) == expected_position
+
+
+def test_error_position_with_legacy_rules():
+    assert error_position("EC1A 1BB", "RuleFactory", compile_rules((RuleFactory,))) is None
+
+
+class OutwardLengthRule(PostcodeRule):
+    attr_applied = "outward"
+
+    @classmethod
+    def check_value(cls, value):
+        return len(value) < 4
+
+
+def test_rule_error_position_without_rule_regexes():
+    assert rule_error_position(OutwardLengthRule, "EC1A") is None
+
+
+def test_try_validate_with_rules_without_regexes(uk_postcode_validator):
+    uk_postcode_validator._rules_list = (OutwardLengthRule,)
+
+    with mock.patch.object(uk_postcode_validator, "diagnostics", True):
+        result = uk_postcode_validator("EC1A 1BB").try_validate()
+
+    assert result == (False, "EC1A 1BB", "OutwardLengthRule", None)
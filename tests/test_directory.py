@@ -0,0 +1,212 @@
+import io
+import itertools
+import pickle
+from unittest import mock
+
+import pytest
+
+from postcode_validator_uk.buffers import validate_bytes_many
+from postcode_validator_uk.cache import ValidationCache
+from postcode_validator_uk.correction import Correction, correct
+from postcode_validator_uk.directory import PostcodeDirectory, main, read_live_postcodes
+from postcode_validator_uk.exceptions import InvalidPostcode
+from postcode_validator_uk.scanner import scan
+from postcode_validator_uk.tables import all_outwards
+from postcode_validator_uk.validators import ValidatedPostcode
+
+POSTCODES = ["W1A 0AX", "ec1a1bb", "M1 1AE", "EC1A 1BB", "QA1 1AA", "foo", "B33 8TH"]
+CSV = "pcd,pcds,doterm\nEC1A1BB,EC1A 1BB,\nW1A 0AX,W1A 0AX,200512\nM1  1AE,M1 1AE,\n"
+
+
+@pytest.fixture
+def directory(tmp_path, uk_postcode_validator_with_rules):
+    path = tmp_path / "postcodes.dir"
+    PostcodeDirectory.build(POSTCODES, path)
+
+    with PostcodeDirectory(path) as directory:
+        yield directory
+
+
+@pytest.fixture
+def validator_with_directory(directory, uk_postcode_validator_with_rules):
+    with mock.patch.object(uk_postcode_validator_with_rules, "directory", directory):
+        yield uk_postcode_validator_with_rules
+
+
+def test_build(tmp_path, uk_postcode_validator_with_rules):
+    path = tmp_path / "postcodes.dir"
+
+    assert PostcodeDirectory.build(POSTCODES, path) == 4
+    assert path.read_bytes()[:8] == b"PCVUKDR2"
+    assert len(path.read_bytes()) == 8 + 4 * 4
+
+
+def test_build_ignores_the_current_directory(tmp_path, validator_with_directory):
+    path = tmp_path / "rebuilt.dir"
+
+    assert PostcodeDirectory.build(["EC1A 1BB", "SW1A 2AA", "SW1A 1AA", "foo"], path) == 3
+
+
+def test_keys_round_trip_in_lexical_order(tmp_path, uk_postcode_validator):
+    path = tmp_path / "postcodes.dir"
+    outwards = itertools.islice(all_outwards(), 0, None, 7)
+    postcodes = [f"{outward} {inward}" for outward in outwards for inward in ("0AA", "9ZZ")]
+
+    PostcodeDirectory.build(postcodes, path)
+
+    with PostcodeDirectory(path) as directory:
+        assert list(directory) == sorted(postcodes)
+        assert all(postcode in directory for postcode in postcodes[::97])
+
+
+def test_build_replaces_file(tmp_path, directory):
+    assert PostcodeDirectory.build(["SW1A 2AA"], directory.path) == 1
+
+    assert len(directory) == 4
+    with PostcodeDirectory(directory.path) as rebuilt_directory:
+        assert list(rebuilt_directory) == ["SW1A 2AA"]
+
+
+def test_open_invalid_file(tmp_path):
+    path = tmp_path / "postcodes.dir"
+    path.write_bytes(b"PCVUKDR1EC1A1BB")
+
+    with pytest.raises(ValueError, match="isn't a postcode directory file"):
+        PostcodeDirectory(path)
+
+
+def test_len_and_iter(directory):
+    assert len(directory) == 4
+    assert list(directory) == ["B33 8TH", "EC1A 1BB", "M1 1AE", "W1A 0AX"]
+
+
+@pytest.mark.parametrize(
+    "postcode, expected",
+    (
+        ("EC1A 1BB", True),
+        ("ec1a1bb", True),
+        ("M1 1AE", True),
+        ("B33 8TH", True),
+        ("W1A 0AX", True),
+        (ValidatedPostcode("M", "1", "1", "AE"), True),
+        ("A11 1AA", False),
+        ("ZZ99 9ZZ", False),
+        ("EC1A 1BC", False),
+        ("M11 1AE", False),
+        ("QA1 1AA", False),
+        ("foo", False),
+        (None, False),
+    ),
+)
+def test_contains(postcode, expected, directory):
+    assert (postcode in directory) is expected
+
+
+def test_empty_directory(tmp_path, uk_postcode_validator_with_rules):
+    path = tmp_path / "postcodes.dir"
+    PostcodeDirectory.build([], path)
+
+    with PostcodeDirectory(path) as directory:
+        assert len(directory) == 0
+        assert "EC1A 1BB" not in directory
+
+
+def test_pickle_reopens_path(directory):
+    with pickle.loads(pickle.dumps(directory)) as unpickled_directory:
+        assert unpickled_directory.path == directory.path
+        assert list(unpickled_directory) == list(directory)
+
+
+def test_validate(validator_with_directory):
+    validator_with_directory("ec1a1bb").validate()
+
+    with pytest.raises(InvalidPostcode) as exc_info:
+        validator_with_directory("SW1A 2AA").validate()
+
+    assert exc_info.value.rule == "NotInDirectory"
+
+
+def test_try_validate(validator_with_directory):
+    result = validator_with_directory("SW1A 2AA").try_validate()
+
+    assert result == (False, "SW1A 2AA", "NotInDirectory", None)
+
+
+def test_rules_are_checked_first(validator_with_directory):
+    assert validator_with_directory("QA1 1AA").try_validate().rule == "FirstLetter"
+
+
+def test_validate_many(validator_with_directory):
+    results = list(validator_with_directory.validate_many(["EC1A 1BB", "SW1A 2AA", "QA1 1AA", "foo"]))
+
+    assert results == [
+        ("EC1A 1BB", None),
+        (None, "NotInDirectory"),
+        (None, "FirstLetter"),
+        (None, "InvalidFormat"),
+    ]
+
+
+def test_cache_holds_the_rules_outcome(validator_with_directory):
+    with mock.patch.object(validator_with_directory, "cache", ValidationCache()):
+        assert list(validator_with_directory.validate_many(["SW1A 2AA"])) == [(None, "NotInDirectory")]
+
+        with mock.patch.object(validator_with_directory, "directory", None):
+            assert list(validator_with_directory.validate_many(["SW1A 2AA"])) == [("SW1A 2AA", None)]
+
+
+def test_parse_scan_and_bytes(validator_with_directory):
+    assert validator_with_directory.parse("M1 1AE") == ValidatedPostcode("M", "1", "1", "AE")
+    with pytest.raises(InvalidPostcode):
+        validator_with_directory.parse("M1 1AA")
+
+    assert [postcode for postcode, _, _ in scan("M1 1AE or M1 1AA")] == ["M1 1AE"]
+    assert list(validate_bytes_many([b"M1 1AE", b"M1 1AA"])) == [("M1 1AE", None), (None, "NotInDirectory")]
+
+
+def test_correct(validator_with_directory):
+    assert correct("W1A OAX") == [Correction("W1A 0AX", 1)]
+    assert correct("SW1A OAA") == []
+
+
+def test_validate_array(validator_with_directory):
+    vectorized = pytest.importorskip("postcode_validator_uk.vectorized")
+
+    mask, outward, inward = vectorized.validate_array(["M1 1AE", "M1 1AA", "QA1 1AA"])
+
+    assert mask.tolist() == [True, False, False]
+    assert outward.tolist() == ["M1", "", ""]
+    assert inward.tolist() == ["1AE", "", ""]
+
+
+def test_read_live_postcodes():
+    assert list(read_live_postcodes(io.StringIO(CSV))) == ["EC1A 1BB", "M1 1AE"]
+    assert list(read_live_postcodes(io.StringIO(CSV), column="pcd", terminated_column=None)) == [
+        "EC1A1BB",
+        "W1A 0AX",
+        "M1  1AE",
+    ]
+
+
+def test_read_live_postcodes_with_unknown_column():
+    with pytest.raises(ValueError, match="Column 'postcode' not found"):
+        list(read_live_postcodes(io.StringIO(CSV), column="postcode"))
+
+
+def test_main(tmp_path, capsys, uk_postcode_validator_with_rules):
+    csv_path, path = tmp_path / "onspd.csv", tmp_path / "postcodes.dir"
+    csv_path.write_text(CSV)
+
+    main([str(csv_path), str(path)])
+
+    assert capsys.readouterr().out == f"2 postcodes written to {path}\n"
+    with PostcodeDirectory(path) as directory:
+        assert list(directory) == ["EC1A 1BB", "M1 1AE"]
+
+
+def test_main_with_unknown_column(tmp_path, uk_postcode_validator_with_rules):
+    csv_path = tmp_path / "onspd.csv"
+    csv_path.write_text(CSV)
+
+    with pytest.raises(SystemExit, match="Column 'postcode' not found"):
+        main([str(csv_path), str(tmp_path / "postcodes.dir"), "--column", "postcode"])
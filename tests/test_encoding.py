@@ -0,0 +1,123 @@
+import itertools
+import random
+
+import pytest
+
+from postcode_validator_uk.encoding import (
+    INVALID_KEY,
+    KEYS,
+    decode,
+    decode_many,
+    encode,
+    encode_codes,
+    encode_many,
+)
+from postcode_validator_uk.exceptions import InvalidPostcode
+from postcode_validator_uk.rules import FirstLetter
+from postcode_validator_uk.tables import all_inwards, all_outwards
+from postcode_validator_uk.validators import ValidatedPostcode
+
+
+@pytest.mark.parametrize(
+    "postcode, key",
+    (
+        ("A0 0AA", 0),
+        ("A0 0AB", 1),
+        ("A0 1AA", 676),
+        ("A00 0AA", 6760),
+        ("ZZ9Z 9ZZ", KEYS - 1),
+    ),
+)
+def test_encode_codes(postcode, key):
+    outward, inward = postcode.split(" ")
+
+    assert encode_codes(outward, inward) == key
+    assert decode(key).postcode == postcode
+
+
+def test_keys_fit_in_32_bits():
+    assert KEYS < INVALID_KEY < 1 << 32
+
+
+def test_every_outward_round_trips_in_lexical_order():
+    outwards = list(all_outwards())
+
+    keys = [encode_codes(outward, "1AB") for outward in outwards]
+
+    assert [decode(key).outward for key in keys] == outwards
+    assert sorted(keys) == [
+        encode_codes(outward, "1AB") for outward in sorted(outwards, key=lambda o: f"{o} ")
+    ]
+
+
+def test_every_inward_round_trips_in_lexical_order():
+    inwards = list(all_inwards())
+
+    keys = [encode_codes("EC1A", inward) for inward in inwards]
+
+    assert [decode(key).inward for key in keys] == inwards
+    assert keys == sorted(keys)
+
+
+def test_keys_sort_as_postcodes():
+    randomizer = random.Random(2023)
+    outwards, inwards = list(all_outwards()), list(all_inwards())
+    postcodes = [f"{randomizer.choice(outwards)} {randomizer.choice(inwards)}" for _ in range(10000)]
+
+    keys = sorted(encode_codes(*postcode.split(" ")) for postcode in postcodes)
+
+    assert [decode(key).postcode for key in keys] == sorted(postcodes)
+
+
+def test_decode_components():
+    assert decode(encode_codes("EC1A", "1BB")) == ValidatedPostcode("EC", "1A", "1", "BB")
+    assert decode(encode_codes("M1", "1AE")) == ValidatedPostcode("M", "1", "1", "AE")
+
+
+@pytest.mark.parametrize("key", (-1, KEYS, INVALID_KEY))
+def test_decode_invalid_key(key):
+    with pytest.raises(ValueError, match="isn't a postcode key"):
+        decode(key)
+
+
+def test_encode(uk_postcode_validator_with_rules):
+    key = encode_codes("EC1A", "1BB")
+
+    assert encode("ec1a1bb") == key
+    assert encode(ValidatedPostcode("EC", "1A", "1", "BB")) == key
+    with pytest.raises(InvalidPostcode):
+        encode("QA1 1AA")
+
+
+def test_encode_uses_validator_rules(uk_postcode_validator):
+    uk_postcode_validator._rules_list = (FirstLetter,)
+
+    assert encode("AB1 1AA", uk_postcode_validator) == encode_codes("AB1", "1AA")
+    with pytest.raises(InvalidPostcode):
+        encode("QA1 1AA", uk_postcode_validator)
+
+
+def test_encode_many_and_decode_many(uk_postcode_validator_with_rules):
+    raw_postcodes = ["EC1A 1BB", "QA1 1AA", "w1a0ax", "foo", "M1 1AE"]
+
+    keys = encode_many(raw_postcodes)
+
+    assert keys.typecode == "I"
+    assert keys.tolist() == [
+        encode_codes("EC1A", "1BB"),
+        INVALID_KEY,
+        encode_codes("W1A", "0AX"),
+        INVALID_KEY,
+        encode_codes("M1", "1AE"),
+    ]
+    assert [postcode and postcode.postcode for postcode in decode_many(keys)] == [
+        "EC1A 1BB",
+        None,
+        "W1A 0AX",
+        None,
+        "M1 1AE",
+    ]
+
+
+def test_encode_many_with_empty_input(uk_postcode_validator_with_rules):
+    assert len(encode_many(itertools.chain())) == 0
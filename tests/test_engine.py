@@ -0,0 +1,217 @@
+import random
+import re
+import string
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from postcode_validator_uk.constants import UK_POSTCODE_RULES_LIST
+from postcode_validator_uk.engine import RuleEngine, compile_rules, fuse_rules, is_fusible, is_stateless
+from postcode_validator_uk.exceptions import InvalidPostcode
+from postcode_validator_uk.generator import invalid_postcodes, valid_postcodes
+from postcode_validator_uk.rules import FirstLetter, LastTwoLetter, PostcodeRule
+from postcode_validator_uk.tables import all_inwards, all_outwards
+
+from .factories import RuleFactory
+
+
+def is_valid_by_rules(rules, **postcode_parts):
+    postcode = SimpleNamespace(**postcode_parts)
+    try:
+        for rule_class in rules:
+            rule_class(postcode).validate()
+    except InvalidPostcode:
+        return False
+
+    return True
+
+
+def test_is_fusible_with_postcode_rules():
+    assert all(is_fusible(rule) for rule in UK_POSTCODE_RULES_LIST)
+
+
+def test_is_fusible_without_rule_regexes():
+    assert not is_fusible(RuleFactory)
+
+
+def test_fuse_rules_without_rules_matches_everything():
+    assert fuse_rules([]).match("ANYTHING")
+
+
+def test_rule_engine_keeps_legacy_rules_apart():
+    engine = RuleEngine((FirstLetter, RuleFactory, LastTwoLetter))
+
+    assert engine.fused_rules == (FirstLetter, LastTwoLetter)
+    assert engine.legacy_rules == (RuleFactory,)
+
+
+def test_compile_rules_is_cached():
+    assert compile_rules(list(UK_POSTCODE_RULES_LIST)) is compile_rules(UK_POSTCODE_RULES_LIST)
+
+
+def test_rule_engine_failed_rule():
+    engine = RuleEngine(UK_POSTCODE_RULES_LIST)
+
+    assert engine.failed_rule("QA1", "1AA") == "FirstLetter"
+    assert engine.failed_rule("A1", "1AC") == "LastTwoLetter"
+    assert engine.failed_rule("A1", "1AA") is None
+
+
+def test_rule_engine_outward_equivalence_with_rules():
+    engine = RuleEngine(UK_POSTCODE_RULES_LIST)
+    outward_rules = [rule for rule in UK_POSTCODE_RULES_LIST if rule.attr_applied == "outward"]
+
+    for outward in all_outwards():
+        assert bool(engine.outward_regex.match(outward)) == is_valid_by_rules(outward_rules, outward=outward)
+
+
+def test_rule_engine_inward_equivalence_with_rules():
+    engine = RuleEngine(UK_POSTCODE_RULES_LIST)
+    inward_rules = [rule for rule in UK_POSTCODE_RULES_LIST if rule.attr_applied == "inward"]
+
+    for inward in all_inwards():
+        assert bool(engine.inward_regex.match(inward)) == is_valid_by_rules(inward_rules, inward=inward)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_rule_engine_fuzzed_equivalence_with_rules(seed):
+    engine = RuleEngine(UK_POSTCODE_RULES_LIST)
+    randomizer = random.Random(seed)
+    outwards = list(all_outwards())
+
+    for _ in range(2000):
+        outward = randomizer.choice(outwards)
+        unit = "".join(randomizer.choices(string.ascii_uppercase, k=2))
+        inward = f"{randomizer.choice(string.digits)}{unit}"
+        expected = is_valid_by_rules(UK_POSTCODE_RULES_LIST, outward=outward, inward=inward)
+        assert engine.match(outward, inward) == expected
+        assert (engine.failed_rule(outward, inward) is None) == expected
+
+
+@pytest.mark.parametrize("rule", (None,) + UK_POSTCODE_RULES_LIST)
+def test_rule_engine_generated_equivalence_with_rules(rule, uk_postcode_validator_with_rules):
+    engine = RuleEngine(UK_POSTCODE_RULES_LIST)
+    postcodes = valid_postcodes(1000, seed=1) if rule is None else invalid_postcodes(rule, 1000, seed=1)
+
+    for outward, inward in (postcode.split(" ") for postcode in postcodes):
+        expected = is_valid_by_rules(UK_POSTCODE_RULES_LIST, outward=outward, inward=inward)
+        assert expected is (rule is None)
+        assert engine.match(outward, inward) == expected
+        assert engine.failed_rule(outward, inward) == (rule and rule.__name__)
+
+
+def test_uk_postcode_validate_runs_legacy_rules(uk_postcode_validator):
+    RuleFactory.validate = mock.Mock()
+    uk_postcode_validator._rules_list = (FirstLetter, RuleFactory)
+
+    uk_postcode_validator("EC1A 1BB").validate()
+
+    assert RuleFactory.validate.call_count == 1
+
+
+class CaseInsensitiveFirstLetter(FirstLetter):
+    applied_areas_regex = re.compile(r"^(q|v|x)", re.IGNORECASE)
+
+
+class PostcodeLengthRule(PostcodeRule):
+    attr_applied = "outward"
+
+    @classmethod
+    def check_value(cls, value):
+        return len(value) < 4
+
+
+def test_is_stateless():
+    assert is_stateless(FirstLetter)
+    assert is_stateless(PostcodeLengthRule)
+    assert not is_stateless(RuleFactory)
+
+
+class AreaLengthRule(PostcodeRule):
+    attr_applied = "area"
+
+    @classmethod
+    def check_value(cls, value):
+        return len(value) == 2
+
+
+def test_is_stateless_with_other_attr_applied():
+    assert not is_stateless(AreaLengthRule)
+    assert RuleEngine((FirstLetter, AreaLengthRule)).legacy_rules == (AreaLengthRule,)
+
+
+def test_rule_with_other_attr_applied_is_validated_by_instance(uk_postcode_validator):
+    uk_postcode_validator._rules_list = (AreaLengthRule,)
+
+    assert uk_postcode_validator("EC1A 1BB").is_valid()
+    assert uk_postcode_validator("W1A 0AX").try_validate().rule == "AreaLengthRule"
+    assert list(uk_postcode_validator.validate_many(["EC1A 1BB", "W1A 0AX"])) == [
+        ("EC1A 1BB", None),
+        (None, "AreaLengthRule"),
+    ]
+
+
+def test_is_fusible_with_overridden_check():
+    assert not is_fusible(PostcodeLengthRule)
+    assert not is_fusible(CaseInsensitiveFirstLetter)
+
+
+class NamedGroupRule(PostcodeRule):
+    attr_applied = "outward"
+    applied_areas_regex = re.compile(r"^(?P<area>[A-Z])[0-9]")
+    rule_regex = re.compile(r"^(?P<area>[A-P])")
+
+
+class OtherNamedGroupRule(PostcodeRule):
+    attr_applied = "outward"
+    applied_areas_regex = re.compile(r"^(?P<area>[A-Z]{2})")
+    rule_regex = re.compile(r"^(?P<area>[A-Z])(?!Q)")
+
+
+class GroupRule(PostcodeRule):
+    attr_applied = "outward"
+    applied_areas_regex = re.compile(r"^(B)")
+    rule_regex = re.compile(r"^(B)[0-9]")
+
+
+class BackreferenceRule(PostcodeRule):
+    attr_applied = "outward"
+    applied_areas_regex = re.compile(r"(?=^(A)(A))")
+    rule_regex = re.compile(r"^(A)\1")
+
+
+def test_is_fusible_with_group_references():
+    assert is_fusible(GroupRule)
+    assert not is_fusible(NamedGroupRule)
+    assert not is_fusible(BackreferenceRule)
+
+
+def test_rule_engine_with_group_references_equivalence():
+    rules = (GroupRule, NamedGroupRule, OtherNamedGroupRule, BackreferenceRule)
+    engine = RuleEngine(rules)
+
+    assert engine.fused_rules == (GroupRule,)
+    for outward in ("AA1", "AB1", "B1", "BA1", "Q1", "QA1", "AQ1", "C12"):
+        assert engine.match(outward, "1AA") == is_valid_by_rules(rules, outward=outward, inward="1AA")
+
+
+def test_rule_engine_checks_stateless_rules():
+    engine = RuleEngine((FirstLetter, PostcodeLengthRule, CaseInsensitiveFirstLetter))
+
+    assert engine.fused_rules == (FirstLetter,)
+    assert engine.stateless_rules == (PostcodeLengthRule, CaseInsensitiveFirstLetter)
+    assert engine.match("A1", "1AA")
+    assert not engine.match("EC1A", "1AA")
+    assert engine.failed_rule("EC1A", "1AA") == "PostcodeLengthRule"
+
+
+def test_uk_postcode_validate_does_not_instantiate_stateless_rules(uk_postcode_validator):
+    uk_postcode_validator._rules_list = (FirstLetter, PostcodeLengthRule)
+
+    with mock.patch.object(PostcodeLengthRule, "__init__") as rule_init:
+        uk_postcode_validator("W1A 1BB").validate()
+        with pytest.raises(InvalidPostcode):
+            uk_postcode_validator("EC1A 1BB").validate()
+
+    assert not rule_init.called
@@ -0,0 +1,103 @@
+import itertools
+from unittest import mock
+
+import pytest
+
+from postcode_validator_uk.constants import UK_POSTCODE_FORMAT_ERROR, UK_POSTCODE_RULES_LIST
+from postcode_validator_uk.generator import all_valid_postcodes, invalid_postcodes, valid_postcodes
+from postcode_validator_uk.rules import FirstLetter, LastTwoLetter
+
+from .factories import RuleFactory
+
+
+class FirstLetterCopy(FirstLetter):
+    pass
+
+
+def errors(validator_class, postcodes):
+    return {error for _, error in validator_class.validate_many(postcodes)}
+
+
+def test_valid_postcodes(uk_postcode_validator_with_rules):
+    postcodes = list(valid_postcodes(2000, seed=1))
+
+    assert len(postcodes) == 2000
+    assert len(set(postcodes)) > 1990
+    assert errors(uk_postcode_validator_with_rules, postcodes) == {None}
+
+
+def test_valid_postcodes_are_seeded(uk_postcode_validator_with_rules):
+    assert list(valid_postcodes(100, seed=1)) == list(valid_postcodes(100, seed=1))
+    assert list(valid_postcodes(100, seed=1)) != list(valid_postcodes(100, seed=2))
+
+
+def test_valid_postcodes_stream_endlessly(uk_postcode_validator_with_rules):
+    postcodes = valid_postcodes(seed=1)
+
+    assert len(list(itertools.islice(postcodes, 10000))) == 10000
+    assert next(postcodes)
+
+
+@pytest.mark.parametrize("rule", UK_POSTCODE_RULES_LIST)
+def test_invalid_postcodes(rule, uk_postcode_validator_with_rules):
+    postcodes = list(invalid_postcodes(rule, 500, seed=1))
+
+    assert len(postcodes) == 500
+    assert errors(uk_postcode_validator_with_rules, postcodes) == {rule.__name__}
+    assert list(invalid_postcodes(rule.__name__, 500, seed=1)) == postcodes
+
+
+@pytest.mark.parametrize("rule", UK_POSTCODE_RULES_LIST)
+def test_invalid_postcodes_fail_only_one_rule(rule, uk_postcode_validator_with_rules):
+    for postcode in invalid_postcodes(rule, 500, seed=1):
+        outward, inward = postcode.split(" ")
+
+        assert [
+            failed_rule for failed_rule in UK_POSTCODE_RULES_LIST if not failed_rule.check(outward, inward)
+        ] == [rule]
+
+
+def test_invalid_postcodes_without_postcodes_failing_only_the_rule(uk_postcode_validator):
+    uk_postcode_validator._rules_list = (FirstLetter, FirstLetterCopy)
+
+    with pytest.raises(ValueError, match="No otherwise valid postcode fails validation with FirstLetter"):
+        invalid_postcodes(FirstLetter, validator_class=uk_postcode_validator)
+
+
+def test_invalid_postcodes_with_format_error(uk_postcode_validator_with_rules):
+    postcodes = list(invalid_postcodes(UK_POSTCODE_FORMAT_ERROR, 500, seed=1))
+
+    assert errors(uk_postcode_validator_with_rules, postcodes) == {UK_POSTCODE_FORMAT_ERROR}
+    assert list(invalid_postcodes(UK_POSTCODE_FORMAT_ERROR, 500, seed=1)) == postcodes
+
+
+def test_invalid_postcodes_with_unknown_rule(uk_postcode_validator):
+    uk_postcode_validator._rules_list = (FirstLetter,)
+
+    with pytest.raises(ValueError, match="No postcode fails validation with LastTwoLetter"):
+        invalid_postcodes(LastTwoLetter, validator_class=uk_postcode_validator)
+
+
+def test_uses_validator_rules(uk_postcode_validator):
+    uk_postcode_validator._rules_list = (FirstLetter,)
+
+    postcodes = list(valid_postcodes(2000, seed=1, validator_class=uk_postcode_validator))
+
+    assert errors(uk_postcode_validator, postcodes) == {None}
+    with mock.patch.object(uk_postcode_validator, "_rules_list", UK_POSTCODE_RULES_LIST):
+        assert errors(uk_postcode_validator, postcodes) > {None}
+
+
+def test_all_valid_postcodes(uk_postcode_validator_with_rules):
+    postcodes = list(itertools.islice(all_valid_postcodes(), 20000))
+
+    assert postcodes == sorted(postcodes)
+    assert postcodes[:2] == ["A0 0AA", "A0 0AB"]
+    assert errors(uk_postcode_validator_with_rules, postcodes) == {None}
+
+
+def test_legacy_rules_are_refused(uk_postcode_validator):
+    uk_postcode_validator._rules_list = (FirstLetter, RuleFactory)
+
+    with pytest.raises(ValueError, match="RuleFactory isn't a stateless outward or inward rule"):
+        valid_postcodes(validator_class=uk_postcode_validator)
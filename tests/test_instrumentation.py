@@ -0,0 +1,86 @@
+from unittest import mock
+
+import pytest
+
+from postcode_validator_uk.constants import UK_POSTCODE_RULES_LIST
+from postcode_validator_uk.engine import compile_rules
+from postcode_validator_uk.exceptions import InvalidPostcode
+from postcode_validator_uk.instrumentation import Instrumentation
+
+from .factories import RuleFactory
+
+RAW_POSTCODES = [
+    "EC1A 1BB",
+    "ec1a1bb",
+    "QA1 1AA",
+    "AB1 1AA",
+    "EC1A 1BC",
+    "SS10 1AA",
+    "B338-TH5",
+    "",
+    "M1 1AE",
+]
+
+
+@pytest.fixture
+def instrumentation(uk_postcode_validator_with_rules):
+    instrumentation = Instrumentation()
+    with mock.patch.object(uk_postcode_validator_with_rules, "instrumentation", instrumentation):
+        yield instrumentation
+
+
+def test_instrumented_check_matches_check(uk_postcode_validator_with_rules):
+    engine = compile_rules(UK_POSTCODE_RULES_LIST)
+
+    for raw_postcode in RAW_POSTCODES:
+        outcome = uk_postcode_validator_with_rules._check(raw_postcode, engine)
+        assert Instrumentation().check(uk_postcode_validator_with_rules, raw_postcode, engine) == outcome
+
+
+def test_instrumentation_snapshot(instrumentation, uk_postcode_validator_with_rules):
+    list(uk_postcode_validator_with_rules.validate_many(RAW_POSTCODES))
+
+    snapshot = instrumentation.snapshot()
+
+    assert snapshot["total"]["calls"] == snapshot["normalisation"]["calls"] == len(RAW_POSTCODES)
+    assert snapshot["format"]["calls"] == len(RAW_POSTCODES)
+    assert snapshot["rule:CentralLondonDistrict"]["calls"] == len(RAW_POSTCODES) - 2
+    assert snapshot["rule:ZeroOrTenDistrict"]["calls"] == 4
+    assert all(stage["ns"] >= 0 for stage in snapshot.values())
+    assert snapshot["total"]["ns"] >= snapshot["format"]["ns"]
+
+
+def test_instrumentation_snapshot_is_a_copy(instrumentation, uk_postcode_validator_with_rules):
+    uk_postcode_validator_with_rules("EC1A 1BB").validate()
+    snapshot = instrumentation.snapshot()
+
+    uk_postcode_validator_with_rules("EC1A 1BB").validate()
+
+    assert snapshot["total"]["calls"] == 1
+    assert instrumentation.snapshot()["total"]["calls"] == 2
+
+
+def test_instrumentation_reset(instrumentation, uk_postcode_validator_with_rules):
+    uk_postcode_validator_with_rules("EC1A 1BB").validate()
+
+    instrumentation.reset()
+
+    assert instrumentation.snapshot() == {}
+
+
+def test_instrumentation_with_legacy_rules(uk_postcode_validator):
+    RuleFactory.validate = mock.Mock(side_effect=InvalidPostcode)
+    uk_postcode_validator._rules_list = (RuleFactory,)
+    instrumentation = Instrumentation()
+
+    with mock.patch.object(uk_postcode_validator, "instrumentation", instrumentation):
+        assert uk_postcode_validator("EC1A 1BB").try_validate().rule == "RuleFactory"
+
+    assert instrumentation.snapshot()["rule:RuleFactory"]["calls"] == 1
+
+
+def test_validation_without_instrumentation(uk_postcode_validator_with_rules):
+    with mock.patch.object(Instrumentation, "check") as check:
+        uk_postcode_validator_with_rules("EC1A 1BB").validate()
+
+    assert not check.called
@@ -0,0 +1,75 @@
+from collections import Counter
+from unittest import mock
+
+import pytest
+
+from postcode_validator_uk.cache import ValidationCache
+from postcode_validator_uk.directory import PostcodeDirectory
+from postcode_validator_uk.instrumentation import Instrumentation
+from postcode_validator_uk.parallel import _worker_validator, validate_many_parallel
+from postcode_validator_uk.rules import FirstLetter
+
+RAW_POSTCODES = ["EC1A 1BB", "QA1 1AA", "w1a0ax", "foo", "AB1 1AA", "M1 1AE", None] * 5
+
+
+def test_validate_many_parallel_matches_validate_many(uk_postcode_validator_with_rules):
+    results = list(validate_many_parallel(RAW_POSTCODES, workers=2, chunk_size=3))
+
+    assert results == list(uk_postcode_validator_with_rules.validate_many(RAW_POSTCODES))
+
+
+def test_validate_many_parallel_consumes_generators(uk_postcode_validator_with_rules):
+    results = list(validate_many_parallel((postcode for postcode in RAW_POSTCODES), workers=1, chunk_size=4))
+
+    assert len(results) == len(RAW_POSTCODES)
+
+
+def test_validate_many_parallel_with_empty_input(uk_postcode_validator_with_rules):
+    assert list(validate_many_parallel([], workers=2)) == []
+
+
+def test_validate_many_parallel_uses_validator_rules(uk_postcode_validator):
+    uk_postcode_validator._rules_list = [FirstLetter]
+
+    results = list(validate_many_parallel(["QA1 1AA", "AB1 1AA"], workers=2, chunk_size=1))
+
+    assert results == [(None, "FirstLetter"), ("AB1 1AA", None)]
+
+
+def test_validate_many_parallel_counts_rejections(uk_postcode_validator_with_rules):
+    with mock.patch.object(uk_postcode_validator_with_rules, "rejections", Counter()) as rejections:
+        list(validate_many_parallel(RAW_POSTCODES, workers=2, chunk_size=3))
+
+    assert rejections == {"FirstLetter": 5, "InvalidFormat": 10, "DoubleDigitDistrict": 5}
+
+
+def test_worker_validator_drops_parent_class_state(uk_postcode_validator_with_rules):
+    with mock.patch.multiple(
+        uk_postcode_validator_with_rules,
+        instrumentation=Instrumentation(),
+        rejections=Counter(),
+        cache=ValidationCache(),
+    ):
+        worker_validator = _worker_validator(uk_postcode_validator_with_rules, (FirstLetter,), None)
+
+        assert worker_validator._rules_list == (FirstLetter,)
+        assert (
+            worker_validator.instrumentation is worker_validator.rejections is worker_validator.cache is None
+        )
+
+
+def test_validate_many_parallel_raises_with_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        list(validate_many_parallel(RAW_POSTCODES, chunk_size=0))
+
+
+def test_validate_many_parallel_checks_directory(tmp_path, uk_postcode_validator_with_rules):
+    path = tmp_path / "postcodes.dir"
+    PostcodeDirectory.build(["EC1A 1BB", "M1 1AE"], path)
+
+    with PostcodeDirectory(path) as directory:
+        with mock.patch.object(uk_postcode_validator_with_rules, "directory", directory):
+            results = list(validate_many_parallel(RAW_POSTCODES, workers=2, chunk_size=3))
+
+            assert results == list(uk_postcode_validator_with_rules.validate_many(RAW_POSTCODES))
+    assert results[:3] == [("EC1A 1BB", None), (None, "FirstLetter"), (None, "NotInDirectory")]
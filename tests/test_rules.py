@@ -11,11 +11,13 @@ from postcode_validator_uk.rules import (
     FirstLetter,
     FourthLetter,
     LastTwoLetter,
+    LazyRegex,
     PostcodeRule,
     SecondLetter,
     SingleDigitDistrict,
     ThirdLetter,
     ZeroOrTenDistrict,
+    raw_regex,
 )
 
 SINGLE_DIGIT_DISTRICTS_AREAS = (
@@ -285,3 +287,64 @@ class TestLastTwoLetter:
                 rule.validate()
         else:
             assert rule.validate() is None
+
+
+class TestPostcodeRuleCheck:
+    @pytest.mark.parametrize(
+        "rule_class, outward, inward, expected",
+        (
+            (FirstLetter, "QA1", "1AA", False),
+            (FirstLetter, "A1", "1AA", True),
+            (DoubleDigitDistrict, "AB1", "1AA", False),
+            (DoubleDigitDistrict, "AB10", "1AA", True),
+            (LastTwoLetter, "A1", "1AC", False),
+            (LastTwoLetter, "A1", "1AB", True),
+        ),
+    )
+    def test_check_matches_validate(self, rule_class, outward, inward, expected):
+        assert rule_class.check(outward, inward) is expected
+
+        rule = rule_class(mock.Mock(outward=outward, inward=inward))
+        if expected:
+            assert rule.validate() is None
+        else:
+            with pytest.raises(InvalidPostcode):
+                rule.validate()
+
+    def test_check_raises_attr_error_without_required_attr(self):
+        with pytest.raises(AttributeError):
+            FirstLetter.check("", "1AA")
+
+    def test_check_does_not_instantiate_rule(self):
+        with mock.patch.object(FirstLetter, "__init__") as rule_init:
+            assert FirstLetter.check("A1", "1AA") is True
+
+        assert not rule_init.called
+
+
+class TestLazyRegex:
+    def test_regex_is_compiled_on_first_access(self):
+        class LazyRule(PostcodeRule):
+            rule_regex = LazyRegex(r"^[A-Z]{2}[0-9]$")
+
+        assert isinstance(vars(LazyRule)["rule_regex"], LazyRegex)
+        assert LazyRule.rule_regex.match("AB1")
+        assert isinstance(vars(LazyRule)["rule_regex"], re.Pattern)
+
+    def test_subclasses_share_the_compiled_regex(self):
+        class LazyRule(PostcodeRule):
+            rule_regex = LazyRegex(r"^[A-Z]{2}[0-9]$")
+
+        class LazyRuleSubclass(LazyRule):
+            pass
+
+        assert LazyRuleSubclass.rule_regex is LazyRule.rule_regex
+        assert "rule_regex" not in vars(LazyRuleSubclass)
+
+    def test_raw_regex_does_not_compile(self):
+        class LazyRule(PostcodeRule):
+            rule_regex = LazyRegex(r"^[A-Z]{2}[0-9]$")
+
+        assert raw_regex(LazyRule, "rule_regex").pattern == r"^[A-Z]{2}[0-9]$"
+        assert isinstance(vars(LazyRule)["rule_regex"], LazyRegex)
+        assert raw_regex(LazyRule, "missing_regex") is None
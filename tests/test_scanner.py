@@ -0,0 +1,56 @@
+import io
+
+import pytest
+
+from postcode_validator_uk.rules import FirstLetter
+from postcode_validator_uk.scanner import PostcodeMatch, scan, scan_file
+
+TEXT = "Send to 10 Downing St, London SW1A 2AA, or ec1a1bb.\nNot QA1 1AA nor XEC1A 1BB nor M1 1AE2: m11ae"
+
+
+def test_scan(uk_postcode_validator_with_rules):
+    matches = list(scan(TEXT))
+
+    assert matches == [
+        PostcodeMatch("SW1A 2AA", 30, 38),
+        PostcodeMatch("EC1A 1BB", 43, 50),
+        PostcodeMatch("M1 1AE", 91, 96),
+    ]
+    assert [TEXT[start:end] for _, start, end in matches] == ["SW1A 2AA", "ec1a1bb", "m11ae"]
+
+
+@pytest.mark.parametrize(
+    "text, expected_postcodes",
+    (
+        ("", []),
+        ("EC1A 1BB", ["EC1A 1BB"]),
+        ("(EC1A  1BB)", ["EC1A 1BB"]),
+        ("EC1A 1BB,W1A 0AX", ["EC1A 1BB", "W1A 0AX"]),
+        ("EC1A\n1BB", []),
+        ("EC1A 1BBB", []),
+        ("1EC1A 1BB", []),
+        ("AB1 1AA", []),
+        ("ＥＣ１Ａ １ＢＢ", []),
+    ),
+)
+def test_scan_postcodes(text, expected_postcodes, uk_postcode_validator_with_rules):
+    assert [postcode for postcode, _, _ in scan(text)] == expected_postcodes
+
+
+def test_scan_is_lazy(uk_postcode_validator_with_rules):
+    matches = scan("EC1A 1BB " * 1000)
+
+    assert next(matches) == PostcodeMatch("EC1A 1BB", 0, 8)
+    assert next(matches) == PostcodeMatch("EC1A 1BB", 9, 17)
+
+
+def test_scan_uses_validator_rules(uk_postcode_validator):
+    uk_postcode_validator._rules_list = (FirstLetter,)
+
+    assert [postcode for postcode, _, _ in scan("QA1 1AA AB1 1AA", uk_postcode_validator)] == ["AB1 1AA"]
+
+
+def test_scan_file(uk_postcode_validator_with_rules):
+    matches = list(scan_file(io.StringIO(TEXT)))
+
+    assert matches == list(scan(TEXT))
@@ -0,0 +1,100 @@
+import pytest
+
+from postcode_validator_uk.exceptions import InvalidPostcode
+from postcode_validator_uk.rules import FirstLetter
+from postcode_validator_uk.sets import PostcodeSet
+from postcode_validator_uk.validators import ValidatedPostcode
+
+POSTCODES = ("W1A 0AX", "EC1A 1BD", "ec1a1bb", "EC2A 4NE", "M1 1AE", "EC1A 1BB", "EC1A 7BE")
+
+
+@pytest.fixture
+def postcode_set(uk_postcode_validator_with_rules):
+    return PostcodeSet(POSTCODES)
+
+
+def test_len_ignores_duplicates(postcode_set):
+    assert len(postcode_set) == 6
+    assert len(PostcodeSet()) == 0
+
+
+def test_iter_is_sorted(postcode_set):
+    assert [f"{postcode}" for postcode in postcode_set] == [
+        "EC1A 1BB",
+        "EC1A 1BD",
+        "EC1A 7BE",
+        "EC2A 4NE",
+        "M1 1AE",
+        "W1A 0AX",
+    ]
+
+
+@pytest.mark.parametrize(
+    "prefix, expected",
+    (
+        ("EC", True),
+        ("ec", True),
+        ("EC1A", True),
+        ("EC1A 1", True),
+        ("EC1A1", True),
+        ("EC1A 1BB", True),
+        ("ec1a1bd", True),
+        (ValidatedPostcode("M", "1", "1", "AE"), True),
+        ("", True),
+        ("E", False),
+        ("EC1", False),
+        ("EC1A 2", False),
+        ("EC1A 1BE", False),
+        ("EC1A 1B", False),
+        ("EC1A 1BBB", False),
+        ("1EC", False),
+        (None, False),
+    ),
+)
+def test_contains(prefix, expected, postcode_set):
+    assert (prefix in postcode_set) is expected
+
+
+def test_empty_set_contains_nothing(uk_postcode_validator_with_rules):
+    assert "" not in PostcodeSet()
+    assert "EC" not in PostcodeSet()
+
+
+@pytest.mark.parametrize(
+    "prefix, expected_postcodes",
+    (
+        ("EC1A", ["EC1A 1BB", "EC1A 1BD", "EC1A 7BE"]),
+        ("EC1A 1", ["EC1A 1BB", "EC1A 1BD"]),
+        ("EC1A 1BD", ["EC1A 1BD"]),
+        ("W", ["W1A 0AX"]),
+        ("SW", []),
+        ("EC1A 1BE", []),
+        ("EC1A 1B", []),
+    ),
+)
+def test_iter_prefix(prefix, expected_postcodes, postcode_set):
+    assert [f"{postcode}" for postcode in postcode_set.iter_prefix(prefix)] == expected_postcodes
+
+
+def test_add_validated_postcode(postcode_set):
+    postcode_set.add(ValidatedPostcode("SW", "1A", "2", "AA"))
+
+    assert "SW1A 2AA" in postcode_set
+    assert len(postcode_set) == 7
+
+
+def test_add_invalid_postcode(postcode_set):
+    with pytest.raises(InvalidPostcode):
+        postcode_set.add("QA1 1AA")
+
+    assert len(postcode_set) == 6
+
+
+def test_uses_validator_rules(uk_postcode_validator):
+    uk_postcode_validator._rules_list = (FirstLetter,)
+    postcode_set = PostcodeSet(("AB1 1AA",), validator_class=uk_postcode_validator)
+
+    with pytest.raises(InvalidPostcode):
+        postcode_set.add("QA1 1AA")
+
+    assert list(postcode_set) == [ValidatedPostcode("AB", "1", "1", "AA")]
@@ -0,0 +1,87 @@
+import pytest
+
+from postcode_validator_uk.constants import UK_POSTCODE_RULES_LIST
+from postcode_validator_uk.engine import RuleEngine, compile_rules
+from postcode_validator_uk.rules import FirstLetter, LastTwoLetter
+from postcode_validator_uk.tables import (
+    ValidityTables,
+    all_inwards,
+    all_outwards,
+    inward_index,
+    load_packaged_tables,
+    outward_index,
+    rules_fingerprint,
+)
+
+
+@pytest.fixture(scope="module")
+def built_tables():
+    return ValidityTables.build(RuleEngine(UK_POSTCODE_RULES_LIST))
+
+
+def test_all_outwards_and_inwards_count():
+    assert len(set(all_outwards())) == 26 * 10 * 37 + 26 * 26 * 10 * 37
+    assert len(set(all_inwards())) == 10 * 26 * 26
+
+
+def test_outward_and_inward_indexes_are_unique():
+    assert len({outward_index(outward) for outward in all_outwards()}) == 26 * 10 * 37 + 26 * 26 * 10 * 37
+    assert sorted(inward_index(inward) for inward in all_inwards()) == list(range(10 * 26 * 26))
+
+
+def test_rules_fingerprint_ignores_rules_order():
+    assert rules_fingerprint((FirstLetter, LastTwoLetter)) == rules_fingerprint((LastTwoLetter, FirstLetter))
+    assert rules_fingerprint((FirstLetter,)) != rules_fingerprint((LastTwoLetter,))
+
+
+def test_packaged_tables_are_up_to_date(built_tables):
+    packaged_tables = ValidityTables.load()
+
+    assert packaged_tables.fingerprint == built_tables.fingerprint
+    assert packaged_tables.outwards == built_tables.outwards
+    assert packaged_tables.inwards == built_tables.inwards
+
+
+def test_tables_equivalence_with_rules(built_tables):
+    engine = RuleEngine(UK_POSTCODE_RULES_LIST)
+
+    for outward in all_outwards():
+        assert built_tables.match(outward, "1AA") == bool(engine.outward_regex.match(outward))
+    for inward in all_inwards():
+        assert built_tables.match("A1", inward) == bool(engine.inward_regex.match(inward))
+
+
+def test_tables_match_with_unknown_characters(built_tables):
+    assert not built_tables.match("ec1a", "1BB")
+    assert not built_tables.match("EC1A", "1bb")
+
+
+def test_tables_save_and_load(built_tables, tmp_path):
+    path = tmp_path / "tables.bin"
+
+    built_tables.save(path)
+    loaded_tables = ValidityTables.load(path)
+
+    assert (loaded_tables.fingerprint, loaded_tables.outwards, loaded_tables.inwards) == (
+        built_tables.fingerprint,
+        built_tables.outwards,
+        built_tables.inwards,
+    )
+
+
+def test_tables_load_raises_with_other_files(tmp_path):
+    path = tmp_path / "tables.bin"
+    path.write_bytes(b"postcodes")
+
+    with pytest.raises(ValueError):
+        ValidityTables.load(path)
+
+
+def test_load_packaged_tables_for_postcode_rules():
+    assert load_packaged_tables(RuleEngine(UK_POSTCODE_RULES_LIST)) is not None
+    assert compile_rules(UK_POSTCODE_RULES_LIST).tables is not None
+
+
+def test_load_packaged_tables_for_other_rules():
+    assert load_packaged_tables(RuleEngine((FirstLetter, LastTwoLetter))) is None
+    assert load_packaged_tables(RuleEngine(())) is None
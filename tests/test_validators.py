@@ -1,11 +1,20 @@
+import os
+import subprocess
+import sys
+from collections import Counter
 from unittest import mock
 
 import pytest
 
+from postcode_validator_uk.cache import ValidationCache
+from postcode_validator_uk.constants import UK_POSTCODE_FORMAT_ERROR
 from postcode_validator_uk.exceptions import InvalidPostcode, PostcodeNotValidated
+from postcode_validator_uk.validators import UKPostcode
 
 from .factories import RuleFactory
 
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 
 def test_uk_postcode_validator_constructor(raw_uk_postcode, uk_postcode_validator_instance):
     assert uk_postcode_validator_instance.raw_postcode == raw_uk_postcode
@@ -84,6 +93,128 @@ def test_uk_postcode_validator_validate_raises_validation_exception(invalid_post
         uk_postcode_validator(invalid_postcode).validate()
 
 
+@pytest.mark.parametrize(
+    "raw_postcode, expected_result",
+    (
+        ("ec1a1bb", (True, "EC1A 1BB", None, None)),
+        ("W1A  0AX", (True, "W1A 0AX", None, None)),
+        ("QA1 1AA", (False, "QA1 1AA", "FirstLetter", None)),
+        ("EC1A 1BC", (False, "EC1A 1BC", "LastTwoLetter", None)),
+        ("EC1A A4BB", (False, None, UK_POSTCODE_FORMAT_ERROR, None)),
+        (None, (False, None, UK_POSTCODE_FORMAT_ERROR, None)),
+    ),
+)
+def test_uk_postcode_validator_try_validate_returns_results(
+    raw_postcode, expected_result, uk_postcode_validator_with_rules
+):
+    postcode_instance = uk_postcode_validator_with_rules(raw_postcode)
+
+    with mock.patch.object(InvalidPostcode, "__init__") as exception_init:
+        result = postcode_instance.try_validate()
+
+    assert result == expected_result
+    assert postcode_instance.is_valid() is expected_result[0]
+    assert not exception_init.called
+
+
+def test_uk_postcode_validator_try_validate_sets_validated_postcode(uk_postcode_validator_with_rules):
+    postcode_instance = uk_postcode_validator_with_rules("ec1a1bb")
+
+    assert postcode_instance.try_validate().postcode == postcode_instance.validated_postcode == "EC1A 1BB"
+    assert postcode_instance.components() == ("EC", "1A", "1", "BB")
+
+
+def test_uk_postcode_validator_try_validate_with_legacy_rules(uk_postcode_validator):
+    RuleFactory.validate = mock.Mock(side_effect=InvalidPostcode)
+    uk_postcode_validator._rules_list = (RuleFactory,)
+
+    assert uk_postcode_validator("EC1A 1BB").try_validate() == (False, "EC1A 1BB", "RuleFactory", None)
+
+
+class CountryRule:
+    def __init__(self, postcode):
+        self.postcode = postcode
+
+    def validate(self):
+        if self.postcode.country != "GB":
+            raise InvalidPostcode
+
+
+class CountryPostcode(UKPostcode):
+    _rules_list = (CountryRule,)
+
+    def __init__(self, postcode, country):
+        super().__init__(postcode)
+        self.country = country
+
+
+def test_uk_postcode_validator_try_validate_runs_legacy_rules_on_the_instance():
+    assert CountryPostcode("EC1A 1BB", "GB").try_validate() == (True, "EC1A 1BB", None, None)
+    assert CountryPostcode("EC1A 1BB", "FR").try_validate() == (False, "EC1A 1BB", "CountryRule", None)
+    with pytest.raises(InvalidPostcode):
+        CountryPostcode("EC1A 1BB", "FR").validate()
+
+
+def test_uk_postcode_validator_legacy_rules_outcome_is_not_cached():
+    with mock.patch.object(CountryPostcode, "cache", ValidationCache(maxsize=10)):
+        assert CountryPostcode("EC1A 1BB", "FR").try_validate().rule == "CountryRule"
+        assert CountryPostcode("EC1A 1BB", "GB").try_validate().valid
+        assert CountryPostcode.cache.stats()["size"] == 0
+
+
+@pytest.mark.parametrize(
+    "raw_postcode, expected_rule, expected_position",
+    (
+        ("ec1a a4bb", UK_POSTCODE_FORMAT_ERROR, 5),
+        ("QA1 1AA", "FirstLetter", 0),
+        ("ec1a  1bc", "LastTwoLetter", 8),
+    ),
+)
+def test_uk_postcode_validator_diagnostics(
+    raw_postcode, expected_rule, expected_position, uk_postcode_validator_with_rules
+):
+    with mock.patch.object(uk_postcode_validator_with_rules, "diagnostics", True):
+        result = uk_postcode_validator_with_rules(raw_postcode).try_validate()
+        with pytest.raises(InvalidPostcode) as exception_info:
+            uk_postcode_validator_with_rules(raw_postcode).validate()
+        with pytest.raises(InvalidPostcode) as parse_exception_info:
+            uk_postcode_validator_with_rules.parse(raw_postcode)
+
+    assert (result.rule, result.position) == (expected_rule, expected_position)
+    assert (exception_info.value.rule, exception_info.value.position) == (expected_rule, expected_position)
+    assert (parse_exception_info.value.rule, parse_exception_info.value.position) == (
+        expected_rule,
+        expected_position,
+    )
+
+
+def test_uk_postcode_validator_without_diagnostics(uk_postcode_validator_with_rules):
+    with mock.patch("postcode_validator_uk.diagnostics.error_position") as error_position:
+        with pytest.raises(InvalidPostcode) as exception_info:
+            uk_postcode_validator_with_rules("QA1 1AA").validate()
+
+    assert (exception_info.value.rule, exception_info.value.position) == ("FirstLetter", None)
+    assert not error_position.called
+
+
+def test_uk_postcode_validator_counts_rejections(uk_postcode_validator_with_rules):
+    raw_postcodes = ["EC1A 1BB", "QA1 1AA", "xx", "QA2 2BB", "AB1 1AA", "M1 1AE"]
+
+    with mock.patch.object(uk_postcode_validator_with_rules, "rejections", Counter()) as rejections:
+        list(uk_postcode_validator_with_rules.validate_many(raw_postcodes))
+        uk_postcode_validator_with_rules("EC1A 1BC").try_validate()
+        uk_postcode_validator_with_rules("M1 1AE").try_validate()
+        with pytest.raises(InvalidPostcode):
+            uk_postcode_validator_with_rules.parse("xx")
+
+    assert rejections == {
+        "FirstLetter": 2,
+        UK_POSTCODE_FORMAT_ERROR: 2,
+        "DoubleDigitDistrict": 1,
+        "LastTwoLetter": 1,
+    }
+
+
 def test_uk_postcode_validator_outward_raises_exception_when_not_validated(uk_postcode_validator):
     postcode_instance = uk_postcode_validator("EC1A 1BB")
     with pytest.raises(PostcodeNotValidated):
@@ -243,3 +374,142 @@ def test_uk_postcode_validator_validate_raises_validation_exception_from_rules(u
     with pytest.raises(InvalidPostcode):
         uk_postcode_validator(uk_postcode_validator).validate()
         assert RuleFactory.validate.called_count == 1
+
+
+def test_uk_postcode_validator_validate_many_returns_validated_postcodes(uk_postcode_validator_with_rules):
+    results = list(uk_postcode_validator_with_rules.validate_many(["ec1a1bb", "W1A  0AX", "M1 1AE"]))
+
+    assert results == [("EC1A 1BB", None), ("W1A 0AX", None), ("M1 1AE", None)]
+
+
+@pytest.mark.parametrize(
+    "raw_postcode, expected_error",
+    (
+        ("EC1A A4BB", UK_POSTCODE_FORMAT_ERROR),
+        ("", UK_POSTCODE_FORMAT_ERROR),
+        (None, UK_POSTCODE_FORMAT_ERROR),
+        ("QA1 1AA", "FirstLetter"),
+        ("AB1 1AA", "DoubleDigitDistrict"),
+        ("EC1A 1BC", "LastTwoLetter"),
+        ("EC5A 1BB", "CentralLondonDistrict"),
+    ),
+)
+def test_uk_postcode_validator_validate_many_returns_errors(
+    raw_postcode, expected_error, uk_postcode_validator_with_rules
+):
+    results = list(uk_postcode_validator_with_rules.validate_many([raw_postcode]))
+
+    assert results == [(None, expected_error)]
+
+
+def test_uk_postcode_validator_validate_many_matches_validate(uk_postcode_validator_with_rules):
+    raw_postcodes = ("EC1A 1BB", "W1A 0AX", "QA1 1AA", "AB1 1AA", "BS10 1AA", "SS10 1AA", "W1 1AE", "xx")
+
+    for raw_postcode, (validated_postcode, error) in zip(
+        raw_postcodes, uk_postcode_validator_with_rules.validate_many(raw_postcodes)
+    ):
+        postcode = uk_postcode_validator_with_rules(raw_postcode)
+        try:
+            postcode.validate()
+        except InvalidPostcode:
+            assert validated_postcode is None and error is not None
+        else:
+            assert validated_postcode == postcode.validated_postcode and error is None
+
+
+def test_uk_postcode_validator_validate_many_with_legacy_rules(uk_postcode_validator):
+    RuleFactory.validate = mock.Mock(side_effect=[None, InvalidPostcode])
+    uk_postcode_validator._rules_list = (RuleFactory,)
+
+    results = list(uk_postcode_validator.validate_many(["EC1A 1BB", "W1A 0AX"]))
+
+    assert results == [("EC1A 1BB", None), (None, "RuleFactory")]
+
+
+@pytest.mark.parametrize(
+    "raw_postcode, expected_components",
+    (
+        ("ec1a 1bb", ("EC", "1A", "1", "BB")),
+        ("W1A0AX", ("W", "1A", "0", "AX")),
+        ("M1 1AE", ("M", "1", "1", "AE")),
+        ("B33 8TH", ("B", "33", "8", "TH")),
+        ("DN55 1PT", ("DN", "55", "1", "PT")),
+    ),
+)
+def test_uk_postcode_validator_parse(raw_postcode, expected_components, uk_postcode_validator_with_rules):
+    postcode = uk_postcode_validator_with_rules.parse(raw_postcode)
+    validated_postcode = uk_postcode_validator_with_rules(raw_postcode)
+    validated_postcode.validate()
+
+    assert tuple(postcode) == expected_components
+    assert (postcode.area, postcode.district, postcode.sector, postcode.unit) == expected_components
+    assert postcode.outward == validated_postcode.outward
+    assert postcode.inward == validated_postcode.inward
+    assert postcode.postcode == f"{postcode}" == validated_postcode.validated_postcode
+
+
+@pytest.mark.parametrize("invalid_postcode", ("EC1A A4BB", "QA1 1AA", None))
+def test_uk_postcode_validator_parse_raises_validation_exception(
+    invalid_postcode, uk_postcode_validator_with_rules
+):
+    with pytest.raises(InvalidPostcode):
+        uk_postcode_validator_with_rules.parse(invalid_postcode)
+
+
+def test_validated_postcode_is_immutable_and_hashable(uk_postcode_validator_with_rules):
+    postcode = uk_postcode_validator_with_rules.parse("EC1A 1BB")
+
+    assert {postcode, uk_postcode_validator_with_rules.parse("ec1a1bb")} == {postcode}
+    with pytest.raises(AttributeError):
+        postcode.area = "W"
+    with pytest.raises(AttributeError):
+        postcode.extra = None
+
+
+def test_uk_postcode_validator_components_raises_exception_when_not_validated(uk_postcode_validator):
+    postcode_instance = uk_postcode_validator("EC1A 1BB")
+    with pytest.raises(PostcodeNotValidated):
+        postcode_instance.components()
+
+
+@pytest.mark.parametrize(
+    "raw_postcode, expected_components",
+    (
+        ("EC1A 1BB", ("EC", "1A", "1", "BB")),
+        ("W1A0AX", ("W", "1A", "0", "AX")),
+        ("M1 1AE", ("M", "1", "1", "AE")),
+    ),
+)
+def test_uk_postcode_validator_components_result(raw_postcode, expected_components, uk_postcode_validator):
+    postcode_instance = uk_postcode_validator(raw_postcode)
+    postcode_instance.validate()
+
+    assert postcode_instance.components() == expected_components
+
+
+def test_uk_postcode_validator_components_without_regex_searches(uk_postcode_validator):
+    postcode_instance = uk_postcode_validator("EC1A 1BB")
+    postcode_instance.validate()
+
+    with mock.patch("re.search") as search:
+        assert postcode_instance.area == "EC"
+        assert postcode_instance.district == "1A"
+        assert postcode_instance.sector == "1"
+        assert postcode_instance.unit == "BB"
+
+    assert not search.called
+
+
+def test_uk_postcode_validator_import_defers_regexes():
+    script = "\n".join(
+        (
+            "import sys",
+            "from postcode_validator_uk.validators import UKPostcode",
+            "assert 're' not in sys.modules",
+            "UKPostcode('EC1A 1BB').validate()",
+            "from postcode_validator_uk.rules import FirstLetter, LazyRegex",
+            "assert isinstance(vars(FirstLetter)['rule_regex'], LazyRegex)",
+        )
+    )
+
+    subprocess.run([sys.executable, "-S", "-c", script], cwd=ROOT_PATH, check=True)
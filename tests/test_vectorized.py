@@ -0,0 +1,135 @@
+import random
+import string
+
+import pytest
+
+from postcode_validator_uk.rules import FirstLetter
+from postcode_validator_uk.tables import all_outwards
+
+from .factories import RuleFactory
+
+np = pytest.importorskip("numpy")
+vectorized = pytest.importorskip("postcode_validator_uk.vectorized")
+
+RAW_POSTCODES = [
+    "EC1A 1BB",
+    "ec1a1bb",
+    "W1A  0AX",
+    "M1 1AE",
+    "B33 8TH",
+    "DN55 1PT",
+    "QA1 1AA",
+    "AB1 1AA",
+    "EC1A 1BC",
+    "",
+    "B338-TH5",
+    " EC1A 1BB",
+    "EC1A 1BB ",
+    "EC1A 1BB\n",
+    "ec1a1bb\n",
+    "EC1A 1BB\n\n",
+    "EC1A 1BB \n",
+    "EC1A\n1BB",
+    "E C1A 1BB",
+    "ıA1 1AA",
+    "ＥＣ１Ａ １ＢＢ",
+    "X" * 20,
+]
+
+
+def expected_results(validator_class, raw_postcodes):
+    validated_postcodes = [
+        validated_postcode for validated_postcode, _ in validator_class.validate_many(raw_postcodes)
+    ]
+    return (
+        [validated_postcode is not None for validated_postcode in validated_postcodes],
+        [(validated_postcode or " ").split(" ")[0] for validated_postcode in validated_postcodes],
+        [(validated_postcode or " ").split(" ")[1] for validated_postcode in validated_postcodes],
+    )
+
+
+def assert_same_as_scalar(validator_class, raw_postcodes, results):
+    mask, outward, inward = results
+    expected = expected_results(validator_class, raw_postcodes)
+    assert (mask.tolist(), outward.tolist(), inward.tolist()) == expected
+
+
+def fuzzed_postcodes(seed, count=3000):
+    randomizer = random.Random(seed)
+    alphabet = string.ascii_uppercase + string.digits + "  abz\n"
+    for _ in range(count):
+        yield "".join(randomizer.choices(alphabet, k=randomizer.randint(0, 9)))
+
+
+def test_validate_array(uk_postcode_validator_with_rules):
+    results = vectorized.validate_array(np.array(RAW_POSTCODES))
+
+    assert_same_as_scalar(uk_postcode_validator_with_rules, RAW_POSTCODES, results)
+
+
+def test_validate_array_with_lists_and_objects(uk_postcode_validator_with_rules):
+    raw_postcodes = ["EC1A 1BB", None, 123, b"W1A 0AX"]
+
+    results = vectorized.validate_array(np.array(raw_postcodes, dtype=object))
+
+    assert_same_as_scalar(uk_postcode_validator_with_rules, raw_postcodes, results)
+
+
+def test_validate_array_with_short_and_empty_arrays(uk_postcode_validator_with_rules):
+    validator_class = uk_postcode_validator_with_rules
+
+    assert_same_as_scalar(validator_class, ["", "A"], vectorized.validate_array(["", "A"]))
+    assert_same_as_scalar(validator_class, [], vectorized.validate_array(np.array([], dtype=str)))
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_validate_array_fuzzed_equivalence(seed, uk_postcode_validator_with_rules):
+    raw_postcodes = list(fuzzed_postcodes(seed))
+
+    results = vectorized.validate_array(np.array(raw_postcodes))
+
+    assert_same_as_scalar(uk_postcode_validator_with_rules, raw_postcodes, results)
+
+
+def test_validate_array_rules_equivalence(uk_postcode_validator_with_rules):
+    raw_postcodes = [f"{outward} 1AB" for outward in all_outwards()]
+
+    results = vectorized.validate_array(np.array(raw_postcodes))
+
+    assert_same_as_scalar(uk_postcode_validator_with_rules, raw_postcodes, results)
+
+
+def test_validate_array_with_custom_rules(uk_postcode_validator):
+    uk_postcode_validator._rules_list = (FirstLetter,)
+
+    results = vectorized.validate_array(np.array(["AB1 1AA", "QA1 1AC"]))
+
+    assert_same_as_scalar(uk_postcode_validator, ["AB1 1AA", "QA1 1AC"], results)
+
+
+def test_validate_array_falls_back_with_legacy_rules(uk_postcode_validator):
+    RuleFactory.validate = lambda self: None
+    uk_postcode_validator._rules_list = (RuleFactory,)
+
+    results = vectorized.validate_array(np.array(RAW_POSTCODES))
+
+    assert_same_as_scalar(uk_postcode_validator, RAW_POSTCODES, results)
+
+
+def test_validate_arrow(uk_postcode_validator_with_rules):
+    pa = pytest.importorskip("pyarrow")
+
+    mask, outward, inward = vectorized.validate_arrow(pa.array(["ec1a 1bb", None, "QA1 1AA"]))
+
+    assert mask.to_pylist() == [True, False, False]
+    assert outward.to_pylist() == ["EC1A", None, None]
+    assert inward.to_pylist() == ["1BB", None, None]
+
+
+def test_validate_arrow_with_chunked_arrays(uk_postcode_validator_with_rules):
+    pa = pytest.importorskip("pyarrow")
+
+    mask, outward, inward = vectorized.validate_arrow(pa.chunked_array([["EC1A 1BB"], ["W1A 0AX", "foo"]]))
+
+    assert mask.to_pylist() == [True, True, False]
+    assert outward.to_pylist() == ["EC1A", "W1A", None]